@@ -28,6 +28,7 @@ Album Classification objects
 
 # pylint: disable=too-few-public-methods
 
+from media.general.stringpool import pooled
 from media.xml.namespaces import Namespaces
 
 
@@ -70,9 +71,9 @@ class AlbumClassificationGenres():
         for child in in_element:
             e_name = Namespaces.ns_strip(child.tag)
             if e_name == 'primary':
-                self.primary = child.text
+                self.primary = pooled(child.text)
             if e_name == 'secondary':
-                self.secondary.append(child.text)
+                self.secondary.append(pooled(child.text))
             if e_name == 'subgenres':
                 self._process_subgenres(child)
 
@@ -80,7 +81,7 @@ class AlbumClassificationGenres():
         for child in in_element:
             e_name = Namespaces.ns_strip(child.tag)
             if e_name == 'subgenre':
-                self.subgenres.append(in_element.text)
+                self.subgenres.append(pooled(in_element.text))
 
 
 class AlbumClassificationSoundtrack():
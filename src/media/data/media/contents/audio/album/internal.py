@@ -43,15 +43,26 @@ from media.data.media.contents.audio.elements.song import Song
 from media.data.media.contents.audio.album.unique import AlbumUniqueKey
 from media.data.media.contents.audio.elements.dialogue import Dialogue
 from media.general.sorting.index import ContentIndex
+from media.xml.dispatch import ElementDispatch
 from media.xml.namespaces import Namespaces
 
 
-class Album(AbstractAVContent):
+class Album(AbstractAVContent, ElementDispatch):
     '''
     Album class
     '''
-    def __init__(self, in_element):
+    xml_handlers = {
+            'title': '_load_title',
+            'catalog': '_load_catalog',
+            'classification': '_load_classification',
+            'elements': '_load_elements'
+            }
+
+    def __init__(self, in_element, in_profile=None):
         super().__init__()
+        # Every album subtree is needed for the runtime and the
+        # unique key, so the profile is only kept for reference.
+        self.profile = in_profile
         self.title = ''
         self.catalog = None
         self.classification = None
@@ -64,18 +75,18 @@ class Album(AbstractAVContent):
         '''
         Processing of top level album elements.
         '''
-        for child in in_element:
-            tagname = Namespaces.ns_strip(child.tag)
-            if tagname == 'title':
-                self.title = Title(child.text)
-            elif tagname == 'catalog':
-                self.catalog = AlbumCatalog(child)
-            elif tagname == 'classification':
-                self.classification = AlbumClassification(child)
-            elif tagname == 'elements':
-                self._load_elements(child)
+        self._dispatch(in_element)
         self._post_load_process()
 
+    def _load_title(self, in_element):
+        self.title = Title(in_element.text)
+
+    def _load_catalog(self, in_element):
+        self.catalog = AlbumCatalog(in_element)
+
+    def _load_classification(self, in_element):
+        self.classification = AlbumClassification(in_element)
+
     def _load_elements(self, in_element):
         '''
         Load element objects and pack them in the elements array.
@@ -38,6 +38,8 @@ class AbstractElement():
     '''
     Root class of all elements
     '''
+    __slots__ = ('title', 'catalog')
+
     def __init__(self):
         self.title = ''
         self.catalog = None
@@ -41,6 +41,8 @@ class Song(AbstractElement):
     '''
     Object representation of a song.
     '''
+    __slots__ = ('classification', 'technical', 'parent_o')
+
     def __init__(self, in_element, in_parent):
         super().__init__()
         self.catalog = None
@@ -28,12 +28,15 @@ Keywords module
 
 # pylint: disable=too-few-public-methods
 # pylint: disable=consider-using-dict-items
+# pylint: disable=too-many-instance-attributes
 
 from media.data.nouns import Art, Noun, PersonalName, Place, Group, Entity
+from media.general.stringpool import pooled
+from media.xml.dispatch import ElementDispatch
 from media.xml.namespaces import Namespaces
 
 
-class Keywords():
+class Keywords(ElementDispatch):
     '''
     Main container object for a list of keyword objects
     Main container class is a hash table of arrays, which can get tricky.
@@ -52,6 +55,12 @@ class Keywords():
     keyword objects to share the same relevance value, or the
     same collection value.
     '''
+    xml_handlers = {
+            'generic': '_add_single_kw',
+            'properNoun': '_add_proper_noun',
+            'group': '_add_group'
+            }
+
     def __init__(self, in_kw_element):
         '''Initialize keyword bundle'''
         self.pools = {}
@@ -77,14 +86,7 @@ class Keywords():
         return out_p
 
     def _process(self, in_kw_element):
-        for child in in_kw_element:
-            tname = Namespaces.ns_strip(child.tag)
-            if tname == 'generic':
-                self._add_single_kw(child)
-            elif tname == 'properNoun':
-                self._add_proper_noun(child)
-            elif tname == 'group':
-                self._add_group(child)
+        self._dispatch(in_kw_element)
 
     def _add_single_kw(self, child):
         if child.text:
@@ -107,7 +109,7 @@ class Keywords():
         pool = None
         relevance = None
         if 'collection' in group_element.attrib:
-            pool = group_element.attrib['collection']
+            pool = pooled(group_element.attrib['collection'])
         if 'relevance' in group_element.attrib:
             relevance = int(group_element.attrib['relevance'])
         for child in group_element:
@@ -133,7 +135,14 @@ class Keywords():
 class AbstractKeyword():
     '''
     Parent class that both GenericKeyword and ProperNounKeyword inherit from
+
+    Keywords hash and compare on the relevance and the sort value.
+    The hash is worked out the first time it's needed and kept,
+    so neither should change once the keyword is in use.
     '''
+    __slots__ = ('value', 'sort_value', 'type', 'relevance', 'synonym',
+                 'pool', 'clarification', '_hash')
+
     def __init__(self, in_element):
         self.value = ''
         self.sort_value = ''
@@ -142,13 +151,14 @@ class AbstractKeyword():
         self.synonym = None
         self.pool = 'generic'
         self.clarification = None
+        self._hash = None
         self._process_attributes(in_element)
 
     def _process_attributes(self, in_element):
         if 'relevance' in in_element.attrib:
             self.relevance = int(in_element.attrib['relevance'])
         if 'collection' in in_element.attrib:
-            self.pool = in_element.attrib['collection']
+            self.pool = pooled(in_element.attrib['collection'])
         if 'clarification' in in_element.attrib:
             self.clarification = in_element.attrib['clarification']
         if 'synonym' in in_element.attrib:
@@ -161,7 +171,9 @@ class AbstractKeyword():
         return self.type + '/' + self.value
 
     def __hash__(self):
-        return hash(self.value)
+        if self._hash is None:
+            self._hash = hash((self.relevance, self.sort_value))
+        return self._hash
 
     def __lt__(self, other):
         '''
@@ -185,6 +197,8 @@ class AbstractKeyword():
         return self.relevance > other.relevance
 
     def __eq__(self, other):
+        if not isinstance(other, AbstractKeyword):
+            return NotImplemented
         if self.relevance == other.relevance:
             return self.sort_value == other.sort_value
         return False
@@ -201,10 +215,12 @@ class GenericKeyword(AbstractKeyword):
     clarification string, and a pool assignments.
 
     '''
+    __slots__ = ()
+
     def __init__(self, in_element):
         super().__init__(in_element)
-        self.value = in_element.text.strip()
-        self.sort_value = self.value.casefold()
+        self.value = pooled(in_element.text.strip())
+        self.sort_value = pooled(self.value.casefold())
         self.type = 'generic'
 
     def __str__(self):
@@ -218,6 +234,8 @@ class ProperNounKeyword(AbstractKeyword):
     be accounted for, alongside the attributes of the
     keyword properNoun element.
     '''
+    __slots__ = ('tagtype',)
+
     def __init__(self, in_element):
         super().__init__(in_element)
         self.type = 'properNoun'
@@ -31,6 +31,7 @@ Classes related to cast members and the roles they portray.
 # pylint: disable=too-many-instance-attributes
 
 import xml.etree.ElementTree as ET
+from media.xml.dispatch import ElementDispatch
 from media.xml.functions import xs_bool
 from media.xml.namespaces import Namespaces
 from media.data.nouns import PersonalName
@@ -53,31 +54,46 @@ class Cast():
                     role_count += 1
 
 
-class Role():
+class Role(ElementDispatch):
     '''
     A role contains the name of a single actor, and one or
     more portrayal objects.
     '''
+    __slots__ = ('actor', 'portrays', 'order')
+    xml_handlers = {
+            'actor': '_load_actor',
+            'self': '_load_self',
+            'narrator': '_load_narrator',
+            'background': '_load_background',
+            'additionalVoices': '_load_additional_voices',
+            'character': '_load_character'
+            }
+
     def __init__(self, in_element, in_count):
         self.actor = None
         self.portrays = []
         self.order = in_count
         if in_element is not None:
-            for child in in_element:
-                tagname = Namespaces.ns_strip(child.tag)
-                if tagname == 'actor':
-                    self.actor = Actor(child)
-                elif tagname == 'self':
-                    self.portrays.append(PortraysSelf())
-                elif tagname == 'narrator':
-                    self.portrays.append(PortraysNarrator())
-                elif tagname == 'background':
-                    self.portrays.append(PortraysBackground())
-                elif tagname == 'additionalVoices':
-                    self.portrays.append(PortraysAdditionalVoices())
-                elif tagname == 'character':
-                    chr_obj = Role.character_dispatcher(child, self.actor)
-                    self.portrays.append(chr_obj)
+            self._dispatch(in_element)
+
+    def _load_actor(self, in_element):
+        self.actor = Actor(in_element)
+
+    def _load_self(self, _):
+        self.portrays.append(PortraysSelf())
+
+    def _load_narrator(self, _):
+        self.portrays.append(PortraysNarrator())
+
+    def _load_background(self, _):
+        self.portrays.append(PortraysBackground())
+
+    def _load_additional_voices(self, _):
+        self.portrays.append(PortraysAdditionalVoices())
+
+    def _load_character(self, in_element):
+        chr_obj = Role.character_dispatcher(in_element, self.actor)
+        self.portrays.append(chr_obj)
 
     @classmethod
     def character_dispatcher(cls, in_element, in_actor):
@@ -98,18 +114,46 @@ class Role():
         return f"Role object for actor: {str(self.actor)}"
 
 
-class AbstractActor(PersonalName):
+class AbstractActor():
     '''
-    Abstract root class for an actor.
+    Abstract root class for an actor credit.
+
+    The name of the actor is the PersonalName object in
+    person, which is shared by every credit for the same
+    person during a load.  Name attributes are read through
+    from the person, and credits compare like the names do.
     '''
+    __slots__ = ('person',)
+
+    def __getattr__(self, name):
+        if name == 'person':
+            raise AttributeError(name)
+        return getattr(self.person, name)
+
+    def __str__(self):
+        return str(self.person)
+
+    def __hash__(self):
+        return hash(self.person)
+
+    def __lt__(self, other):
+        return self.person < getattr(other, 'person', other)
+
+    def __gt__(self, other):
+        return getattr(other, 'person', other) < self.person
+
+    def __eq__(self, other):
+        return self.person == getattr(other, 'person', other)
 
 
 class Actor(AbstractActor):
     '''
     Actor class.
     '''
+    __slots__ = ('archival_footage',)
+
     def __init__(self, in_element):
-        super().__init__(in_element)
+        self.person = PersonalName.canonical(in_element)
         self.archival_footage = False
         if 'archivalFootage' in in_element.attrib:
             if xs_bool(in_element.attrib['archivalFootage']):
@@ -121,6 +165,8 @@ class AbstractPortrays():
     Abstract root class for all portrays objects.
 
     '''
+    __slots__ = ('value', 'formal', 'sort_value')
+
     def __init__(self):
         self.value = ''
         self.formal = ''
@@ -131,11 +177,11 @@ class AbstractPortrays():
 
     def __hash__(self):
         '''
-        Hash values are only guaraunteed to be unique
-        against other values against the same actor within
-        the same role structure.
+        Portrayals hash and compare on the sort value, so
+        hash values are only unique against other values
+        for the same actor within the same role structure.
         '''
-        return hash(self.formal)
+        return hash(self.sort_value)
 
     def __lt__(self, other):
         return self.sort_value < other.sort_value
@@ -144,6 +190,8 @@ class AbstractPortrays():
         return self.sort_value > other.sort_value
 
     def __eq__(self, other):
+        if not isinstance(other, AbstractPortrays):
+            return NotImplemented
         return self.sort_value == other.sort_value
 
 
@@ -151,6 +199,8 @@ class PortraysNarrator(AbstractPortrays):
     '''
     Class designating the special role Narrator
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.value = 'Narrator'
@@ -168,6 +218,8 @@ class PortraysSelf(AbstractPortrays):
     '''
     Class for an actor as themselves.
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.value = 'Self'
@@ -179,6 +231,8 @@ class PortraysBackground(AbstractPortrays):
     '''
     Class for special background character role.
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.value = 'Background'
@@ -196,6 +250,8 @@ class PortraysAdditionalVoices(AbstractPortrays):
     '''
     Class for special additionalVoices character role.
     '''
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.value = 'Additional Voices'
@@ -207,12 +263,15 @@ class AbstractPortraysCharacter(AbstractPortrays):
     '''
     Abtract root class of all Portrays objects.
     '''
+    __slots__ = ()
 
 
 class PortraysNamedCharacter(AbstractPortraysCharacter):
     '''
     A character with a partial or complete name.
     '''
+    __slots__ = ('name', 'aliases', 'variant', 'aspect')
+
     def __init__(self, in_element):
         super().__init__()
         self.name = None
@@ -250,6 +309,8 @@ class PortraysSelfCharacter(AbstractPortraysCharacter):
     '''
     Portrayal of a character version of themselves.
     '''
+    __slots__ = ('name',)
+
     def __init__(self, in_actor):
         super().__init__()
         self.name = in_actor
@@ -262,6 +323,8 @@ class PortraysUnnamedCharacter(AbstractPortraysCharacter):
     A character that exists, but doesn't have a
     complete or partial name.
     '''
+    __slots__ = ('unnamed', 'variant', 'aspect')
+
     def __init__(self, in_element):
         super().__init__()
         self.unnamed = ''
@@ -31,15 +31,25 @@ of visual art, like a movie or television show.
 # pylint: disable=R0801
 # pylint: disable=too-many-instance-attributes
 
+from media.xml.dispatch import ElementDispatch
 from media.xml.namespaces import Namespaces
 from media.data.nouns import PersonalName, noun_dispatcher
 from media.data.media.contents.genericv.crew.cast import Cast
 
 
-class Crew():
+class Crew(ElementDispatch):
     '''
     Main container element for all crew objects.
     '''
+    xml_handlers = {
+            'directors': '_load_directors',
+            'editors': '_load_editors',
+            'cinemaphotographers': '_load_cinemap',
+            'writers': '_load_writers',
+            'music': '_load_music',
+            'cast': '_load_cast'
+            }
+
     def __init__(self, in_element):
         self.directors = []
         self.editors = []
@@ -51,20 +61,37 @@ class Crew():
             self._process(in_element)
 
     def _process(self, in_element):
+        self._dispatch(in_element)
+
+    def _load_directors(self, in_element):
+        self.directors = Directors.load(in_element)
+
+    def _load_editors(self, in_element):
+        self.editors = SimpleCrew.load(in_element, 'editor')
+
+    def _load_cinemap(self, in_element):
+        self.cinemap = SimpleCrew.load(in_element, 'cinemaphotographer')
+
+    def _load_writers(self, in_element):
+        self.writers = SimpleCrew.load(in_element, 'writer')
+
+    def _load_music(self, in_element):
+        self.music = Music(in_element)
+
+    def _load_cast(self, in_element):
+        self.cast = Cast(in_element)
+
+    @classmethod
+    def find_directors(cls, in_element):
+        '''
+        Load just the directors from a crew element.  Like the
+        full load, the last directors element wins.
+        '''
+        directors = []
         for child in in_element:
-            tagname = Namespaces.ns_strip(child.tag)
-            if tagname == 'directors':
-                self.directors = Directors.load(child)
-            elif tagname == 'editors':
-                self.editors = SimpleCrew.load(child, 'editor')
-            elif tagname == 'cinemaphotographers':
-                self.cinemap = SimpleCrew.load(child, 'cinemaphotographer')
-            elif tagname == 'writers':
-                self.writers = SimpleCrew.load(child, 'writer')
-            elif tagname == 'music':
-                self.music = Music(child)
-            elif tagname == 'cast':
-                self.cast = Cast(child)
+            if Namespaces.ns_strip(child.tag) == 'directors':
+                directors = Directors.load(child)
+        return directors
 
 
 class Directors():
@@ -79,7 +106,7 @@ class Directors():
             for child in in_element:
                 tagname = Namespaces.ns_strip(child.tag)
                 if tagname == 'director':
-                    out.append(PersonalName(child))
+                    out.append(PersonalName.canonical(child))
         return out
 
 
@@ -97,7 +124,7 @@ class Writers():
             for child in in_element:
                 tagname = Namespaces.ns_strip(child.tag)
                 if tagname == 'writer':
-                    out.append(PersonalName(child))
+                    out.append(PersonalName.canonical(child))
 
 
 class SimpleCrew():
@@ -113,7 +140,7 @@ class SimpleCrew():
             for child in in_element:
                 tagname = Namespaces.ns_strip(child.tag)
                 if tagname == desired_tag:
-                    out.append(PersonalName(child))
+                    out.append(PersonalName.canonical(child))
         return out
 
     @classmethod
@@ -29,8 +29,7 @@ Code to handle technical aspects of a vidsual format media
 
 # pylint: disable=too-few-public-methods
 
-import re
-from datetime import timedelta
+from media.xml.functions import xs_duration
 from media.xml.namespaces import Namespaces
 
 
@@ -75,33 +74,8 @@ def process_iso_duration(in_string):
     '''
     Process an ISO duration value
 
-    Ex: like P01H20M37S (1 hour, 20 minutes, 37 seconds)
+    Ex: like PT01H20M37S (1 hour, 20 minutes, 37 seconds)
 
-    Regex breakdown:
-
-    PT followed by...
-       Optional: 1-2 digits and a H character
-       Optional: 1-2 digits and a M character
-       Optional: 1-2 digits, an optional decimal with more
-                 figits, and a S character
+    See media.xml.functions.xs_duration() for the details.
     '''
-    duration_regex = r"PT(?P<hours>\d{1,2}H)?(?P<minutes>\d{1,2}M)?" +\
-                     r"(?P<seconds>\d{1,2}(\.\d+)?S)?"
-    dur_match = re.match(duration_regex, in_string)
-    if dur_match is not None:
-        if dur_match.group('hours') is not None:
-            in_hours = int(dur_match.group('hours').rstrip('H'))
-        else:
-            in_hours = 0
-        if dur_match.group('minutes') is not None:
-            in_minutes = int(dur_match.group('minutes').rstrip('M'))
-        else:
-            in_minutes = 0
-        if dur_match.group('seconds') is not None:
-            in_seconds = float(dur_match.group('seconds').rstrip('S'))
-        else:
-            in_seconds = 0
-        return timedelta(hours=in_hours,
-                         minutes=in_minutes,
-                         seconds=in_seconds)
-    return None
+    return xs_duration(in_string)
@@ -28,6 +28,7 @@ Module for movie classification
 
 # pylint: disable=too-few-public-methods
 
+from media.general.stringpool import pooled
 from media.xml.namespaces import Namespaces
 
 
@@ -96,13 +97,13 @@ class Genres():
         for child in in_chunk:
             ele_name = Namespaces.ns_strip(child.tag)
             if ele_name == 'primary':
-                self.primary = child.text
+                self.primary = pooled(child.text)
             elif ele_name == 'secondary':
-                self.secondary.append(child.text)
+                self.secondary.append(pooled(child.text))
             elif ele_name == 'setting':
-                self.setting = child.text
+                self.setting = pooled(child.text)
             elif ele_name == 'specific':
-                self.specific = child.text
+                self.specific = pooled(child.text)
             elif ele_name == 'subgenres':
                 self.subgenres = Genres._process_sg(child)
 
@@ -112,5 +113,5 @@ class Genres():
         for child in in_chunk:
             ele_name = Namespaces.ns_strip(child.tag)
             if ele_name == 'subgenre':
-                subgenres.append(child.text)
+                subgenres.append(pooled(child.text))
         return subgenres
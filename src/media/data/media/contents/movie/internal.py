@@ -29,10 +29,13 @@
 # pylint: disable=R0801
 
 from datetime import timedelta
-from media.xml.namespaces import Namespaces
+from media.xml.namespaces import Tags
 from media.data.media.contents import AbstractAVContent, ContentException
 from media.data.media.contents.generic.story import Story
 from media.data.media.contents.genericv.crew import Crew
+from media.data.media.profile import (
+        ParseProfile, Deferred, DeferredField, deferred
+        )
 from media.data.media.contents.genericv.technical import Technical
 from media.data.media.contents.genericv.variants import VariantPool, Variant
 from media.data.media.contents.movie.classification import Classification
@@ -42,11 +45,18 @@ from media.general.sorting.index import ContentIndex
 
 class Movie(AbstractAVContent):
     '''Movie object'''
-    def __init__(self, in_element):
+    crew = DeferredField()
+    story = DeferredField()
+    variants = DeferredField()
+
+    def __init__(self, in_element, in_profile=None):
         super().__init__()
+        self.profile = in_profile
         self.technical = None
         self.variants = []
         self.crew = None
+        self.story = None
+        self._key_directors = []
         self._process(in_element)
 
     def build_index_object(self):
@@ -59,20 +69,41 @@ class Movie(AbstractAVContent):
     def _process(self, in_element):
         super()._process(in_element)
         for child in in_element:
-            if child.tag == Namespaces.nsf('movie') + 'classification':
+            if child.tag == Tags.movie.classification:
                 self.classification = Classification(child)
-            elif child.tag == Namespaces.nsf('movie') + 'technical':
+            elif child.tag == Tags.movie.technical:
                 self.technical = Technical(child)
-            elif child.tag == Namespaces.nsf('movie') + 'story':
-                self.story = Story(child)
-            elif child.tag == Namespaces.nsf('movie') + 'description':
-                self.story = Story(child)
-            elif child.tag == Namespaces.nsf('movie') + 'variants':
-                self.variants = VariantPool.read_variants(child)
-            elif child.tag == Namespaces.nsf('movie') + 'crew':
-                self.crew = Crew(child)
+            elif child.tag == Tags.movie.story:
+                self.story = self._deferred(ParseProfile.STORY,
+                                            Story, child)
+            elif child.tag == Tags.movie.description:
+                self.story = self._deferred(ParseProfile.STORY,
+                                            Story, child)
+            elif child.tag == Tags.movie.variants:
+                self.variants = self._deferred(ParseProfile.VARIANTS,
+                                               VariantPool.read_variants,
+                                               child)
+            elif child.tag == Tags.movie.crew:
+                self.crew = self._deferred(ParseProfile.CREW, Crew, child)
+                if isinstance(self.__dict__['crew'], Deferred):
+                    self._key_directors = Crew.find_directors(child)
         self._post_load_process()
 
+    def _deferred(self, in_field, in_builder, in_element):
+        return deferred(self.profile, in_field, in_builder, in_element)
+
+    def key_directors(self):
+        '''
+        Return the directors used for the unique key,
+        without building the whole crew if it was deferred.
+        '''
+        crew = self.__dict__.get('crew')
+        if isinstance(crew, Deferred):
+            return self._key_directors
+        if crew:
+            return crew.directors
+        return []
+
     def _post_load_process(self):
         super()._post_load_process()
         self._set_default_runtime()
@@ -89,7 +120,13 @@ class Movie(AbstractAVContent):
             self._find_variant_runtime()
 
     def _find_variant_runtime(self):
-        for var_i in self.variants:
+        if isinstance(self.__dict__.get('variants'), Deferred):
+            # Only the runtime is needed, so build the variants
+            # without keeping them around.
+            variants = self.__dict__['variants'].build()
+        else:
+            variants = self.variants
+        for var_i in variants:
             if issubclass(var_i.__class__, Variant):
                 if var_i.technical:
                     tch = var_i.technical
@@ -112,6 +149,9 @@ class MovieIndexEntry(ContentIndex):
     '''
     A simple indexing object for movie data.
     '''
+    __slots__ = ('movie', 'year', 'decade', 'primary_g', 'first_letter',
+                 'runtime')
+
     def __init__(self, in_movie):
         super().__init__()
         self.movie = in_movie
@@ -49,11 +49,11 @@ class MovieUniqueKey(AbstractUniqueKey):
         if in_movie.catalog:
             if in_movie.catalog.copyright:
                 self.year = str(in_movie.catalog.copyright.year)
-        if in_movie.crew:
-            if in_movie.crew.directors:
-                for dl in in_movie.crew.directors:
-                    d_lst.append(dl.sort_value)
-                self.extra = '+'.join(d_lst)
+        directors = in_movie.key_directors()
+        if directors:
+            for dl in directors:
+                d_lst.append(dl.sort_value)
+            self.extra = '+'.join(d_lst)
         self.hash.low = self.crc32enc([self.title, self.year, self.extra])
         self.hash.high = self.crc32enc([self.extra, self.title, self.year])
         self.value = self.concat(self.title, self.year, self.hash)
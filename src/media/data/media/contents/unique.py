@@ -27,6 +27,7 @@ Abstract object class for the unique key.
 '''
 
 # pylint: disable=too-few-public-methods
+# pylint: disable=too-many-instance-attributes
 
 import zlib
 
@@ -36,15 +37,33 @@ class AbstractUniqueKey():
     A unique identifier string, that is designed
     to be easily readable and also suitable for
     use as a part of a filename or a URI.
+
+    Keys hash and compare on the full() string, which is
+    built once and kept until the value is set again.
     '''
     def __init__(self):
         self.c_name = None.__class__.__name__.lower()
         self.title = ''
-        self.value = ''
+        self._value = ''
+        self._full = None
+        self._hash = None
         self.extra = ''
         self.year = ''
         self.hash = KeyHash()
 
+    @property
+    def value(self):
+        '''
+        Get/set the unique string.
+        '''
+        return self._value
+
+    @value.setter
+    def value(self, in_value):
+        self._value = in_value
+        self._full = None
+        self._hash = None
+
     @staticmethod
     def crc32enc(in_list):
         '''
@@ -69,16 +88,22 @@ class AbstractUniqueKey():
         '''
         Return a fuller unique string with class information.
         '''
-        return self.c_name + '/' + self.value
+        if self._full is None:
+            self._full = self.c_name + '/' + self._value
+        return self._full
 
     def __str__(self):
         return self.value
 
     def __eq__(self, other):
+        if not isinstance(other, AbstractUniqueKey):
+            return NotImplemented
         return self.full() == other.full()
 
     def __hash__(self):
-        return hash(self.full())
+        if self._hash is None:
+            self._hash = hash(self.full())
+        return self._hash
 
 
 class KeyHash():
@@ -27,17 +27,22 @@
 # pylint: disable=too-few-public-methods
 
 from media.general.stringtools import build_sort_string
-from media.xml.namespaces import Namespaces
+from media.xml.namespaces import Tags
 import media.data.media.library
 import media.data.media.medium
 import media.data.media.contents.audio.album
 import media.data.media.contents.movie
 import media.data.media.meta.authorship as MA
+from media.data.media.profile import ParseProfile, DeferredField, deferred
 
 
 class Media():
     '''Representation of a physical thing that holds content.'''
-    def __init__(self, in_chunk):
+    library = DeferredField()
+    medium = DeferredField()
+
+    def __init__(self, in_chunk, in_profile=None):
+        self.profile = in_profile
         self.author_record = None
         self.title = None
         self.library = None
@@ -49,15 +54,19 @@ class Media():
     def _process(self, in_chunk):
         '''Read the passed elemennt and load the interpret the data'''
         for child in in_chunk:
-            if child.tag == Namespaces.nsf('authorship') + 'authorshipRecord':
+            if child.tag == Tags.authorship.authorshipRecord:
                 self.author_record = MA.AuthorshipRecord(child)
-            if child.tag == Namespaces.nsf('media') + 'title':
+            if child.tag == Tags.media.title:
                 self.title = Title(child)
-            elif child.tag == Namespaces.nsf('media') + 'library':
-                self.library = media.data.media.library.Library(child)
-            elif child.tag == Namespaces.nsf('media') + 'medium':
-                self.medium = media.data.media.medium.Medium(child)
-            elif child.tag == Namespaces.nsf('media') + 'contents':
+            elif child.tag == Tags.media.library:
+                self.library = deferred(
+                        self.profile, ParseProfile.LIBRARY,
+                        media.data.media.library.Library, child)
+            elif child.tag == Tags.media.medium:
+                self.medium = deferred(
+                        self.profile, ParseProfile.MEDIUM,
+                        media.data.media.medium.Medium, child)
+            elif child.tag == Tags.media.contents:
                 self._load_contents(child)
         if self.title is not None:
             self._build_unique_key()
@@ -68,12 +77,14 @@ class Media():
     def _load_contents(self, in_chunk):
         '''Build an array to hold the contents in the media'''
         for element in in_chunk:
-            if element.tag == Namespaces.nsf('movie') + 'movie':
+            if element.tag == Tags.movie.movie:
                 self.contents.append(
-                        media.data.media.contents.movie.Movie(element))
-            if element.tag == Namespaces.nsf('audio') + 'album':
+                        media.data.media.contents.movie.Movie(
+                            element, self.profile))
+            if element.tag == Tags.audio.album:
                 self.contents.append(
-                        media.data.media.contents.audio.album.Album(element))
+                        media.data.media.contents.audio.album.Album(
+                            element, self.profile))
 
     def __str__(self):
         return f"{self.title!s}"
@@ -90,9 +101,9 @@ class Title():
     def _load_title(self, in_element):
         '''Compose the title based on the passed elements'''
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'main':
+            if child.tag == Tags.media.main:
                 self.title = child.text
-            if child.tag == Namespaces.nsf('media') + 'edition':
+            if child.tag == Tags.media.edition:
                 self.edition = child.text
         self.sort_title = build_sort_string(self.title)
 
@@ -26,7 +26,7 @@
 
 # pylint: disable=too-few-public-methods
 
-from media.xml.namespaces import Namespaces
+from media.xml.namespaces import Namespaces, Tags
 from media.data.dates import ExactDate, RangeDate
 
 
@@ -45,11 +45,11 @@ class Instance():
 
     def _process(self, in_element):
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'localId':
+            if child.tag == Tags.media.localId:
                 self.local_id = child.text
-            elif child.tag == Namespaces.nsf('media') + 'acquisition':
+            elif child.tag == Tags.media.acquisition:
                 self.acquisition = Aquisition(child)
-            elif child.tag == Namespaces.nsf('media') + 'condition':
+            elif child.tag == Tags.media.condition:
                 self.condition = Condition(child)
 
 
@@ -66,15 +66,15 @@ class Aquisition():
 
     def _process(self, in_element):
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'date':
+            if child.tag == Tags.media.date:
                 date_element = child[0]
-                if date_element.tag == Namespaces.nsf('media') + 'exact':
+                if date_element.tag == Tags.media.exact:
                     self.date = ExactDate(date_element)
-                elif date_element.tag == Namespaces.nsf('media') + 'from':
+                elif date_element.tag == Tags.media.from_:
                     self.date = RangeDate(date_element, child[1])
-            if child.tag == Namespaces.nsf('media') + 'purchase':
+            if child.tag == Tags.media.purchase:
                 self.acq = Purchase(child)
-            elif child.tag == Namespaces.nsf('media') + 'gift':
+            elif child.tag == Tags.media.gift:
                 self.acq = Gift(child)
 
     def __str__(self):
@@ -88,7 +88,7 @@ class Gift():
     def __init__(self, in_element):
         self.g_from = ''
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'from':
+            if child.tag == Tags.media.from_:
                 self.g_from = child.text
 
     def __str__(self):
@@ -108,13 +108,13 @@ class Purchase():
 
     def _process(self, in_element):
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'retailer':
+            if child.tag == Tags.media.retailer:
                 self.retailer = child.text
-            if child.tag == Namespaces.nsf('media') + 'location':
+            if child.tag == Tags.media.location:
                 self.location = child.text
-            if child.tag == Namespaces.nsf('media') + 'price':
+            if child.tag == Tags.media.price:
                 self.price = float(child.text)
-            if child.tag == Namespaces.nsf('media') + 'quality':
+            if child.tag == Tags.media.quality:
                 self.quality = Namespaces.ns_strip(child[0].tag)
 
     def __str__(self):
@@ -138,7 +138,7 @@ class Condition():
 
     def _process(self, in_element):
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'status':
+            if child.tag == Tags.media.status:
                 self.status = Namespaces.ns_strip(child[0].tag)
-            if child.tag == Namespaces.nsf('media') + 'notes':
+            if child.tag == Tags.media.notes:
                 self.notes = child.text
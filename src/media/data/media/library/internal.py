@@ -26,7 +26,7 @@
 
 # pylint: disable=too-few-public-methods
 
-from media.xml.namespaces import Namespaces
+from media.xml.namespaces import Tags
 
 from media.data.media.library.instances import Instance
 from media.data.media.library.filing import Filing
@@ -41,12 +41,12 @@ class Library():
 
     def _process(self, in_element):
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'instances':
+            if child.tag == Tags.media.instances:
                 self._pull_instances(child)
-            if child.tag == Namespaces.nsf('media') + 'filing':
+            if child.tag == Tags.media.filing:
                 self.filing = Filing(child)
 
     def _pull_instances(self, in_element):
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'instance':
+            if child.tag == Tags.media.instance:
                 self.instances.append(Instance(child))
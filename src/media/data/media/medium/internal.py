@@ -26,7 +26,7 @@
 
 # pylint: disable=too-few-public-methods
 
-from media.xml.namespaces import Namespaces
+from media.xml.dispatch import ElementDispatch
 
 from media.data.media.medium.device import BaseDevice, MediumDeviceMap
 from media.data.media.medium.release import (
@@ -35,8 +35,15 @@ from media.data.media.medium.productid import ProductId
 from media.data.media.medium.productspecs import ProductSpecs
 
 
-class Medium():
+class Medium(ElementDispatch):
     '''Medium object - the physical thing'''
+    xml_handlers = dict.fromkeys(MediumDeviceMap.f_map, '_load_device')
+    xml_handlers.update({
+            'release': '_load_release',
+            'productId': '_load_product_id',
+            'productSpecs': '_load_product_specs'
+            })
+
     def __init__(self, in_element):
         self.release = None
         self.device = None
@@ -46,20 +53,24 @@ class Medium():
         self._process_xml_stream(in_element)
 
     def _process_xml_stream(self, in_element):
-        for child in in_element:
-            e_tag = Namespaces.ns_strip(child.tag)
-            if e_tag in MediumDeviceMap.f_map:
-                self.new_device_used = True
-                self.device = BaseDevice(child)
-            elif e_tag == 'release' and self.new_device_used is False:
-                try:
-                    self.release = Release(child)
-                except ReleaseException as rel:
-                    raise MediumException(rel.message) from rel
-            elif e_tag == 'productId':
-                self.product_id = ProductId(child)
-            elif e_tag == 'productSpecs':
-                self.product_specs = ProductSpecs(child)
+        self._dispatch(in_element)
+
+    def _load_device(self, in_element):
+        self.new_device_used = True
+        self.device = BaseDevice(in_element)
+
+    def _load_release(self, in_element):
+        if self.new_device_used is False:
+            try:
+                self.release = Release(in_element)
+            except ReleaseException as rel:
+                raise MediumException(rel.message) from rel
+
+    def _load_product_id(self, in_element):
+        self.product_id = ProductId(in_element)
+
+    def _load_product_specs(self, in_element):
+        self.product_specs = ProductSpecs(in_element)
 
 
 class MediumException(Exception):
@@ -27,7 +27,7 @@
 # pylint: disable=too-few-public-methods
 
 from media.xml.functions import xs_bool
-from media.xml.namespaces import Namespaces
+from media.xml.namespaces import Tags
 
 
 class ProductId():
@@ -40,16 +40,18 @@ class ProductId():
 
     def _process(self, in_chunk):
         for child in in_chunk:
-            if child.tag == Namespaces.nsf('media') + 'barcode':
+            if child.tag == Tags.media.barcode:
                 self.barcodes.append(Barcode(child))
-            elif child.tag == Namespaces.nsf('media') + 'sku':
+            elif child.tag == Tags.media.sku:
                 self.skus.append(SKU(child))
-            elif child.tag == Namespaces.nsf('media') + 'other':
+            elif child.tag == Tags.media.other:
                 self.others.append(OtherId(child))
 
 
 class Barcode():
     '''Representation for a barcode on a piece of physical media.'''
+    __slots__ = ('value', 'type', 'scanlines')
+
     def __init__(self, in_element):
         self.value = None
         self.type = None
@@ -92,7 +94,7 @@ class OtherId():
         self.name = None
         self.values = []
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'name':
+            if child.tag == Tags.media.name:
                 self.name = child.text.strip()
-            if child.tag == Namespaces.nsf('media') + 'value':
+            if child.tag == Tags.media.value:
                 self.values.append(child.text.strip())
@@ -26,7 +26,7 @@
 
 # pylint: disable=too-few-public-methods
 
-from media.xml.namespaces import Namespaces
+from media.xml.namespaces import Namespaces, Tags
 import media.data.media.medium.inventory as MI
 
 
@@ -39,9 +39,9 @@ class ProductSpecs():
 
     def _process(self, in_chunk):
         for child in in_chunk:
-            if child.tag == Namespaces.nsf('media') + 'inventory':
+            if child.tag == Tags.media.inventory:
                 self.inventory = Inventory(child)
-            if child.tag == Namespaces.nsf('media') + 'dimensions':
+            if child.tag == Tags.media.dimensions:
                 self.dimensions = Dimensions(child)
 
 
@@ -82,9 +82,9 @@ class Dimensions():
 
     def _process(self, in_element):
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'size':
+            if child.tag == Tags.media.size:
                 self._process_size(child)
-            elif child.tag == Namespaces.nsf('media') + 'weight':
+            elif child.tag == Tags.media.weight:
                 self._process_weight(child)
 
     def _process_size(self, in_element):
@@ -27,7 +27,8 @@
 # pylint: disable=too-few-public-methods
 # pylint: disable=R0801
 
-from media.xml.namespaces import Namespaces
+from media.general.stringpool import pooled
+from media.xml.namespaces import Namespaces, Tags
 
 
 class Release():
@@ -54,11 +55,11 @@ class Release():
         contain a single XML element.
         '''
         for child in in_element:
-            if child.tag == Namespaces.nsf('media') + 'type':
+            if child.tag == Tags.media.type:
                 if len(child) == 1:
                     self.type = Namespaces.ns_strip(child[0].tag)
-            elif child.tag == Namespaces.nsf('media') + 'publisher':
-                self.publisher = child.text
+            elif child.tag == Tags.media.publisher:
+                self.publisher = pooled(child.text)
         if self.type is None:
             raise ReleaseException('No media release type set.')
 
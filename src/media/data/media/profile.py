@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Parse profiles, to control which parts of a media file
+get turned into objects when the file is loaded.
+
+A subtree that isn't in the profile is kept as a Deferred
+object, which gets built the first time the attribute is
+used, so the results are the same either way.  Only the
+time and memory spent up front changes.
+'''
+
+# pylint: disable=too-few-public-methods
+
+import xml.etree.ElementTree as ET
+from media.general.stringpool import active_pool
+from media.xml.backend import serialize
+
+
+class ParseProfile():
+    '''
+    The set of optional subtrees to build during the load.
+
+    Titles, catalogs, classifications and technical data are
+    always built, since they are needed to index and sort
+    the content objects.
+
+    Without a profile, DEFAULT is used, which builds
+    everything, so a broken subtree fails the load and gets
+    reported as a LoadError.  With a smaller profile, errors
+    in the deferred subtrees only show up when they are used.
+    '''
+    LIBRARY = 'library'
+    MEDIUM = 'medium'
+    CREW = 'crew'
+    STORY = 'story'
+    VARIANTS = 'variants'
+    ALL = (LIBRARY, MEDIUM, CREW, STORY, VARIANTS)
+
+    def __init__(self, in_fields=None):
+        if in_fields is None:
+            in_fields = ParseProfile.ALL
+        self.fields = frozenset(in_fields)
+
+    def wants(self, in_field):
+        '''
+        Return True if the subtree should be built right away.
+        '''
+        return in_field in self.fields
+
+    def __eq__(self, other):
+        return isinstance(other, ParseProfile) and \
+            self.fields == other.fields
+
+    def __hash__(self):
+        return hash(self.fields)
+
+    def __str__(self):
+        return ','.join(sorted(self.fields))
+
+
+# Everything gets built
+ParseProfile.FULL = ParseProfile()
+
+# Physical media listings, without any content details
+ParseProfile.MEDIA_LIST = ParseProfile([ParseProfile.LIBRARY,
+                                        ParseProfile.MEDIUM])
+
+# Just enough to index and sort content objects
+ParseProfile.INDEX = ParseProfile([])
+
+# Used when no profile is given
+ParseProfile.DEFAULT = ParseProfile.FULL
+
+
+class Deferred():
+    '''
+    A subtree that hasn't been built yet, along with the
+    function that will build it.
+
+    The element is kept as serialized bytes, which take far
+    less memory than an element tree, and work with any
+    backend or pickle.  The bytes are only parsed again
+    when the object is built.
+
+    The string pool active during the load is used again
+    when the object is built, unless it was pickled.
+    '''
+    def __init__(self, in_builder, in_element):
+        self.builder = in_builder
+        self.data = serialize(in_element)
+        self.pool = active_pool()
+
+    def build(self):
+        '''
+        Build the object from the serialized element.
+        '''
+        element = ET.fromstring(self.data)
+        if self.pool is None:
+            return self.builder(element)
+        with self.pool:
+            return self.builder(element)
+
+    def __getstate__(self):
+        return {'builder': self.builder, 'data': self.data, 'pool': None}
+
+
+class DeferredField():
+    '''
+    Descriptor for an attribute that may hold a Deferred
+    object.  The object is built on first access, and
+    replaces the Deferred object in the instance.
+    '''
+    def __init__(self):
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj.__dict__.get(self.name)
+        if isinstance(value, Deferred):
+            value = value.build()
+            obj.__dict__[self.name] = value
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+def deferred(in_profile, in_field, in_builder, in_element):
+    '''
+    Build the object now if the profile wants the field,
+    otherwise return a Deferred object.
+    '''
+    if in_profile is None:
+        in_profile = ParseProfile.DEFAULT
+    if in_profile.wants(in_field):
+        return in_builder(in_element)
+    return Deferred(in_builder, in_element)
@@ -32,13 +32,21 @@ Objects for representation of proper nouns used in keywords.
 
 from media.general.stringtools import build_sort_string
 from media.general.stringtools import trans_str_ws
+from media.general.stringpool import active_pool, pooled, shared
+from media.xml.dispatch import ElementDispatch
 from media.xml.namespaces import Namespaces
 
 
 class AbstractNoun():
     '''
     Root class for all nouns
+
+    Nouns hash and compare on the sort value, so equal nouns
+    always have equal hashes.  The hash of a string is cached
+    by the string itself, so nothing more is kept here.
     '''
+    __slots__ = ('value', 'sort_value', 'tagname')
+
     def __init__(self):
         self.value = ''
         self.sort_value = ''
@@ -48,7 +56,7 @@ class AbstractNoun():
         return self.value
 
     def __hash__(self):
-        return hash(self.value)
+        return hash(self.sort_value)
 
     def __lt__(self, other):
         return self.sort_value < other.sort_value
@@ -57,7 +65,10 @@ class AbstractNoun():
         return self.sort_value > other.sort_value
 
     def __eq__(self, other):
-        return self.sort_value == other.sort_value
+        try:
+            return self.sort_value == other.sort_value
+        except AttributeError:
+            return NotImplemented
 
 
 def noun_dispatcher(in_element):
@@ -78,7 +89,7 @@ def noun_dispatcher(in_element):
     if tagname == 'unkn':
         return Noun(in_element[0])
     if tagname in ['prefix', 'pcn', 'pgn', 'gn']:
-        return PersonalName(in_element)
+        return PersonalName.canonical(in_element)
     return None
 
 
@@ -93,8 +104,8 @@ class Noun(AbstractNoun):
     def __init__(self, in_element):
         super().__init__()
         if in_element.text:
-            self.value = in_element.text
-            self.sort_value = self.value.casefold()
+            self.value = pooled(in_element.text)
+            self.sort_value = pooled(self.value.casefold())
         self.tagname = Namespaces.ns_strip(in_element.tag)
 
 
@@ -104,8 +115,8 @@ class Group(AbstractNoun):
     '''
     def __init__(self, in_group):
         super().__init__()
-        self.value = in_group.text
-        self.sort_value = build_sort_string(in_group.text)
+        self.value = pooled(in_group.text)
+        self.sort_value = pooled(build_sort_string(in_group.text))
         self.tagname = Namespaces.ns_strip(in_group.tag)
 
 
@@ -115,14 +126,14 @@ class Entity(AbstractNoun):
     '''
     def __init__(self, in_entity):
         super().__init__()
-        self.value = in_entity.text
+        self.value = pooled(in_entity.text)
         if 'acronym' in in_entity.attrib:
-            self.acronym = in_entity.attrib['acronym']
-        self.sort_value = build_sort_string(in_entity.text)
+            self.acronym = pooled(in_entity.attrib['acronym'])
+        self.sort_value = pooled(build_sort_string(in_entity.text))
         self.tagname = Namespaces.ns_strip(in_entity.tag)
 
 
-class Place(AbstractNoun):
+class Place(AbstractNoun, ElementDispatch):
     '''
     ProperNoun class for a location
 
@@ -130,6 +141,17 @@ class Place(AbstractNoun):
     of a location, which is probably going to be
     a problem.
     '''
+    xml_text = {
+            'generic': 'generic',
+            'name': 'name',
+            'ci': 'city',
+            'co': 'county',
+            'st': 'state',
+            'pr': 'state',
+            'cn': 'country',
+            'planet': 'planet'
+            }
+
     def __init__(self, in_place):
         super().__init__()
         self.generic = ''
@@ -155,42 +177,29 @@ class Place(AbstractNoun):
                 minor = self._build_minor_value(child, minor)
         if minor:
             minor = '(' + minor + ')'
-            self.value = major + ' ' + minor
+            self.value = pooled(major + ' ' + minor)
         else:
             self.value = major
-        self.sort_value = self.value.casefold()
+        self.sort_value = pooled(self.value.casefold())
 
     def _build_major_value(self, in_element):
-        tagname = Namespaces.ns_strip(in_element.tag)
-        if tagname == 'generic':
-            self.generic = in_element.text
-        if tagname == 'name':
-            self.name = in_element.text
-        elif tagname == 'ci':
-            self.city = in_element.text
-        elif tagname == 'co':
-            self.county = in_element.text
-        elif tagname in ['st', 'pr']:
-            self.state = in_element.text
-        elif tagname == 'cn':
-            self.country = in_element.text
-        elif tagname == 'planet':
-            self.planet = in_element.text
-        major = in_element.text
+        self._dispatch_one(in_element, active_pool())
+        major = pooled(in_element.text)
         return major
 
     def _build_minor_value(self, in_element, minor):
         tagname = Namespaces.ns_strip(in_element.tag)
+        text = pooled(in_element.text)
         if tagname == 'ci':
-            self.city = in_element.text
+            self.city = text
         elif tagname == 'co':
-            self.county = in_element.text
+            self.county = text
         elif tagname in ['st', 'pr']:
-            self.state = in_element.text
+            self.state = text
         elif tagname == 'cn':
-            self.country = in_element.text
+            self.country = text
         elif tagname == 'planet':
-            self.planet = in_element.text
+            self.planet = text
         if minor:
             minor += ', ' + in_element.text
         else:
@@ -198,7 +207,7 @@ class Place(AbstractNoun):
         return minor
 
 
-class PersonalName(AbstractNoun):
+class PersonalName(AbstractNoun, ElementDispatch):
     '''
     Proper noun for the name of a real person.
 
@@ -210,6 +219,19 @@ class PersonalName(AbstractNoun):
     is the standard name class for crew members
     or any other data types that use a name.
     '''
+    __slots__ = ('given', 'family', 'middle', 'mid_initial', 'suffix',
+                 'prefix', 'pref_complete', 'pref_given')
+    xml_text = {
+            'gn': 'given',
+            'fn': 'family',
+            'mn': 'middle',
+            'mi': 'mid_initial',
+            'suffix': 'suffix',
+            'prefix': 'prefix',
+            'pgn': 'pref_given',
+            'pcn': 'pref_complete'
+            }
+
     def __init__(self, in_element):
         super().__init__()
         self.sort_value = ''
@@ -227,26 +249,25 @@ class PersonalName(AbstractNoun):
             self._process(in_element)
 
     def _process(self, in_element):
-        for child in in_element:
-            tagname = Namespaces.ns_strip(child.tag)
-            if tagname == 'gn':
-                self.given = child.text
-            elif tagname == 'fn':
-                self.family = child.text
-            elif tagname == 'mn':
-                self.middle = child.text
-            elif tagname == 'mi':
-                self.mid_initial = child.text
-            elif tagname == 'suffix':
-                self.suffix = child.text
-            elif tagname == 'prefix':
-                self.prefix = child.text
-            elif tagname == 'pgn':
-                self.pref_given = child.text
-            elif tagname == 'pcn':
-                self.pref_complete = child.text
+        self._dispatch(in_element)
         self._build_value()
         self._build_sort_value()
+        self.value = pooled(self.value)
+        self.sort_value = pooled(self.sort_value)
+
+    @classmethod
+    def canonical(cls, in_element):
+        '''
+        Build a name, and return the copy of the same name
+        shared through the active pool, so a person who is
+        credited in many places is a single object.
+
+        Names are matched on both the printable value and the
+        sort value.  The tagname is the one from the first
+        element seen for that person.
+        '''
+        name = cls(in_element)
+        return shared((cls, name.sort_value, name.value), name)
 
     def _build_value(self):
         """Construct a printable name."""
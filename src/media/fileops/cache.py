@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Persistent on-disk cache of parsed media files.
+
+Every media file that gets parsed has its media objects
+written to a cache file.  On the next load, if the source
+file (and every file it included) still has the same
+modification time and size, the objects are read back from
+the cache instead of parsing the XML again.
+
+Entries are kept apart for every parse profile, so a tool
+that loads with a smaller profile never hands its partly
+built objects to a tool that wants everything.
+'''
+
+# The profile and signatures are keyword-only arguments,
+# so the long argument list of put() is fine.
+# pylint: disable=too-many-arguments
+
+import hashlib
+import os
+import os.path
+import pickle
+import media
+from media.data.media.profile import ParseProfile
+from media.fileops.scanner import file_signature, signature_or_none
+
+CACHE_FORMAT = 3
+
+
+class ParseCache():
+    '''
+    Directory of cached media objects, one cache file per
+    source file.
+
+    The default location is medialibrary under the XDG
+    cache directory, but any directory can be used, such
+    as a .vtmcache directory under the media path (which
+    the directory walker skips because of the leading dot).
+    '''
+    REPO_DIR = '.vtmcache'
+
+    def __init__(self, in_path=None):
+        self.path = in_path or ParseCache.default_path()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @classmethod
+    def default_path(cls):
+        '''
+        Return the cache path based on the XDG specification.
+        '''
+        if 'XDG_CACHE_HOME' in os.environ:
+            base = os.environ['XDG_CACHE_HOME']
+        else:
+            base = os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(base, 'medialibrary')
+
+    @classmethod
+    def for_repo(cls, in_root):
+        '''
+        Return a cache object stored inside the repository.
+        '''
+        return cls(os.path.join(in_root, cls.REPO_DIR))
+
+    @classmethod
+    def key(cls, in_filename, in_profile=None):
+        '''
+        The full key of a source file loaded with a profile.
+        '''
+        real_path = os.path.realpath(in_filename)
+        return cls._key(real_path, file_signature(real_path), in_profile)
+
+    @classmethod
+    def _key(cls, in_path, in_signature, in_profile):
+        return (in_path, in_signature, str(in_profile or ParseProfile.DEFAULT),
+                media.__version__, CACHE_FORMAT)
+
+    def entry_path(self, in_filename, in_profile=None):
+        '''
+        Location of the cache file for a source file
+        loaded with a profile.
+        '''
+        real_path = os.path.realpath(in_filename)
+        name = f"{real_path}\0{in_profile or ParseProfile.DEFAULT}"
+        digest = hashlib.sha1(name.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, digest[:2], digest + '.pickle')
+
+    def get(self, in_filename, in_profile=None):
+        '''
+        Return the cached media objects for a file, or None
+        if there is no entry, or the entry is out of date.
+        '''
+        entry = self.lookup(in_filename, in_profile)
+        if entry is not None:
+            return entry[0]
+        return None
+
+    def lookup(self, in_filename, in_profile=None):
+        '''
+        Return a tuple of the cached media objects, the list of
+        included files, the load error if the file could not be
+        loaded, and the signatures of the file and its includes.
+        Returns None if there is no valid entry.
+        '''
+        entry = self._read(self.entry_path(in_filename, in_profile))
+        if entry is not None and \
+                self._valid(entry, in_filename, in_profile):
+            self.hits += 1
+            signatures = dict(entry['includes'])
+            signatures[entry['key'][0]] = entry['key'][1]
+            return (entry['media'], [inc for (inc, _) in entry['includes']],
+                    entry['error'], signatures)
+        self.misses += 1
+        return None
+
+    def put(self, in_filename, in_media, in_includes=None, in_error=None, *,
+            in_profile=None, in_signatures=None):
+        '''
+        Store the media objects for a file, along with the
+        signatures of all the files it included.
+
+        The signatures should be the ones taken before each
+        file was read, so a file that changes during the parse
+        is parsed again next time.  Any that are missing from
+        the dictionary are taken now.
+
+        Files that failed to load are stored with their error,
+        so they don't get parsed again until they change.
+        '''
+        if in_signatures is None:
+            in_signatures = {}
+        real_path = os.path.realpath(in_filename)
+        entry = {
+                'key': ParseCache._key(real_path,
+                                       _taken(in_signatures, real_path),
+                                       in_profile),
+                'includes': [(inc, _taken(in_signatures, inc))
+                             for inc in in_includes or []],
+                'media': in_media,
+                'error': in_error
+                }
+        e_path = self.entry_path(in_filename, in_profile)
+        os.makedirs(os.path.dirname(e_path), exist_ok=True)
+        tmp_path = f"{e_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as c_out:
+                pickle.dump(entry, c_out, pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        os.replace(tmp_path, e_path)
+        self.writes += 1
+
+    def stats(self):
+        '''
+        Report cache usage.
+        '''
+        return f"Cache hits: {self.hits} -- misses: {self.misses} " + \
+               f"-- writes: {self.writes}"
+
+    @classmethod
+    def _read(cls, in_path):
+        try:
+            with open(in_path, 'rb') as c_in:
+                return pickle.load(c_in)
+        except (OSError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError):
+            return None
+
+    @classmethod
+    def _valid(cls, in_entry, in_filename, in_profile):
+        try:
+            if in_entry['key'] != ParseCache.key(in_filename, in_profile):
+                return False
+            for (inc, sig) in in_entry['includes']:
+                if signature_or_none(inc) != sig:
+                    return False
+        except OSError:
+            return False
+        return True
+
+
+def _taken(in_signatures, in_filename):
+    if in_filename in in_signatures:
+        return in_signatures[in_filename]
+    return signature_or_none(in_filename)
@@ -25,17 +25,63 @@
 '''Code relating to the loading of XML files'''
 
 # pylint: disable=too-few-public-methods
+# The load options after the mode are keyword-only, so the
+# long argument list and the attributes holding it are fine.
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-instance-attributes
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import media.xml.parser
 from media.fileops.filenames import FilenameMatches
 
 
 class Loader():
-    '''Loads a predetermined list of media data files'''
-    def __init__(self):
+    '''
+    Loads a predetermined list of media data files.
+
+    By default every file is parsed one at a time in the
+    current process.  If the workers value is greater than 1,
+    the file list is split into chunks which are parsed in
+    a pool of worker processes (PROCESS), or a pool of
+    threads (THREAD).  The media objects are merged back in
+    the same order as the file list, so the results are
+    identical either way.
+
+    If a ParseCache object is provided, only the files that
+    are new or changed since the last load get parsed.
+
+    The iter_files() generator returns the results of each
+    file as soon as it is ready, so the caller doesn't have
+    to wait for the entire library to load.  The iter_media()
+    generator goes further, and returns every media object as
+    soon as it is built.
+
+    With strict turned off, a file that fails to load is
+    recorded as a LoadError in the errors list, and the rest
+    of the files are still loaded.  The cache remembers the
+    failed files, so they are skipped until they change.
+
+    The ParseProfile object is handed to every parser, so
+    the parts of the media objects a tool doesn't need are
+    only built when they are first used.
+    '''
+    PROCESS = 1
+    THREAD = 2
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, workers=None, chunk_size=None, mode=PROCESS, *,
+                 cache=None, strict=True, profile=None):
         self.file_count = 0
         self.object_count = 0
-        self.parser = media.xml.parser.Parser()
+        self.errors = []
+        self.strict = strict
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.mode = mode
+        self.cache = cache
+        self.profile = profile
+        self.parser = media.xml.parser.Parser(profile=profile)
 
     def load_media(self, repo, pattern=None):
         '''For each file, run the parser against it, and create an
@@ -46,8 +92,185 @@ class Loader():
             files = repo.file_match(pattern)
         else:
             files = repo.file_match(FilenameMatches.All_Media)
+        for (m_list, _, _, _) in self.load_files(files):
+            m_obj.extend(m_list)
+        return m_obj
+
+    def load_files(self, files):
+        '''
+        Return a list with an entry for every file, where
+        every entry is a tuple of the media objects in that
+        file, the list of files it included, the LoadError
+        object if the file could not be loaded, and the
+        signatures of the file and its includes, taken before
+        they were read.
+        '''
+        return list(self.iter_files(files))
+
+    def iter_files(self, files):
+        '''
+        Generator version of load_files(), which returns the
+        results for every file, in order, as soon as that file
+        has been loaded.
+        '''
+        if self.workers and self.workers > 1 and len(files) > 1:
+            yield from self._iter_parallel(files)
+        else:
+            for in_file in files:
+                entry = self._lookup(in_file)
+                if entry is None:
+                    entry = self._store(in_file, load_one(
+                        self.parser, in_file, self.strict))
+                yield self._accept(entry)
+
+    def iter_media(self, files):
+        '''
+        Generator that returns the media objects of every file,
+        in order.  A serial, strict load without a cache uses
+        the streaming parser, so a file with thousands of media
+        records never has all of them in memory at once.
+        '''
+        if self.cache is not None or not self.strict or \
+                (self.workers and self.workers > 1 and len(files) > 1):
+            for (m_list, _, _, _) in self.iter_files(files):
+                yield from m_list
+            return
         for in_file in files:
             self.file_count += 1
-            m_obj.extend(self.parser.load_file(in_file))
-        self.object_count += len(m_obj)
-        return m_obj
+            for m_obj in self.parser.iter_file(in_file):
+                self.object_count += 1
+                yield m_obj
+
+    def _lookup(self, in_file):
+        self.file_count += 1
+        if self.cache is None:
+            return None
+        entry = self.cache.lookup(in_file, self.profile)
+        if entry is not None and entry[2] is not None and self.strict:
+            return None
+        return entry
+
+    def _store(self, in_file, in_result):
+        (m_list, includes, error, signatures) = in_result
+        if self.cache is not None:
+            self.cache.put(in_file, m_list, includes, error,
+                           in_profile=self.profile, in_signatures=signatures)
+        return in_result
+
+    def _accept(self, in_entry):
+        if in_entry[2] is not None:
+            self.errors.append(in_entry[2])
+        self.object_count += len(in_entry[0])
+        return in_entry
+
+    def _iter_parallel(self, files):
+        '''
+        Parse the chunks in a process or thread pool.  Only a
+        few chunks per worker are in flight at any time, and
+        the results are returned in the order the chunks were
+        submitted, regardless of which worker finishes first.
+        '''
+        chunks = Loader.split_chunks(files, self.workers, self.chunk_size)
+        if self.mode == Loader.THREAD:
+            pool_class = ThreadPoolExecutor
+        else:
+            pool_class = ProcessPoolExecutor
+        window = deque()
+        with pool_class(max_workers=self.workers) as executor:
+            for chunk in chunks:
+                window.append(self._submit_chunk(executor, chunk))
+                if len(window) > self.workers * 2:
+                    yield from self._finish_chunk(*window.popleft())
+            while window:
+                yield from self._finish_chunk(*window.popleft())
+
+    def _submit_chunk(self, executor, chunk):
+        entries = [self._lookup(in_file) for in_file in chunk]
+        misses = [in_file for (in_file, entry) in zip(chunk, entries)
+                  if entry is None]
+        future = None
+        if misses:
+            future = executor.submit(load_chunk, misses, self.strict,
+                                     self.profile)
+        return (chunk, entries, future)
+
+    def _finish_chunk(self, chunk, entries, future):
+        parsed = iter(future.result() if future else [])
+        for (in_file, entry) in zip(chunk, entries):
+            if entry is None:
+                result = next(parsed, None)
+                if result is None:
+                    raise RuntimeError(f"{in_file}: missing from the " +
+                                       "worker results")
+                entry = self._store(in_file, result)
+                self.parser.file_count += 1
+                self.parser.object_count += len(entry[0])
+            yield self._accept(entry)
+
+    @classmethod
+    def split_chunks(cls, in_files, in_workers, in_size=None):
+        '''
+        Split a list of files into smaller lists, keeping
+        the original order.  Unless a chunk size is given,
+        each worker gets a few chunks so that a slow chunk
+        doesn't hold up the entire load.
+        '''
+        if not in_size:
+            in_size = max(1, -(-len(in_files) //
+                               (in_workers * cls.CHUNKS_PER_WORKER)))
+        return [in_files[idx:idx + in_size]
+                for idx in range(0, len(in_files), in_size)]
+
+
+def load_one(in_parser, in_file, strict=True):
+    '''
+    Parse a single file, returning the media objects,
+    the list of files that were included, None, and the
+    signatures of the files, taken before they were read.
+
+    If strict is False, any exception raised while loading
+    the file is returned as a LoadError object in place of
+    the None value.
+    '''
+    try:
+        m_list = in_parser.load_file(in_file)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        if strict:
+            raise
+        return ([], in_parser.last_includes, LoadError(in_file, exc),
+                in_parser.last_signatures)
+    return (m_list, in_parser.last_includes, None,
+            in_parser.last_signatures)
+
+
+def load_chunk(in_files, strict=True, profile=None):
+    '''
+    Parse a list of files in a worker process or thread, and
+    return the results of load_one() for each one in file
+    order.  Every call gets its own parser object, so
+    no state is shared.
+    '''
+    parser = media.xml.parser.Parser(profile=profile)
+    return [load_one(parser, in_file, strict) for in_file in in_files]
+
+
+class LoadError():
+    '''
+    Details on a file that could not be loaded.
+
+    The line number is only known for XML syntax errors.
+    '''
+    def __init__(self, in_filename, in_exception):
+        self.filename = in_filename
+        self.exc_class = in_exception.__class__.__name__
+        self.message = str(in_exception)
+        self.line = None
+        position = getattr(in_exception, 'position', None)
+        if position:
+            self.line = position[0]
+
+    def __str__(self):
+        if self.line is not None:
+            return f"{self.filename}:{self.line}: " + \
+                   f"{self.exc_class}: {self.message}"
+        return f"{self.filename}: {self.exc_class}: {self.message}"
@@ -32,12 +32,78 @@ and files, which persist int he object memory.
 It contains an object that does the actual scanning work
 (which can be swapped out), and an object to do the loading
 and creation of the media objects.
+
+After the first load, rescan() can be called to pick up any
+files that were added, removed, or modified, without parsing
+the whole repository again.
 '''
 
+# pylint: disable=too-few-public-methods
+# pylint: disable=too-many-instance-attributes
+# The load options after the mode are keyword-only, so the
+# long argument lists are fine.
+# pylint: disable=too-many-arguments
+
+import os.path
 from media.data.media.contents.movie import Movie
 from media.data.media.contents.audio.album import Album
+from media.fileops.filenames import FilenameMatches
 from media.fileops.loader import Loader
-from media.fileops.scanner import Walker
+from media.fileops.scanner import Walker, signature_or_none
+
+
+class SourceFile():
+    '''
+    A media file that has been loaded, along with the
+    signatures of the file and every file it included.
+
+    The signatures are the ones the parser took before each
+    file was read, so a file that changes during the load is
+    seen as changed by the next rescan.  A missing signature
+    counts as a change.
+    '''
+    def __init__(self, in_filename, in_media, in_includes, in_error=None,
+                 in_signatures=None):
+        if in_signatures is None:
+            in_signatures = {}
+        self.filename = in_filename
+        self.signature = in_signatures.get(os.path.realpath(in_filename))
+        self.media = in_media
+        self.error = in_error
+        self.includes = {}
+        for inc in in_includes:
+            self.includes[inc] = in_signatures.get(inc)
+
+    def changed(self):
+        '''
+        Return True if the file or any of its includes has
+        changed since it was loaded.
+        '''
+        if signature_or_none(self.filename) != self.signature:
+            return True
+        for (inc, sig) in self.includes.items():
+            if signature_or_none(inc) != sig:
+                return True
+        return False
+
+
+class ChangeSet():
+    '''
+    The differences found between two scans of a repo.
+    '''
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.modified = []
+        self.media_added = []
+        self.media_removed = []
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
+    def __str__(self):
+        return f"{len(self.added)} added, {len(self.removed)} removed, " + \
+               f"{len(self.modified)} modified"
 
 
 class Repo():
@@ -51,6 +117,13 @@ class Repo():
         self.files = []
         self.media = []
         self.content = []
+        self.pattern = None
+        self.loader = None
+        self.sources = {}
+        self.content_index = {}
+        self.content_media = {}
+        self.content_types = {}
+        self.media_types = {}
 
     def set_walker(self, in_object):
         '''
@@ -77,36 +150,236 @@ class Repo():
                 out.append(fname)
         return out
 
-    def load(self, pattern=None):
+    def load(self, pattern=None, workers=None, mode=Loader.PROCESS, *,
+             cache=None, strict=True, profile=None):
         '''
         Load all media files and generate the media objects.
+
+        If workers is greater than 1, the files are parsed
+        in a pool of that many processes (or threads, if the
+        mode is Loader.THREAD).
+
+        If a ParseCache object is passed, unchanged files are
+        read from the cache instead of being parsed.
+
+        If strict is False, files that fail to load are
+        skipped, and reported in the errors list.
+
+        A ParseProfile object limits which parts of the media
+        objects are built during the load.  The rest are built
+        the first time they are used.
         '''
-        loader = Loader()
-        self.media = loader.load_media(self, pattern)
+        self.pattern = pattern or FilenameMatches.All_Media
+        self.loader = Loader(workers, mode=mode, cache=cache, strict=strict,
+                             profile=profile)
+        self.sources = self._read_sources(self.file_match(self.pattern))
+        self.media = []
+        for source in self.sources.values():
+            self.media.extend(source.media)
+        self.content = []
         self._extract_content()
 
+    @property
+    def errors(self):
+        '''
+        The LoadError objects of every file that failed to load.
+        '''
+        return [source.error for source in self.sources.values()
+                if source.error is not None]
+
+    def iter_media(self, pattern=None, workers=None, mode=Loader.PROCESS, *,
+                   cache=None, profile=None):
+        '''
+        Generator that returns media objects as each file is
+        loaded, without keeping them in the repo object.
+        '''
+        loader = Loader(workers, mode=mode, cache=cache, profile=profile)
+        files = self.file_match(pattern or FilenameMatches.All_Media)
+        yield from loader.iter_media(files)
+
+    def iter_content(self, cls=None, pattern=None, workers=None,
+                     mode=Loader.PROCESS, *, cache=None, profile=None):
+        '''
+        Generator that returns every unique content object as
+        its file is loaded, optionally limited to a content class.
+        '''
+        seen = set()
+        for m_dev in self.iter_media(pattern, workers, mode, cache=cache,
+                                     profile=profile):
+            for con_obj in m_dev.contents:
+                if cls is not None and not isinstance(con_obj, cls):
+                    continue
+                c_key = content_key(con_obj)
+                if c_key not in seen:
+                    seen.add(c_key)
+                    yield con_obj
+
+    def rescan(self):
+        '''
+        Scan the repo path again, and reload only the files that
+        were added or modified since the last scan.
+
+        The media and content lists are updated in place, and a
+        ChangeSet object describing the differences is returned.
+        '''
+        if self.loader is None:
+            self.load()
+        self.walker.rescan()
+        self.dirs = self.walker.dirs
+        self.files = self.walker.files
+        files = self.file_match(self.pattern)
+        changes = ChangeSet()
+        current = set(files)
+        for fname in self.sources:
+            if fname not in current:
+                changes.removed.append(fname)
+        for fname in files:
+            if fname not in self.sources:
+                changes.added.append(fname)
+            elif self.sources[fname].changed():
+                changes.modified.append(fname)
+        if not changes:
+            return changes
+        # Load first, so a file that fails in strict mode leaves
+        # the repo as it was before the rescan.
+        loaded = self._read_sources(changes.added + changes.modified)
+        for fname in changes.removed + changes.modified:
+            changes.media_removed.extend(self.sources.pop(fname).media)
+        self.sources.update(loaded)
+        for fname in changes.added + changes.modified:
+            changes.media_added.extend(self.sources[fname].media)
+        self.media[:] = [m_dev for fname in files
+                         for m_dev in self.sources[fname].media]
+        self._patch_content(changes.media_removed, changes.media_added)
+        return changes
+
+    def _read_sources(self, files):
+        results = self.loader.load_files(files)
+        return {fname: SourceFile(fname, *entry)
+                for (fname, entry) in zip(files, results)}
+
+    def media_for_content(self, in_content):
+        '''
+        Return every media device that contains the content
+        object, such as a movie owned on both DVD and BluRay.
+        '''
+        return list(self.content_media.get(content_key(in_content), []))
+
+    def _add_media(self, m_dev):
+        for con_obj in m_dev.contents:
+            c_key = content_key(con_obj)
+            c_class = con_obj.__class__
+            if c_key not in self.content_index:
+                self.content_index[c_key] = con_obj
+                self.content_media[c_key] = []
+                self.content_types.setdefault(c_class, {})[c_key] = con_obj
+            self.content_media[c_key].append(m_dev)
+            self.media_types.setdefault(c_class, {})[id(m_dev)] = m_dev
+
+    def _remove_media(self, m_dev):
+        '''
+        Drop the media device from the reverse index.  A content
+        object is only dropped when no other media device has it,
+        otherwise a remaining copy takes its place.
+        '''
+        for con_obj in m_dev.contents:
+            c_key = content_key(con_obj)
+            c_class = con_obj.__class__
+            _discard(self.media_types, c_class, id(m_dev))
+            if c_key not in self.content_media:
+                continue
+            owners = [other for other in self.content_media[c_key]
+                      if other is not m_dev]
+            if not owners:
+                del self.content_media[c_key]
+                del self.content_index[c_key]
+                _discard(self.content_types, c_class, c_key)
+                continue
+            self.content_media[c_key] = owners
+            if self.content_index[c_key] is con_obj:
+                for other in owners[0].contents:
+                    if content_key(other) == c_key:
+                        self.content_index[c_key] = other
+                        self.content_types[c_class][c_key] = other
+                        break
+
+    def _patch_content(self, removed_media, added_media):
+        '''
+        Drop the content objects that no longer belong to any
+        media device, and add the new ones.
+        '''
+        for m_dev in removed_media:
+            self._remove_media(m_dev)
+        for m_dev in added_media:
+            self._add_media(m_dev)
+        self.content[:] = self.content_index.values()
+
     def _extract_content(self):
+        self.content_index = {}
+        self.content_media = {}
+        self.content_types = {}
+        self.media_types = {}
         for m_dev in self.media:
-            for con_obj in m_dev.contents:
-                if con_obj not in self.content:
-                    self.content.append(con_obj)
+            self._add_media(m_dev)
+        self.content.extend(self.content_index.values())
 
-    def get_movies(self):
+    def get_content(self, in_class):
         '''
-        Extract all content objects that are the Movie class.
+        Return all content objects of a class, or any of its
+        subclasses, from the per class buckets.
         '''
         out = []
-        for con_obj in self.content:
-            if issubclass(con_obj.__class__, Movie):
-                out.append(con_obj)
+        for (c_class, bucket) in self.content_types.items():
+            if issubclass(c_class, in_class):
+                out.extend(bucket.values())
         return out
 
+    def get_media(self, in_class):
+        '''
+        Return all media objects holding at least one content
+        object of a class, or any of its subclasses.
+        '''
+        out = {}
+        for (c_class, bucket) in self.media_types.items():
+            if issubclass(c_class, in_class):
+                out.update(bucket)
+        return list(out.values())
+
+    def get_movies(self):
+        '''
+        Extract all content objects that are the Movie class.
+        '''
+        return self.get_content(Movie)
+
     def get_albums(self):
         '''
         Extract all content objects that are the Album class.
         '''
-        out = []
-        for con_obj in self.content:
-            if issubclass(con_obj.__class__, Album):
-                out.append(con_obj)
+        return self.get_content(Album)
+
+    def count_by_type(self):
+        '''
+        Return a dictionary of content class names, with the
+        number of content objects and media objects for each.
+        '''
+        out = {}
+        for (c_class, bucket) in self.content_types.items():
+            out[c_class.__name__] = (len(bucket),
+                                     len(self.media_types.get(c_class, {})))
         return out
+
+
+def content_key(in_content):
+    '''
+    The key used to find duplicate content objects, which
+    matches the rules of AbstractContent.__eq__().
+    '''
+    return (in_content.__class__, in_content.unique_key)
+
+
+def _discard(in_buckets, in_class, in_key):
+    bucket = in_buckets.get(in_class)
+    if bucket is not None:
+        bucket.pop(in_key, None)
+        if not bucket:
+            del in_buckets[in_class]
@@ -28,20 +28,33 @@ Code to scan one or more directories for media files
 
 # media.scanner
 
+# pylint: disable=too-many-instance-attributes
+
+import os
 import os.path
 import time
+from concurrent.futures import ThreadPoolExecutor
 from os import listdir
 from os.path import isdir, isfile
 
 
 class Walker():
-    '''Scans directory for media XML files'''
+    '''
+    Scans directory for media XML files
+
+    The contents of every directory are remembered along
+    with the modification time of the directory, so a
+    rescan only has to list the directories that have
+    had files added or removed.
+    '''
     IGNORE = '.vtmignore'
 
     def __init__(self, in_paths, debug=False):
+        self.roots = [in_paths[0]]
         self.dirs = []
         self.files = []
         self.skipped = []
+        self.listings = {}
         self.elapsed = None
         self.match_re = None
         self.debug = debug
@@ -51,22 +64,66 @@ class Walker():
         '''Scan the directory tree for files'''
         tstart = time.time()
         for s_dir in self.dirs:
-            file_list = listdir(s_dir)
-            if Walker.IGNORE in file_list:
-                file_list = []
-            if file_list:
-                for s_file in file_list:
-                    full_path = os.path.join(s_dir, s_file)
-                    if self.debug:
-                        print(f"{s_dir!s} {s_file!s} {full_path!s}")
-                    if isdir(full_path):
-                        if not s_file.startswith('.'):
-                            self.dirs.append(full_path)
-                    elif isfile(full_path):
-                        self.files.append(full_path)
+            (sub_dirs, file_list, skip_list) = self._cached_list_dir(s_dir)
+            self.dirs.extend(sub_dirs)
+            self.files.extend(file_list)
+            self.skipped.extend(skip_list)
         tend = time.time()
         self.elapsed = tend - tstart
 
+    def rescan(self):
+        '''
+        Scan the directory tree again, reusing the listings
+        of directories that have not been modified.
+        '''
+        self.reset()
+        self.scan()
+
+    def reset(self):
+        '''
+        Clear out the results of the last scan, but keep
+        the remembered directory listings.
+        '''
+        self.dirs = list(self.roots)
+        self.files = []
+        self.skipped = []
+
+    def _cached_list_dir(self, s_dir):
+        try:
+            mtime = os.stat(s_dir).st_mtime_ns
+        except OSError:
+            self.listings.pop(s_dir, None)
+            return ([], [], [])
+        if s_dir in self.listings:
+            (l_mtime, listing) = self.listings[s_dir]
+            if l_mtime == mtime:
+                return listing
+        listing = self._list_dir(s_dir)
+        self.listings[s_dir] = (mtime, listing)
+        return listing
+
+    def _list_dir(self, s_dir):
+        '''
+        Return the subdirectories, files, and skipped files
+        in a directory.
+        '''
+        sub_dirs = []
+        files = []
+        file_list = listdir(s_dir)
+        if Walker.IGNORE in file_list:
+            file_list = []
+        if file_list:
+            for s_file in file_list:
+                full_path = os.path.join(s_dir, s_file)
+                if self.debug:
+                    print(f"{s_dir!s} {s_file!s} {full_path!s}")
+                if isdir(full_path):
+                    if not s_file.startswith('.'):
+                        sub_dirs.append(full_path)
+                elif isfile(full_path):
+                    files.append(full_path)
+        return (sub_dirs, files, [])
+
     def stats(self):
         '''Simple statistical output'''
         return f"{len(self.dirs)} {len(self.files)} {len(self.skipped)}"
@@ -80,3 +137,97 @@ class Walker():
         out += f"    Non-Matched   : {len(self.skipped)}\n"
         out += f"Elapsed Time      : {self.elapsed:02f}\n"
         return out
+
+
+class ScanDirWalker(Walker):
+    '''
+    Walker that uses os.scandir(), so the file type of every
+    entry comes from the directory listing instead of a
+    separate stat call.
+
+    If a filename pattern is given, only matching files are
+    kept, and everything else goes into the skipped list.
+    '''
+    def __init__(self, in_paths, match_re=None, debug=False):
+        super().__init__(in_paths, debug)
+        self.match_re = match_re
+
+    def _list_dir(self, s_dir):
+        sub_dirs = []
+        files = []
+        skipped = []
+        with os.scandir(s_dir) as s_iter:
+            entries = list(s_iter)
+        if any(entry.name == Walker.IGNORE for entry in entries):
+            return (sub_dirs, files, skipped)
+        for entry in entries:
+            if self.debug:
+                print(f"{s_dir!s} {entry.name!s} {entry.path!s}")
+            if entry.is_dir():
+                if not entry.name.startswith('.'):
+                    sub_dirs.append(entry.path)
+            elif entry.is_file():
+                if self.match_re is None or \
+                   self.match_re.search(entry.path):
+                    files.append(entry.path)
+                else:
+                    skipped.append(entry.path)
+        return (sub_dirs, files, skipped)
+
+
+class ParallelWalker(ScanDirWalker):
+    '''
+    Walker that lists every directory at the same depth
+    at the same time, in a bounded pool of threads.  Useful
+    when the media library is on a network filesystem and
+    most of the time is spent waiting on metadata.
+
+    Every directory listing is sorted, and the results are
+    merged level by level in order, so the dirs and files
+    lists come out the same on every run.
+    '''
+    DEFAULT_WORKERS = 8
+
+    def __init__(self, in_paths, match_re=None, workers=None, debug=False):
+        super().__init__(in_paths, match_re, debug)
+        self.workers = workers or ParallelWalker.DEFAULT_WORKERS
+
+    def scan(self):
+        '''Scan the directory tree for files'''
+        tstart = time.time()
+        level = list(self.dirs)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while level:
+                next_level = []
+                for (sub_dirs, file_list, skip_list) in \
+                        executor.map(self._cached_list_dir, level):
+                    next_level.extend(sub_dirs)
+                    self.files.extend(file_list)
+                    self.skipped.extend(skip_list)
+                self.dirs.extend(next_level)
+                level = next_level
+        tend = time.time()
+        self.elapsed = tend - tstart
+
+    def _list_dir(self, s_dir):
+        (sub_dirs, files, skipped) = super()._list_dir(s_dir)
+        return (sorted(sub_dirs), sorted(files), sorted(skipped))
+
+
+def file_signature(in_filename):
+    '''
+    The values used to identify a specific version of a file,
+    the modification time in nanoseconds and the file size.
+    '''
+    f_stat = os.stat(in_filename)
+    return (f_stat.st_mtime_ns, f_stat.st_size)
+
+
+def signature_or_none(in_filename):
+    '''
+    The signature of a file, or None if it can't be found.
+    '''
+    try:
+        return file_signature(in_filename)
+    except OSError:
+        return None
@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Single file snapshot of a fully loaded repository.
+
+A snapshot holds every media object of a Repo, along with the
+index of unique content objects and a MovieTable of the movies,
+so reports can run without walking directories or parsing XML.
+
+File layout:
+
+  header   magic, format, media count, index and meta offsets
+  records  one pickle per media object
+  index    array of record offsets (count + 1 entries)
+  meta     pickle of the content index and the movie table
+
+The file is opened read-only with mmap, and a media record is
+only unpickled the first time it's used.
+'''
+
+# pylint: disable=unused-argument
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+import media
+from media.data.media.contents.movie import Movie
+from media.fileops.repo import Repo
+from media.general.sorting.table import MovieTable
+
+SNAPSHOT_FORMAT = 1
+
+
+class Snapshot():
+    '''
+    A snapshot file opened for reading.
+    '''
+    MAGIC = b'VTMSNAP\x00'
+    HEADER = struct.Struct('<8sIIQQ')
+
+    def __init__(self, in_path):
+        self.path = in_path
+        self.records = {}
+        with open(in_path, 'rb') as s_in:
+            try:
+                self._map = mmap.mmap(s_in.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+            except ValueError as exc:
+                raise SnapshotException(f"{in_path}: empty file") from exc
+        self.count, index_at, meta_at = self._read_header()
+        self.offsets = array('Q')
+        self.offsets.frombytes(self._map[index_at:meta_at])
+        if sys.byteorder == 'big':
+            self.offsets.byteswap()
+        self.meta = pickle.loads(self._map[meta_at:])
+        if self.meta['version'] != media.__version__:
+            self.close()
+            raise SnapshotException(f"{in_path}: written by version " +
+                                    f"{self.meta['version']}")
+
+    def _read_header(self):
+        if len(self._map) < Snapshot.HEADER.size:
+            self.close()
+            raise SnapshotException(f"{self.path}: file is too short")
+        (magic, s_format, count, index_at, meta_at) = \
+            Snapshot.HEADER.unpack_from(self._map)
+        if magic != Snapshot.MAGIC:
+            self.close()
+            raise SnapshotException(f"{self.path}: not a snapshot file")
+        if s_format != SNAPSHOT_FORMAT:
+            self.close()
+            raise SnapshotException(f"{self.path}: snapshot format " +
+                                    f"{s_format} is not supported")
+        return (count, index_at, meta_at)
+
+    @classmethod
+    def write(cls, in_repo, in_path):
+        '''
+        Write a snapshot of a loaded repo to a file.  The file
+        is written under a temporary name, which is removed if
+        anything goes wrong.
+        '''
+        tmp_path = f"{in_path}.{os.getpid()}.tmp"
+        try:
+            cls._write_records(in_repo, tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        os.replace(tmp_path, in_path)
+
+    @classmethod
+    def _write_records(cls, in_repo, in_path):
+        numbers = {id(m_dev): idx for idx, m_dev in enumerate(in_repo.media)}
+        offsets = array('Q')
+        with open(in_path, 'wb') as s_out:
+            s_out.write(cls.HEADER.pack(cls.MAGIC, SNAPSHOT_FORMAT, 0, 0, 0))
+            for m_dev in in_repo.media:
+                offsets.append(s_out.tell())
+                pickle.dump(m_dev, s_out, pickle.HIGHEST_PROTOCOL)
+            offsets.append(s_out.tell())
+            index_at = s_out.tell()
+            if sys.byteorder == 'big':
+                offsets.byteswap()
+            s_out.write(offsets.tobytes())
+            meta_at = s_out.tell()
+            pickle.dump(_build_meta(in_repo, numbers), s_out,
+                        pickle.HIGHEST_PROTOCOL)
+            s_out.seek(0)
+            s_out.write(cls.HEADER.pack(cls.MAGIC, SNAPSHOT_FORMAT,
+                                        len(in_repo.media), index_at,
+                                        meta_at))
+
+    def media_at(self, in_number):
+        '''
+        Return a media object, unpickling its record the
+        first time it's used.
+        '''
+        m_dev = self.records.get(in_number)
+        if m_dev is None:
+            start = self.offsets[in_number]
+            end = self.offsets[in_number + 1]
+            m_dev = pickle.loads(self._map[start:end])
+            self.records[in_number] = m_dev
+        return m_dev
+
+    def close(self):
+        '''
+        Release the memory map.  Media objects that were
+        already unpickled stay usable.
+        '''
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+
+class SnapshotList(Sequence):
+    '''
+    Read-only list of media objects, or of content objects
+    inside them, backed by a snapshot.
+    '''
+    def __init__(self, in_snapshot, in_media, in_positions=None):
+        self.snapshot = in_snapshot
+        self.media = in_media
+        self.positions = in_positions
+
+    def __len__(self):
+        return len(self.media)
+
+    def __getitem__(self, in_index):
+        if isinstance(in_index, slice):
+            return [self[idx] for idx in range(*in_index.indices(len(self)))]
+        m_dev = self.snapshot.media_at(self.media[in_index])
+        if self.positions is None:
+            return m_dev
+        return m_dev.contents[self.positions[in_index]]
+
+
+class SnapshotRepo(Repo):
+    '''
+    A repo read from a snapshot instead of the media files.
+
+    The lookup methods answer from the snapshot index, and
+    only the media objects that are used get unpickled.  The
+    repo is read-only, so it can't be loaded or rescanned.
+    '''
+    def __init__(self, in_snapshot):
+        super().__init__(in_snapshot.meta['root'])
+        self.snapshot = in_snapshot
+        meta = in_snapshot.meta
+        self.files = meta['files']
+        self.pattern = meta['pattern']
+        self.media = SnapshotList(in_snapshot,
+                                  array('i', range(len(in_snapshot))))
+        self.content = self._content_list(range(len(meta['content_media'])))
+
+    @classmethod
+    def open(cls, in_path):
+        '''
+        Open a snapshot file as a repo.
+        '''
+        return cls(Snapshot(in_path))
+
+    def _content_list(self, in_numbers):
+        meta = self.snapshot.meta
+        return SnapshotList(
+                self.snapshot,
+                array('i', [meta['content_media'][num] for num in in_numbers]),
+                array('i', [meta['content_pos'][num] for num in in_numbers]))
+
+    def load(self, *args, **kwargs):
+        '''
+        A snapshot can't be loaded again.
+        '''
+        raise SnapshotException(f"{self.snapshot.path}: snapshots are " +
+                                "read-only")
+
+    def rescan(self, *args, **kwargs):
+        '''
+        A snapshot can't be rescanned.
+        '''
+        raise SnapshotException(f"{self.snapshot.path}: snapshots are " +
+                                "read-only")
+
+    @property
+    def errors(self):
+        '''
+        The LoadError objects saved with the snapshot.
+        '''
+        return self.snapshot.meta['errors']
+
+    def iter_media(self, pattern=None, workers=None, mode=None, *,
+                   cache=None, profile=None):
+        '''
+        Return the media objects, unpickling them one at a time.
+        '''
+        yield from self.media
+
+    def media_for_content(self, in_content):
+        '''
+        Return every media object that contains the content.
+        '''
+        meta = self.snapshot.meta
+        c_num = meta['content_keys'].get(_snapshot_key(in_content))
+        if c_num is None:
+            return []
+        return [self.snapshot.media_at(num) for num in meta['owners'][c_num]]
+
+    def get_content(self, in_class):
+        '''
+        Return all content objects of a class, or any of its
+        subclasses.
+        '''
+        numbers = []
+        for (c_class, bucket) in self.snapshot.meta['content_types'].items():
+            if issubclass(c_class, in_class):
+                numbers.extend(bucket)
+        return self._content_list(numbers)
+
+    def get_media(self, in_class):
+        '''
+        Return all media objects holding content of a class.
+        '''
+        numbers = {}
+        for (c_class, bucket) in self.snapshot.meta['media_types'].items():
+            if issubclass(c_class, in_class):
+                numbers.update(dict.fromkeys(bucket))
+        return SnapshotList(self.snapshot, array('i', numbers))
+
+    def count_by_type(self):
+        '''
+        Return the content and media counts for each class.
+        '''
+        meta = self.snapshot.meta
+        out = {}
+        for (c_class, bucket) in meta['content_types'].items():
+            out[c_class.__name__] = (len(bucket),
+                                     len(meta['media_types'].get(c_class,
+                                                                 [])))
+        return out
+
+    def movie_table(self):
+        '''
+        Return the MovieTable saved in the snapshot.  The movie
+        objects are only unpickled when a row's movie is used.
+        '''
+        meta = self.snapshot.meta
+        table = MovieTable()
+        (table.columns, table.books) = meta['table']
+        table.movies = self.get_content(Movie)
+        return table
+
+
+class SnapshotException(Exception):
+    '''Exception raised when a snapshot can't be used.'''
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
+def _snapshot_key(in_content):
+    '''
+    The content key with the unique key as a string, so the
+    index can be read without the content objects.
+    '''
+    return (in_content.__class__, in_content.unique_key.full())
+
+
+def _locate(in_owners, in_content):
+    '''
+    Find the media object holding the content object itself,
+    and its position in the contents.
+    '''
+    for m_dev in in_owners:
+        for (pos, other) in enumerate(m_dev.contents):
+            if other is in_content:
+                return (m_dev, pos)
+    raise SnapshotException(f"{in_content.title}: content is not in " +
+                            "any media object")
+
+
+def _build_meta(in_repo, in_numbers):
+    '''
+    Build the index saved after the media records.  Content
+    objects are numbered in the order of repo.content, and
+    stored as a media record number and a position in that
+    media object's contents.
+    '''
+    meta = {
+            'version': media.__version__,
+            'root': in_repo.root_path,
+            'files': list(in_repo.files),
+            'pattern': in_repo.pattern,
+            'errors': list(in_repo.errors),
+            'content_media': array('i'),
+            'content_pos': array('i'),
+            'content_keys': {},
+            'owners': [],
+            'content_types': {},
+            'media_types': {}
+            }
+    for c_num, con_obj in enumerate(in_repo.content):
+        owners = in_repo.media_for_content(con_obj)
+        (m_dev, pos) = _locate(owners, con_obj)
+        meta['content_media'].append(in_numbers[id(m_dev)])
+        meta['content_pos'].append(pos)
+        meta['content_keys'][_snapshot_key(con_obj)] = c_num
+        meta['owners'].append(array('i', [in_numbers[id(m_dev)]
+                                          for m_dev in owners]))
+        meta['content_types'].setdefault(con_obj.__class__,
+                                         array('i')).append(c_num)
+    for (c_class, bucket) in in_repo.media_types.items():
+        meta['media_types'][c_class] = array(
+                'i', [in_numbers[m_id] for m_id in bucket])
+    table = MovieTable(in_repo.get_movies())
+    meta['table'] = (table.columns, table.books)
+    return meta
@@ -208,6 +208,8 @@ class TableDataCell():
     '''
     A single cell, containing data.
     '''
+    __slots__ = ('value', 'spec')
+
     def __init__(self, in_value, in_spec):
         self.value = in_value
         self.spec = in_spec
@@ -231,6 +231,8 @@ class MatchTrait():
     Simple data structure containing a film, the
     matching data, and the score value.
     '''
+    __slots__ = ('title', 'data', 'score')
+
     def __init__(self, in_title, in_data, in_score=1):
         self.title = in_title
         self.data = in_data
@@ -110,25 +110,11 @@ class Inspector():
         Find a media object that contains at least
         one album.
         '''
-        matches = []
-        for media in in_repo.media:
-            if len(media.contents) > 0:
-                for medcon in media.contents:
-                    if issubclass(medcon.__class__, Album):
-                        matches.append(media)
-                        break
-        return Inspector.rand_media(matches)
+        return Inspector.rand_media(in_repo.get_media(Album))
 
     def find_random_movie(self, in_repo):
         '''
         Find a media object that contains at least
         one movie.
         '''
-        matches = []
-        for media in in_repo.media:
-            if len(media.contents) > 0:
-                for medcon in media.contents:
-                    if issubclass(medcon.__class__, Movie):
-                        matches.append(media)
-                        break
-        return Inspector.rand_media(matches)
+        return Inspector.rand_media(in_repo.get_media(Movie))
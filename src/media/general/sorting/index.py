@@ -32,5 +32,7 @@ class ContentIndex():
     '''
     Abstract root class for all content index objects.
     '''
+    __slots__ = ('sort_title',)
+
     def __init__(self):
         self.sort_title = None
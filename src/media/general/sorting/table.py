@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Column-wise summary of the movies in a library.
+
+The scalar fields that the analytics tools report on are
+kept in integer arrays, one per field, so counts, sorts and
+buckets run over the columns instead of over the movie
+objects.  Genres and first letters are stored as codes into
+a CodeBook.
+
+NumPy is used for the column operations when it's installed.
+'''
+
+# pylint: disable=R0801
+
+from array import array
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class CodeBook():
+    '''
+    Dictionary encoding for a column of repeated values.
+    Every distinct value is given the next integer code.
+    '''
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, in_value):
+        '''
+        Return the code for a value, adding it if it's new.
+        '''
+        code = self.codes.get(in_value)
+        if code is None:
+            code = len(self.values)
+            self.codes[in_value] = code
+            self.values.append(in_value)
+        return code
+
+    def decode(self, in_code):
+        '''
+        Return the value for a code.
+        '''
+        return self.values[in_code]
+
+    def __len__(self):
+        return len(self.values)
+
+
+class MovieTable():
+    '''
+    Year, decade, runtime (in seconds), primary genre and
+    first letter of the sort title for a list of movies,
+    stored as one array('i') per field.
+
+    Row numbers match the position of the movie in the
+    movies list, which is only needed to show a title.
+    '''
+    C_YEAR = 'year'
+    C_DECADE = 'decade'
+    C_RUNTIME = 'runtime'
+    C_GENRE = 'genre'
+    C_LETTER = 'letter'
+    COLUMNS = [C_YEAR, C_DECADE, C_RUNTIME, C_GENRE, C_LETTER]
+    TYPECODE = 'i'
+
+    def __init__(self, in_movies=None):
+        self.movies = []
+        self.columns = {name: array(MovieTable.TYPECODE)
+                        for name in MovieTable.COLUMNS}
+        self.books = {MovieTable.C_GENRE: CodeBook(),
+                      MovieTable.C_LETTER: CodeBook()}
+        if in_movies:
+            self.extend(in_movies)
+
+    @classmethod
+    def from_repo(cls, in_repo):
+        '''
+        Build a table from the movies in a loaded repo.
+        '''
+        return cls(in_repo.get_movies())
+
+    @classmethod
+    def from_index(cls, in_entries):
+        '''
+        Build a table from a list of movie index entries,
+        like the working list of an Organizer.
+        '''
+        table = cls()
+        for entry in in_entries:
+            table.append_index(entry)
+        return table
+
+    def append(self, in_movie):
+        '''
+        Add a row for a single movie.
+        '''
+        self.append_index(in_movie.s_index)
+
+    def append_index(self, in_entry):
+        '''
+        Add a row from the index entry of a movie.
+        '''
+        self.movies.append(in_entry.movie)
+        cols = self.columns
+        cols[MovieTable.C_YEAR].append(in_entry.year)
+        cols[MovieTable.C_DECADE].append(in_entry.decade)
+        cols[MovieTable.C_RUNTIME].append(
+                int(in_entry.runtime.total_seconds()))
+        cols[MovieTable.C_GENRE].append(
+                self.books[MovieTable.C_GENRE].encode(in_entry.primary_g))
+        cols[MovieTable.C_LETTER].append(
+                self.books[MovieTable.C_LETTER].encode(
+                    in_entry.first_letter))
+
+    def extend(self, in_movies):
+        '''
+        Add a row for every movie in a list.
+        '''
+        for movie in in_movies:
+            self.append(movie)
+
+    def __len__(self):
+        return len(self.movies)
+
+    def column(self, in_name):
+        '''
+        Return the array for a column.
+        '''
+        if in_name not in self.columns:
+            raise TableException(f"Unknown column {in_name}")
+        return self.columns[in_name]
+
+    def view(self, in_name):
+        '''
+        Return a column as a NumPy array sharing the same
+        memory, or the plain array without NumPy.
+        '''
+        col = self.column(in_name)
+        if numpy is None:
+            return col
+        if len(col) == 0:
+            return numpy.zeros(0, dtype=numpy.intc)
+        return numpy.frombuffer(col, dtype=numpy.intc)
+
+    def _decode(self, in_name, in_code):
+        if in_name in self.books:
+            return self.books[in_name].decode(in_code)
+        return in_code
+
+    def counts(self, in_name):
+        '''
+        Return a dictionary of column values and the number
+        of rows that have each value.
+        '''
+        if numpy is None:
+            tally = Counter(self.column(in_name)).items()
+        else:
+            keys, totals = numpy.unique(self.view(in_name),
+                                        return_counts=True)
+            tally = zip(keys.tolist(), totals.tolist())
+        return {self._decode(in_name, key): total for key, total in tally}
+
+    def order(self, in_name, reverse=False):
+        '''
+        Return the row numbers sorted on a column.  Rows with
+        the same value keep their original order.
+        '''
+        if numpy is None:
+            col = self.column(in_name)
+            rows = sorted(range(len(col)), key=col.__getitem__,
+                          reverse=reverse)
+            return array(MovieTable.TYPECODE, rows)
+        values = self.view(in_name)
+        if reverse:
+            values = -values
+        rows = numpy.argsort(values, kind='stable').astype(numpy.intc)
+        out = array(MovieTable.TYPECODE)
+        out.frombytes(rows.tobytes())
+        return out
+
+    def group(self, in_name):
+        '''
+        Return a dictionary of column values and the row
+        numbers that have each value.
+        '''
+        groups = {}
+        for row, code in enumerate(self.column(in_name)):
+            if code in groups:
+                groups[code].append(row)
+            else:
+                groups[code] = array(MovieTable.TYPECODE, [row])
+        return {self._decode(in_name, code): rows
+                for code, rows in groups.items()}
+
+    def total(self, in_name):
+        '''
+        Return the sum of a column.
+        '''
+        if numpy is None:
+            return sum(self.column(in_name))
+        return int(self.view(in_name).sum(dtype=numpy.int64))
+
+    def mean(self, in_name):
+        '''
+        Return the average of a column, or zero if the
+        table is empty.
+        '''
+        if len(self) == 0:
+            return 0
+        return self.total(in_name) / len(self)
+
+    def span(self, in_name):
+        '''
+        Return the lowest and highest values in a column,
+        leaving out zero, which the index entries use for an
+        unknown value.  Returns None if there are no values.
+        '''
+        if numpy is None:
+            values = [val for val in self.column(in_name) if val]
+            if not values:
+                return None
+            return (min(values), max(values))
+        values = self.view(in_name)
+        values = values[values != 0]
+        if len(values) == 0:
+            return None
+        return (int(values.min()), int(values.max()))
+
+    def bucket(self, in_name, in_count):
+        '''
+        Split the rows into in_count buckets of equal width,
+        starting at the lowest value in the column.
+
+        Returns the lowest value, the width of a bucket and a
+        list with the row numbers in each bucket.
+        '''
+        col = self.column(in_name)
+        buckets = [array(MovieTable.TYPECODE) for _ in range(in_count)]
+        if len(col) == 0:
+            return (0, 1, buckets)
+        if numpy is None:
+            low = min(col)
+            width = int((max(col) - low) / in_count) + 1
+            for row, value in enumerate(col):
+                buckets[(value - low) // width].append(row)
+            return (low, width, buckets)
+        return self._bucket_numpy(in_name, in_count, buckets)
+
+    def _bucket_numpy(self, in_name, in_count, in_buckets):
+        '''
+        NumPy version of bucket(), which sorts the rows by
+        bucket number and slices the result.
+        '''
+        values = self.view(in_name)
+        low = int(values.min())
+        width = int((int(values.max()) - low) / in_count) + 1
+        slots = (values - low) // width
+        rows = numpy.argsort(slots, kind='stable').astype(numpy.intc)
+        ends = numpy.cumsum(numpy.bincount(slots, minlength=in_count))
+        start = 0
+        for slot, end in enumerate(ends.tolist()):
+            in_buckets[slot].frombytes(rows[start:end].tobytes())
+            start = end
+        return (low, width, in_buckets)
+
+
+class TableException(Exception):
+    '''Exception raised when there is an issue with a table.'''
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return self.message
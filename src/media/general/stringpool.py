@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Pool of shared strings for values that repeat across a
+library, like genres, keywords and parts of names.
+
+A pool is made active for the current thread with a with
+statement, and the data model classes pass repeated values
+through pooled() while they are built.  Outside of an active
+pool, pooled() returns the string unchanged.
+
+The pool also keeps shared data objects, like the names of
+people, under a key built by the caller with shared().
+'''
+
+import threading
+
+_ACTIVE = threading.local()
+
+
+class StringPool():
+    '''
+    Map of strings to the first copy of the same value, with
+    hit and miss counts for tuning.  Shared objects are kept
+    in a separate map.
+    '''
+    def __init__(self):
+        self.values = {}
+        self.objects = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self._saved = []
+
+    def intern(self, in_string):
+        '''
+        Return the pooled copy of a string, adding it to the
+        pool if it's a new value.
+        '''
+        value = self.values.get(in_string)
+        if value is None:
+            self.values[in_string] = in_string
+            self.misses += 1
+            return in_string
+        self.hits += 1
+        return value
+
+    def share(self, in_key, in_object):
+        '''
+        Return the object already kept under the key, or keep
+        this one if it's the first.
+        '''
+        value = self.objects.setdefault(in_key, in_object)
+        if value is not in_object:
+            self.shared_hits += 1
+        return value
+
+    def hit_ratio(self):
+        '''
+        Fraction of lookups that found an existing value.
+        '''
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def clear(self):
+        '''
+        Empty the pool, and reset the counts.
+        '''
+        self.values = {}
+        self.objects = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+
+    def stats(self):
+        '''
+        Report the pool size and hit ratio, and how many
+        objects were shared.
+        '''
+        return f"Strings: {len(self.values)}" + \
+               f" hit ratio: {self.hit_ratio():.1%}" + \
+               f" -- Shared objects: {len(self.objects)}" + \
+               f" reused: {self.shared_hits}"
+
+    def __len__(self):
+        return len(self.values)
+
+    def __enter__(self):
+        self._saved.append(getattr(_ACTIVE, 'pool', None))
+        _ACTIVE.pool = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _ACTIVE.pool = self._saved.pop()
+
+
+def active_pool():
+    '''
+    Return the pool active in this thread, or None.
+    '''
+    return getattr(_ACTIVE, 'pool', None)
+
+
+def pooled(in_string):
+    '''
+    Return the copy of a string from the active pool.
+    '''
+    pool = getattr(_ACTIVE, 'pool', None)
+    if pool is None or in_string is None:
+        return in_string
+    return pool.intern(in_string)
+
+
+def shared(in_key, in_object):
+    '''
+    Return the object kept under the key by the active pool,
+    or the object itself if no pool is active.
+    '''
+    pool = getattr(_ACTIVE, 'pool', None)
+    if pool is None:
+        return in_object
+    return pool.share(in_key, in_object)
@@ -22,15 +22,26 @@
 # SOFTWARE.
 #
 
-'''Common code related to sorting operations.'''
+'''
+Common code related to sorting operations.
+
+The same names and titles turn up again and again across a
+library, so every function here keeps a bounded LRU cache of
+its results.  cache_stats() reports how well they're doing.
+'''
 
 import string
+from functools import lru_cache
 from media.general.language import LanguageHelpers
 
 NO_PUNC = str.maketrans('', '', string.punctuation)
 NO_WSPACE = str.maketrans(string.whitespace, '______')
 
+# Number of results kept by each function's cache
+SORT_CACHE_SIZE = 8192
+
 
+@lru_cache(maxsize=SORT_CACHE_SIZE)
 def transform_string(in_value):
     '''Low level change to remove all punctuation from a string.'''
     if in_value is not None:
@@ -39,6 +50,7 @@ def transform_string(in_value):
     return "SHOULDNT BE HERE"
 
 
+@lru_cache(maxsize=SORT_CACHE_SIZE)
 def trans_str_ws(in_value):
     '''Low level change to remove all punctuation from a string.'''
     lvl1 = ''
@@ -49,12 +61,14 @@ def trans_str_ws(in_value):
     return lvl2.casefold()
 
 
+@lru_cache(maxsize=SORT_CACHE_SIZE)
 def build_filename_string(in_value):
     '''Convert all whitespace into underscores suitable for a filename'''
     level1 = transform_string(in_value)
     return level1.translate(level1.maketrans(" \t\n\r", "____"))
 
 
+@lru_cache(maxsize=SORT_CACHE_SIZE)
 def build_sort_string(in_value):
     '''Build a string suitable for sorting, accounting for language rules.'''
     level1 = transform_string(in_value)
@@ -63,3 +77,55 @@ def build_sort_string(in_value):
         article = word_split.pop(0)
         word_split.append('+'+article)
     return '_'.join(word_split)
+
+
+CACHED = [transform_string, trans_str_ws, build_filename_string,
+          build_sort_string]
+
+
+def sort_strings(in_values, in_func=build_sort_string):
+    '''
+    Run one of the string functions over a list of values,
+    returning the results in the same order.  Each distinct
+    value is only converted once.
+    '''
+    results = {}
+    out = []
+    for value in in_values:
+        try:
+            out.append(results[value])
+        except KeyError:
+            results[value] = in_func(value)
+            out.append(results[value])
+    return out
+
+
+def cache_stats():
+    '''
+    Return the hit and miss counts of all the caches combined.
+    '''
+    hits = 0
+    misses = 0
+    for func in CACHED:
+        info = func.cache_info()
+        hits += info.hits
+        misses += info.misses
+    return (hits, misses)
+
+
+def cache_report():
+    '''
+    Report the combined hit ratio of the caches.
+    '''
+    (hits, misses) = cache_stats()
+    ratio = hits / (hits + misses) if hits + misses else 0.0
+    return f"Sort keys: {hits} hits {misses} misses" + \
+           f" hit ratio: {ratio:.1%}"
+
+
+def clear_caches():
+    '''
+    Empty all the caches.
+    '''
+    for func in CACHED:
+        func.cache_clear()
@@ -26,28 +26,79 @@
 
 # pylint disable=R0801
 
+import os
 import media.fileops.scanner
 import media.fileops.loader
 import media.fileops.repo
+from media.fileops.cache import ParseCache
 from media.fileops.filenames import FilenameMatches
+from media.fileops.snapshot import SnapshotRepo
 
 # Walker module walks the filesystem
 # Loader module reads in the discovered files
 
 
-def load_media_dev(in_path):
+def load_media_dev(in_path, workers=None, cache=None, profile=None,
+                   snapshot=None):
     '''Identify suitable files and load them up'''
+    if snapshot:
+        return open_snapshot(snapshot).media
     repo = media.fileops.repo.Repo(in_path)
+    repo.set_walker(media.fileops.scanner.ScanDirWalker(
+        [in_path], FilenameMatches.All_Media))
     repo.scan()
-    repo.load(FilenameMatches.All_Media)
+    repo.load(FilenameMatches.All_Media, workers, cache=cache,
+              profile=profile)
     return repo.media
 
 
-def load_movies(in_path):
+def iter_media_dev(in_path, workers=None, cache=None, profile=None,
+                   snapshot=None):
+    '''
+    Generator version of load_media_dev(), returning the media
+    objects as the files are loaded.
+    '''
+    if snapshot:
+        yield from open_snapshot(snapshot).media
+        return
+    repo = media.fileops.repo.Repo(in_path)
+    repo.set_walker(media.fileops.scanner.ScanDirWalker(
+        [in_path], FilenameMatches.All_Media))
+    repo.scan()
+    yield from repo.iter_media(FilenameMatches.All_Media, workers,
+                               cache=cache, profile=profile)
+
+
+def load_movies(in_path, workers=None, cache=None, profile=None,
+                snapshot=None):
     '''
     Load all files that are tied to movie media devices.
     '''
+    if snapshot:
+        return open_snapshot(snapshot).get_movies()
     repo = media.fileops.repo.Repo(in_path)
+    repo.set_walker(media.fileops.scanner.ScanDirWalker(
+        [in_path], FilenameMatches.Movie_Media))
     repo.scan()
-    repo.load(FilenameMatches.Movie_Media)
+    repo.load(FilenameMatches.Movie_Media, workers, cache=cache,
+              profile=profile)
     return repo.get_movies()
+
+
+def open_snapshot(in_path):
+    '''
+    Open a snapshot file as a read-only repo, in place of
+    scanning and loading the media path.
+    '''
+    return SnapshotRepo.open(in_path)
+
+
+def parse_cache(in_enabled):
+    '''
+    Return a parse cache object if caching was requested.
+    The MEDIACACHE environment variable can override the
+    default cache directory.
+    '''
+    if not in_enabled:
+        return None
+    return ParseCache(os.environ.get('MEDIACACHE'))
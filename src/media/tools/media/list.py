@@ -31,8 +31,9 @@ List out all physical media, one per line.
 import os
 import argparse
 import media.fmt.text.media
+from media.data.media.profile import ParseProfile
 from media.general.sorting.organizer import Organizer
-from media.tools.common import load_media_dev
+from media.tools.common import iter_media_dev, parse_cache
 
 
 def list_devices(in_list):
@@ -45,6 +46,16 @@ def list_devices(in_list):
         print(movie_out)
 
 
+def stream_devices(in_devices):
+    '''
+    Print every device as soon as its file is loaded,
+    in file order.
+    '''
+    print(media.fmt.text.media.ListEntry.header())
+    for media_i in in_devices:
+        print(media.fmt.text.media.ListEntry(media_i))
+
+
 def prep_list(in_movies):
     '''
     Build the list of output entries.
@@ -59,14 +70,24 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Simple media list.')
     parser.add_argument('--mediapath', help='path of media library')
     parser.add_argument('--random', type=int, help='print X random entries')
+    parser.add_argument('--unsorted', action='store_true',
+                        help='print entries in file order as they load')
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction,
+                        help='Use the parse cache')
+    parser.add_argument('--snapshot', help='read from a snapshot file')
     args = parser.parse_args()
 
-    mediapath = args.mediapath or os.environ['MEDIAPATH']
-    if not mediapath:
+    mediapath = args.mediapath or os.environ.get('MEDIAPATH')
+    if not mediapath and not args.snapshot:
         parser.print_help()
-    devices = load_media_dev(mediapath)
+    devices = iter_media_dev(mediapath, cache=parse_cache(args.cache),
+                             profile=ParseProfile.MEDIA_LIST,
+                             snapshot=args.snapshot)
     if args.random:
-        chunks = prep_list(Organizer.get_random_sample(devices, args.random))
+        chunks = prep_list(Organizer.get_random_sample(list(devices),
+                                                       args.random))
+        list_devices(chunks)
+    elif args.unsorted:
+        stream_devices(devices)
     else:
-        chunks = prep_list(devices)
-    list_devices(chunks)
+        list_devices(prep_list(devices))
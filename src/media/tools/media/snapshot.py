@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2025 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Write a snapshot file of the whole media library, for tools
+run with the --snapshot option.
+'''
+
+# pylint: disable=R0801
+
+import os
+import argparse
+from media.data.media.profile import ParseProfile
+from media.fileops.filenames import FilenameMatches
+from media.fileops.repo import Repo
+from media.fileops.snapshot import Snapshot
+from media.tools.common import parse_cache
+
+
+def write_snapshot(in_path, in_output, workers=None, cache=None):
+    '''
+    Load every media file with every subtree built, and
+    write the repo out as a snapshot.
+    '''
+    repo = Repo(in_path)
+    repo.scan()
+    repo.load(FilenameMatches.All_Media, workers, cache=cache,
+              profile=ParseProfile.FULL)
+    Snapshot.write(repo, in_output)
+    return repo
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Media library snapshot.')
+    parser.add_argument('--mediapath', help='path of media library')
+    parser.add_argument('--output', required=True,
+                        help='path of the snapshot file')
+    parser.add_argument('--workers', type=int,
+                        help='number of parser processes')
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction,
+                        help='Use the parse cache')
+    args = parser.parse_args()
+    mediapath = args.mediapath or os.environ.get('MEDIAPATH')
+    if not mediapath:
+        parser.print_help()
+    else:
+        s_repo = write_snapshot(mediapath, args.output, args.workers,
+                                parse_cache(args.cache))
+        for (c_name, (c_count, m_count)) in s_repo.count_by_type().items():
+            print(f"{c_name:12s} : {c_count:6d} ({m_count} media)")
+        print(f"{'Errors':12s} : {len(s_repo.errors):6d}")
+        print(f"{'Size':12s} : {os.path.getsize(args.output):6d} bytes")
@@ -30,6 +30,7 @@ Module to report on all named within a movie
 
 import os
 import argparse
+from media.data.media.profile import ParseProfile
 from media.general.sorting.organizer import Organizer
 from media.tools.common import load_movies
 
@@ -118,10 +119,11 @@ def grab_cast_names(in_movies):
         if movie.crew is not None:
             if movie.crew.cast:
                 for role in movie.crew.cast.cast:
-                    if role.actor in ca_dict:
-                        ca_dict[role.actor].add_movie(role, movie)
+                    person = role.actor.person
+                    if person in ca_dict:
+                        ca_dict[person].add_movie(role, movie)
                     else:
-                        ca_dict[role.actor] = ActorRoleMap(role, movie)
+                        ca_dict[person] = ActorRoleMap(role, movie)
     return list(ca_dict.values())
 
 
@@ -225,6 +227,7 @@ def stats_compile(in_names):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Simple movie list.')
     parser.add_argument('--mediapath', help='path of media library')
+    parser.add_argument('--snapshot', help='read from a snapshot file')
     parser.add_argument('--random', type=int, help='show X names')
     parser.add_argument('--stats', action=argparse.BooleanOptionalAction,
                         help='Report statistics')
@@ -233,10 +236,11 @@ if __name__ == '__main__':
                         dest='report_empty',
                         help='Report movies with no cast')
     args = parser.parse_args()
-    mediapath = args.mediapath or os.environ['MEDIAPATH']
-    if not mediapath:
+    mediapath = args.mediapath or os.environ.get('MEDIAPATH')
+    if not mediapath and not args.snapshot:
         parser.print_help()
-    all_movies = load_movies(mediapath)
+    all_movies = load_movies(mediapath, profile=ParseProfile.INDEX,
+                             snapshot=args.snapshot)
     names = grab_cast_names(all_movies)
     empty = find_empty_movies(all_movies)
     if len(empty) > 0 and args.report_empty:
@@ -33,9 +33,12 @@ modules.
 
 import argparse
 import os
+from datetime import timedelta
 import media.fmt.text.movie
+from media.tools.common import parse_cache
 from media.general.sorting.organizer import Organizer
 from media.general.sorting.batch import Batch
+from media.general.sorting.table import MovieTable
 
 CliGroupingOptions = {
         'none': Organizer.G_NONE,
@@ -63,6 +66,8 @@ class Controller():
         self.mediapath = None
         self.group = Organizer.G_NONE
         self.sort = Batch.S_TITLE
+        self.cache = None
+        self.snapshot = None
 
     def setup(self):
         '''
@@ -73,6 +78,8 @@ class Controller():
         self.args = parser.parse_args()
         self._convert_args()
         self._determine_path()
+        self.cache = parse_cache(self.args.cache)
+        self.snapshot = self.args.snapshot
 
     def _setup_parser(self):
         '''
@@ -95,6 +102,11 @@ class Controller():
         parser.add_argument('--stats',
                             action=argparse.BooleanOptionalAction,
                             help='Report statistics')
+        parser.add_argument('--cache',
+                            action=argparse.BooleanOptionalAction,
+                            help='Use the parse cache')
+        parser.add_argument('--snapshot',
+                            help='read from a snapshot file')
         return parser
 
     def _convert_args(self):
@@ -198,17 +210,26 @@ class MovieReport():
         '''
         Output the basic stats on the number of movies,
         and the number of movies in the sample set
-        (if one is defined)
+        (if one is defined), followed by the year range
+        and average runtime of the listed movies.
         '''
         all_c = 0
         wrk_c = 0
+        table = MovieTable()
         if self.organizer:
             all_c = len(self.organizer.entries)
             wrk_c = len(self.organizer.working)
+            table = MovieTable.from_index(self.organizer.working)
         out = f"\n  {'Movie count':12s} : {all_c:5d}\n"
         if wrk_c < all_c:
             wrk_p = float(wrk_c) / all_c * 100
             out += f"  {'Sample count':12s} : {wrk_c:5d} ({wrk_p:5.2f}%)\n"
+        years = table.span(MovieTable.C_YEAR)
+        if years:
+            out += f"  {'Years':12s} : {years[0]} - {years[1]}\n"
+        if len(table) > 0:
+            average = timedelta(seconds=int(table.mean(MovieTable.C_RUNTIME)))
+            out += f"  {'Avg runtime':12s} : {average!s}\n"
         return out
 
     def _out_batch(self, batch, sort_field=Batch.S_TITLE):
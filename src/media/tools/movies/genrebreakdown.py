@@ -31,6 +31,8 @@ List out all movie genres, grouped by primary and secondary genres.
 import os
 import argparse
 import random
+from media.general.sorting.table import MovieTable
+from media.data.media.profile import ParseProfile
 from media.tools.common import load_movies
 
 
@@ -39,21 +41,19 @@ class PrimaryBucket():
     Bucket class system for primary genres.
 
     Very simple dictionary where key values are the primary genre name, and
-    the value is a list containing the movie objects.
+    the value is an array of row numbers in a MovieTable.
     '''
-    def __init__(self):
+    def __init__(self, in_table):
+        self.table = in_table
         self.genres = {}
         self.movie_count = 0
 
-    def add(self, genre, movie):
+    def add(self, genre, rows):
         '''
-        Add a movie to a genre, regardless of whether it exists or not.
+        Add the table rows for a genre.
         '''
-        if genre in self.genres:
-            self.genres[genre].append(movie)
-        else:
-            self.genres[genre] = [movie]
-        self.movie_count += 1
+        self.genres[genre] = rows
+        self.movie_count += len(rows)
 
     def bucket(self, genre):
         '''
@@ -75,7 +75,7 @@ class PrimaryBucket():
             pg_tally = len(self.genres[genre])
             perc = float(pg_tally / self.movie_count * 100)
             text_pro_bar = proportion_bar(pg_tally, self.movie_count)
-            rand_movie = random_movie(self.bucket(genre))
+            rand_movie = self.table.movies[random_movie(self.bucket(genre))]
             out += f"{genre:15s}  {pg_tally:5d} {perc:5.1f}% " + \
                    f"{text_pro_bar:50s} {rand_movie.title!s}\n"
         out += f"{'-' * 15}  {'-' * 5} {'-' * 6} {'-' * 50} {'-' * 45}\n"
@@ -213,13 +213,12 @@ def report_header():
     return out
 
 
-def populate_primary_buckets(movies):
-    '''Put the primary genre of every movie in a bucket.'''
-    pg_bucket = PrimaryBucket()
-    for movie in movies:
-        if movie.classification.genres:
-            prim_genre = movie.classification.genres.primary
-            pg_bucket.add(prim_genre, movie)
+def populate_primary_buckets(table):
+    '''Put the rows of a MovieTable in buckets by primary genre.'''
+    pg_bucket = PrimaryBucket(table)
+    for prim_genre, rows in table.group(MovieTable.C_GENRE).items():
+        if prim_genre:
+            pg_bucket.add(prim_genre, rows)
     return pg_bucket
 
 
@@ -261,12 +260,14 @@ def random_movie(in_list):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Simple movie list.')
     parser.add_argument('--mediapath', help='path of media library')
+    parser.add_argument('--snapshot', help='read from a snapshot file')
     args = parser.parse_args()
-    mediapath = args.mediapath or os.environ['MEDIAPATH']
-    if not mediapath:
+    mediapath = args.mediapath or os.environ.get('MEDIAPATH')
+    if not mediapath and not args.snapshot:
         parser.print_help()
-    all_movies = load_movies(mediapath)
-    primary = populate_primary_buckets(all_movies)
+    all_movies = load_movies(mediapath, profile=ParseProfile.INDEX,
+                             snapshot=args.snapshot)
+    primary = populate_primary_buckets(MovieTable(all_movies))
     secondary = populate_secondary_buckets(all_movies)
     print(report_header())
     print(primary.report())
@@ -30,6 +30,7 @@ Module to report on all keywords within a movie
 
 import os
 import argparse
+from media.data.media.profile import ParseProfile
 from media.general.sorting.organizer import Organizer
 from media.tools.common import load_movies
 
@@ -74,7 +75,7 @@ class KeywordTitleMap():
         return self.keyword.sort_value > other.keyword.sort_value
 
     def __eq__(self, other):
-        return self.keyword.sort_value == self.keyword.sort_value
+        return self.keyword.sort_value == other.keyword.sort_value
 
 
 def grab_keywords(movies):
@@ -89,12 +90,8 @@ def grab_keywords(movies):
     kw_dict = {}
     for movie in movies:
         kw_pull = None
-        story = None
-        if movie.story is not None:
-            story = movie.story
-        elif movie.description is not None:
-            story = movie.description
-        if story.keywords is not None:
+        story = movie.story
+        if story is not None and story.keywords is not None:
             kw_pull = story.keywords.all()
             for kw_i in kw_pull:
                 kw_detail = kw_i.detail()
@@ -116,12 +113,14 @@ def list_keywords(keywords):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Simple movie list.')
     parser.add_argument('--mediapath', help='path of media library')
+    parser.add_argument('--snapshot', help='read from a snapshot file')
     parser.add_argument('--random', type=int, help='show X keywords')
     args = parser.parse_args()
-    mediapath = args.mediapath or os.environ['MEDIAPATH']
-    if not mediapath:
+    mediapath = args.mediapath or os.environ.get('MEDIAPATH')
+    if not mediapath and not args.snapshot:
         parser.print_help()
-    all_movies = load_movies(mediapath)
+    all_movies = load_movies(mediapath, profile=ParseProfile.INDEX,
+                             snapshot=args.snapshot)
     all_keywords = grab_keywords(all_movies)
     if args.random:
         rand_limit = args.random
@@ -29,8 +29,10 @@ one entry per line.
 
 # pylint: disable=R0801
 
+from media.data.media.profile import ParseProfile
 from media.fileops.filenames import FilenameMatches
 from media.fileops.repo import Repo
+from media.tools.common import open_snapshot
 from media.tools.movies.common import (
                                        Controller,
                                        MovieReport)
@@ -49,9 +51,13 @@ def main_cli():
     controller = Controller()
     controller.setup()
 
-    repo = Repo(controller.mediapath)
-    repo.scan()
-    repo.load(FilenameMatches.All_Media)
+    if controller.snapshot:
+        repo = open_snapshot(controller.snapshot)
+    else:
+        repo = Repo(controller.mediapath)
+        repo.scan()
+        repo.load(FilenameMatches.All_Media, cache=controller.cache,
+                  profile=ParseProfile.INDEX)
     movies = repo.get_movies()
     movie_report = MovieReport()
     movie_report.set_movies(movies)
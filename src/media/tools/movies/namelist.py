@@ -30,6 +30,7 @@ Module to report on all named within a movie
 
 import os
 import argparse
+from media.data.media.profile import ParseProfile
 from media.general.sorting.organizer import Organizer
 from media.tools.common import load_movies
 
@@ -107,12 +108,12 @@ def extract_role_from_list(in_dict, in_crew_roles,
     Extract the name of the actor from a role object.
     '''
     for name_i in in_crew_roles:
-        if name_i.actor in in_dict:
-            in_dict[name_i.actor].add_job_title(in_job_title, in_movie_title)
+        person = name_i.actor.person
+        if person in in_dict:
+            in_dict[person].add_job_title(in_job_title, in_movie_title)
         else:
-            in_dict[name_i.actor] = NameJobTitleMap(name_i.actor,
-                                                    in_job_title,
-                                                    in_movie_title)
+            in_dict[person] = NameJobTitleMap(person, in_job_title,
+                                              in_movie_title)
 
 
 def grab_crew_names(movies):
@@ -153,12 +154,14 @@ def list_names(in_names):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Simple movie list.')
     parser.add_argument('--mediapath', help='path of media library')
+    parser.add_argument('--snapshot', help='read from a snapshot file')
     parser.add_argument('--random', type=int, help='show X names')
     args = parser.parse_args()
-    mediapath = args.mediapath or os.environ['MEDIAPATH']
-    if not mediapath:
+    mediapath = args.mediapath or os.environ.get('MEDIAPATH')
+    if not mediapath and not args.snapshot:
         parser.print_help()
-    all_movies = load_movies(mediapath)
+    all_movies = load_movies(mediapath, profile=ParseProfile.INDEX,
+                             snapshot=args.snapshot)
     all_names = grab_crew_names(all_movies)
     if args.random:
         rand_limit = args.random
@@ -32,8 +32,10 @@ Simple command to output details on every movie.
 # brief movie report
 import argparse
 import media.fmt.text.movie
+from media.data.media.profile import ParseProfile
 from media.fileops.filenames import FilenameMatches
 from media.fileops.repo import Repo
+from media.tools.common import open_snapshot
 from media.tools.movies.common import (Controller,
                                        MovieReport)
 
@@ -66,6 +68,11 @@ class ShowController(Controller):
         parser.add_argument('--stats',
                             action=argparse.BooleanOptionalAction,
                             help='Report statistics')
+        parser.add_argument('--cache',
+                            action=argparse.BooleanOptionalAction,
+                            help='Use the parse cache')
+        parser.add_argument('--snapshot',
+                            help='read from a snapshot file')
         return parser
 
 
@@ -163,9 +170,13 @@ def main_cli():
     controller = ShowController()
     controller.setup()
 
-    repo = Repo(controller.mediapath)
-    repo.scan()
-    repo.load(FilenameMatches.All_Media)
+    if controller.snapshot:
+        repo = open_snapshot(controller.snapshot)
+    else:
+        repo = Repo(controller.mediapath)
+        repo.scan()
+        repo.load(FilenameMatches.All_Media, cache=controller.cache,
+                  profile=ParseProfile.INDEX)
     movies = repo.get_movies()
     movie_report = MovieShowReport()
     movie_report.set_movies(movies)
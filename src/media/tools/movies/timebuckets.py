@@ -32,9 +32,10 @@ from datetime import timedelta
 
 import os
 import argparse
-from media.general.sorting.organizer import Organizer
-from media.general.sorting.groups import Batch
-from media.tools.common import load_movies
+import random
+from media.general.sorting.table import MovieTable
+from media.data.media.profile import ParseProfile
+from media.tools.common import load_movies, open_snapshot
 from media.tools.movies.genrebreakdown import proportion_bar
 
 
@@ -42,6 +43,9 @@ class BucketManager():
     '''
     Holds all bucket objects, and performs
     reporting, and data aggregation operations across all of them.
+
+    The runtimes are read from the runtime column of a MovieTable,
+    so the movie objects are only used to show sample titles.
     '''
     def __init__(self, in_limit=10):
         self.limit = in_limit
@@ -52,55 +56,32 @@ class BucketManager():
         self.movie_count = 0
         self.interval = 0
 
-    def initialize_bucket_ranges(self, in_list):
+    def initialize_bucket_ranges(self, in_table):
         '''
         Set up ever bucket object (up to limit), and
         configure the range values of each object.
+
+        The interval is the runtime range of all the movies
+        divided by the number of requested buckets.
+        '''
+        low, width, rows = in_table.bucket(MovieTable.C_RUNTIME, self.limit)
+        self.interval = timedelta(seconds=width)
+        start_i = timedelta(seconds=low)
+        for bucket_rows in rows:
+            bucket = Bucket(start_i, width, len(in_table))
+            bucket.table = in_table
+            bucket.rows = bucket_rows
+            self.buckets.append(bucket)
+            start_i += self.interval
+
+    def install_in_buckets(self, in_table):
+        '''
+        Work out the summary values for the movies that
+        were split into the buckets.
         '''
-        shortest = in_list[0].runtime
-        longest = in_list[-1].runtime
-        interval = self.get_bucket_interval(shortest, longest)
-        start_i = shortest
-        for _ in range(1, self.limit + 1):
-            self.buckets.append(Bucket(start_i, interval, len(in_list)))
-            start_i += timedelta(seconds=interval)
-
-    def get_bucket_interval(self, shortest, longest):
-        '''
-        Determine the bucket interval length by subtracting the shortest
-        movie runtime from the longest movie runtime, then divide it
-        by the number of requested buckets.  This requires turning the
-        runtimes into integers that represent all of the seconds in the
-        timedelta object.
-
-        Input is two timedelta objects, and the return value is another
-        timedelta object.
-        '''
-        delta_range = longest - shortest
-        delta_int = int(delta_range.total_seconds())
-        range_int = int(delta_int / self.limit) + 1
-        self.interval = timedelta(seconds=range_int)
-        return range_int
-
-    def install_in_buckets(self, in_list):
-        '''
-        For every passed movie, install it into a bucket by
-        passing it to every bucket object, knowing that
-        it only gets accepted into a single bucket.
-
-        There are probably ways to make this code more
-        efficient.
-        '''
-        total_r = 0
-        for movie_i in in_list:
-            for bucket_i in self.buckets:
-                if bucket_i.is_in_range(movie_i.runtime):
-                    bucket_i.movies.append(movie_i)
-                    break
-            total_r += movie_i.runtime.total_seconds()
-        self.movie_count = len(in_list)
-        self.calculate_average(total_r)
-        self.calculate_median(in_list)
+        self.movie_count = len(in_table)
+        self.calculate_average(in_table.total(MovieTable.C_RUNTIME))
+        self.calculate_median(in_table)
 
     def calculate_average(self, total_runtimes):
         '''
@@ -109,23 +90,23 @@ class BucketManager():
         average_seconds = int(total_runtimes / self.movie_count)
         self.average = timedelta(seconds=average_seconds)
 
-    def calculate_median(self, in_list):
+    def calculate_median(self, in_table):
         '''
         Calculate the median time of all the movies, and
         report on which titles(s) fit the median.
         '''
+        order = in_table.order(MovieTable.C_RUNTIME)
+        runtimes = in_table.column(MovieTable.C_RUNTIME)
+        median1 = self.movie_count // 2
         if self.movie_count % 2 == 0:
-            median1 = int(self.movie_count / 2)
-            median2 = median1 + 1
-            total_median_seconds = in_list[median1].runtime.total_seconds() + \
-                in_list[median2].runtime.total_seconds()
-            self.median = timedelta(seconds=int(total_median_seconds / 2))
-            self.median_title = f"{in_list[median1].movie.title!s:s} / " + \
-                f"{in_list[median2].movie.title!s:s}"
+            rows = [order[median1 - 1], order[median1]]
         else:
-            median1 = int(self.movie_count / 2)
-            self.median = in_list[median1].runtime
-            self.median_title = f"{in_list[median1].movie.title!s:s}"
+            rows = [order[median1]]
+        total_median_seconds = sum(runtimes[row] for row in rows)
+        self.median = timedelta(seconds=int(total_median_seconds /
+                                            len(rows)))
+        self.median_title = ' / '.join(str(in_table.movies[row].title)
+                                       for row in rows)
 
     def report_buckets(self):
         '''
@@ -147,7 +128,7 @@ class BucketManager():
 
 class Bucket():
     '''
-    A single bucket designed to hold movie objects.
+    A single bucket holding the table rows of movies.
 
     It has a low end limit and a high end limit, and then uses those
     timedelta values to see if a movie should go in that bucket
@@ -157,7 +138,8 @@ class Bucket():
         self.low_limit = in_low_limit
         self.high_limit = in_low_limit + timedelta(seconds=in_range)
         self.total_count = in_total_count
-        self.movies = []
+        self.table = None
+        self.rows = []
 
     def is_in_range(self, in_timedelta):
         '''
@@ -172,7 +154,7 @@ class Bucket():
         '''
         return f"Low   : {self.low_limit}\n" + \
             f"High  : {self.high_limit}\n" + \
-            f"Count : {len(self.movies)} / {self.total_count}\n\n"
+            f"Count : {len(self.rows)} / {self.total_count}\n\n"
 
     @classmethod
     def header(cls):
@@ -199,35 +181,37 @@ class Bucket():
         movies, the percentage based on a total, and a tick bar
         for illustrative purposes.  Also show a random movie title.
         '''
-        tick_bar = proportion_bar(len(self.movies), self.total_count)
-        movie = Organizer.get_random_sample(self.movies, 1)
-        if len(movie) > 0:
-            mov_title = str(movie[0].movie.title)
-            perc = float(len(self.movies) / self.total_count * 100)
+        tick_bar = proportion_bar(len(self.rows), self.total_count)
+        if len(self.rows) > 0:
+            row = random.choice(self.rows)
+            mov_title = str(self.table.movies[row].title)
+            perc = float(len(self.rows) / self.total_count * 100)
         else:
             mov_title = " << None >>"
             perc = 0
         return f"{str(mov_title):50s} {self.low_limit!s:>8s} " + \
-               f"{self.high_limit!s:>8s} {len(self.movies):5d} " + \
+               f"{self.high_limit!s:>8s} {len(self.rows):5d} " + \
                f"{perc:5.1f}% {tick_bar}"
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Simple movie list.')
     parser.add_argument('--mediapath', help='path of media library')
+    parser.add_argument('--snapshot', help='read from a snapshot file')
     parser.add_argument('--buckets', type=int, help='number of sample buckets')
     args = parser.parse_args()
-    mediapath = args.mediapath or os.environ['MEDIAPATH']
-    if not mediapath:
+    mediapath = args.mediapath or os.environ.get('MEDIAPATH')
+    if not mediapath and not args.snapshot:
         parser.print_help()
-    all_movies = load_movies(mediapath)
-    organizer = Organizer(all_movies)
-    single_batch = organizer.create_batches()[0]
-    sorted_movies = single_batch.index_by(Batch.S_RUNTIME)
+    if args.snapshot:
+        table = open_snapshot(args.snapshot).movie_table()
+    else:
+        table = MovieTable(load_movies(mediapath,
+                                       profile=ParseProfile.INDEX))
     if args.buckets:
         buckets = BucketManager(args.buckets)
     else:
         buckets = BucketManager()
-    buckets.initialize_bucket_ranges(sorted_movies)
-    buckets.install_in_buckets(sorted_movies)
+    buckets.initialize_bucket_ranges(table)
+    buckets.install_in_buckets(table)
     buckets.report_buckets()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Pluggable XML parsing backends.
+
+The lxml parser is used when it is installed, otherwise
+the standard library ElementTree parser is used.  Both
+backends produce elements that the data model classes
+treat the same way.
+'''
+
+# pylint: disable=too-few-public-methods
+
+import os
+import os.path
+import xml.etree.ElementTree as ET
+import xml.etree.ElementInclude as EI
+from urllib.parse import unquote, urlparse
+from media.fileops.scanner import signature_or_none
+from media.xml.include import IncludeLoader
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+_RESOLVER_BASE = lxml_etree.Resolver if lxml_etree is not None else object
+
+
+class StdlibBackend():
+    '''
+    ElementTree parser, with XIncludes handled by ElementInclude.
+    '''
+    name = 'stdlib'
+
+    def parse(self, in_filename, in_includes, in_cache=None,
+              in_signatures=None):
+        '''
+        Parse a file and process the includes, returning the
+        root element.  Included files are added to the list
+        as they are loaded, and read through the IncludeCache
+        object if there is one.  Their signatures are added to
+        the dictionary, if one is given.
+        '''
+        root = ET.parse(in_filename).getroot()
+        EI.include(root, loader=IncludeLoader(in_filename, in_includes,
+                                              in_cache, in_signatures))
+        return root
+
+    @classmethod
+    def tostring(cls, in_element):
+        '''
+        Serialize an element, without its tail text.
+        '''
+        tail = in_element.tail
+        in_element.tail = None
+        try:
+            return ET.tostring(in_element)
+        finally:
+            in_element.tail = tail
+
+
+class LxmlBackend():
+    '''
+    lxml parser, with XIncludes handled natively by libxml2.
+
+    Comments and processing instructions are dropped, since
+    ElementTree never returns them.  libxml2 parses the include
+    files itself, so only their raw contents are cached.
+    '''
+    name = 'lxml'
+
+    def parse(self, in_filename, in_includes, in_cache=None,
+              in_signatures=None):
+        '''
+        Parse a file and process the includes, returning the
+        root element.  Included files are added to the list
+        as they are loaded, and read through the IncludeCache
+        object if there is one.  Their signatures are added to
+        the dictionary, if one is given.
+        '''
+        parser = lxml_etree.XMLParser(remove_comments=True, remove_pis=True)
+        parser.resolvers.add(IncludeRecorder(in_filename, in_includes,
+                                             in_signatures, in_cache))
+        tree = lxml_etree.parse(in_filename, parser)
+        tree.xinclude()
+        root = tree.getroot()
+        lxml_etree.strip_tags(root, lxml_etree.Comment,
+                              lxml_etree.ProcessingInstruction)
+        return root
+
+    @classmethod
+    def tostring(cls, in_element):
+        '''
+        Serialize an element, without its tail text.
+        '''
+        return lxml_etree.tostring(in_element, with_tail=False)
+
+
+class IncludeRecorder(_RESOLVER_BASE):
+    '''
+    Resolver that records every file loaded by XInclude.
+    With an IncludeCache object, the contents of the file
+    come from the cache, otherwise lxml loads it normally.
+
+    libxml2 also passes the source document through the
+    resolver, so that one is left out of the list.  The
+    resolver is called before the file is read, which is
+    when its signature is taken.
+    '''
+    def __init__(self, in_filename, in_includes, in_signatures=None,
+                 in_cache=None):
+        super().__init__()
+        self.source = os.path.realpath(in_filename)
+        self.files = in_includes
+        self.signatures = in_signatures if in_signatures is not None else {}
+        self.cache = in_cache
+
+    # pylint: disable=unused-argument
+    def resolve(self, system_url, public_id, context):
+        '''
+        Record the file, and return its contents from the
+        cache, or None so lxml loads it.
+        '''
+        full_path = os.path.normpath(url_to_path(system_url))
+        if os.path.realpath(full_path) == self.source:
+            return None
+        if full_path not in self.files:
+            self.files.append(full_path)
+            self.signatures[full_path] = signature_or_none(full_path)
+        if self.cache is None:
+            return None
+        try:
+            data = self.cache.read(full_path)
+        except OSError:
+            return None
+        return self.resolve_string(data, context, base_url=full_path)
+
+
+def url_to_path(in_url):
+    '''
+    Convert a file URL from lxml to a filesystem path.
+    '''
+    if in_url.startswith('file:'):
+        return unquote(urlparse(in_url).path)
+    return in_url
+
+
+def serialize(in_element):
+    '''
+    Serialize an element from either backend to bytes, which
+    can be turned back into an ElementTree element with
+    ET.fromstring() no matter which backend parsed it.
+    '''
+    if isinstance(in_element, ET.Element):
+        return StdlibBackend.tostring(in_element)
+    return LxmlBackend.tostring(in_element)
+
+
+BACKENDS = {
+        'stdlib': StdlibBackend,
+        'lxml': LxmlBackend
+        }
+
+
+def available_backends():
+    '''
+    Return the names of the backends that can be used.
+    '''
+    out = ['stdlib']
+    if lxml_etree is not None:
+        out.append('lxml')
+    return out
+
+
+def get_backend(in_name=None):
+    '''
+    Return a backend object by name.  Without a name, the
+    MEDIAXMLBACKEND environment variable is checked, then
+    lxml is used if it is available.
+    '''
+    name = in_name or os.environ.get('MEDIAXMLBACKEND')
+    if not name:
+        name = available_backends()[-1]
+    if name not in available_backends():
+        raise BackendException(f"XML backend not available: {name}")
+    return BACKENDS[name]()
+
+
+class BackendException(Exception):
+    '''
+    Exception for a backend that can not be used.
+    '''
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return self.message
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Table driven processing of child elements'''
+
+from collections import Counter
+from media.general.stringpool import active_pool
+from media.xml.namespaces import Namespaces
+
+# Namespaces that data model elements can come from
+
+DISPATCH_NAMESPACES = ['media', 'movie', 'audio', 'authorship']
+
+
+class ElementDispatch():
+    '''
+    Mixin for data objects that handle the child elements of
+    an XML element by tag name.
+
+    xml_handlers maps a local tag name to the name of a method
+    that takes the child element.  xml_text maps a local tag
+    name to an attribute that gets set to the text of the
+    child element, shared through the string pool that is
+    active when _dispatch() is called.
+    Both are merged with the tables of any
+    parent classes, and qualified against every media namespace
+    when the class is created, so handling a child element
+    only takes a single dictionary lookup.  Tags from any other
+    namespace are matched by local name the first time they
+    are seen, and remembered after that.
+
+    Counting of handled elements can be turned on with
+    enable_counters() for profiling.
+    '''
+    __slots__ = ()
+    xml_handlers = {}
+    xml_text = {}
+    counters = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        handlers = {}
+        text = {}
+        for base in reversed(cls.__mro__):
+            handlers.update(base.__dict__.get('xml_handlers', {}))
+            text.update(base.__dict__.get('xml_text', {}))
+        cls._xml_local = {}
+        for (name, method) in handlers.items():
+            cls._xml_local[name] = getattr(cls, method)
+        for (name, attr) in text.items():
+            cls._xml_local[name] = attr
+        cls._xml_table = {}
+        for prefix in DISPATCH_NAMESPACES:
+            namespace = Namespaces.nsf(prefix)
+            for (name, handler) in cls._xml_local.items():
+                cls._xml_table[namespace + name] = handler
+
+    def _dispatch(self, in_element):
+        '''
+        Run the handler for every child element with a known tag.
+        '''
+        pool = active_pool()
+        if ElementDispatch.counters is not None:
+            for child in in_element:
+                self._dispatch_one(child, pool)
+            return
+        table = self._xml_table
+        for child in in_element:
+            try:
+                handler = table[child.tag]
+            except KeyError:
+                handler = self._resolve(child.tag)
+            if handler is None:
+                continue
+            if handler.__class__ is str:
+                text = child.text
+                if pool is not None and text is not None:
+                    text = pool.intern(text)
+                setattr(self, handler, text)
+            else:
+                handler(self, child)
+
+    def _dispatch_one(self, in_child, in_pool=None):
+        '''
+        Run the handler for a single element, returning
+        True if there was a handler.  Text values are shared
+        through the pool, if one is given.
+        '''
+        try:
+            handler = self._xml_table[in_child.tag]
+        except KeyError:
+            handler = self._resolve(in_child.tag)
+        if handler is None:
+            return False
+        if ElementDispatch.counters is not None:
+            self._count(in_child)
+        if handler.__class__ is str:
+            text = in_child.text
+            if in_pool is not None and text is not None:
+                text = in_pool.intern(text)
+            setattr(self, handler, text)
+        else:
+            handler(self, in_child)
+        return True
+
+    @classmethod
+    def _resolve(cls, in_tag):
+        handler = cls._xml_local.get(Namespaces.ns_strip(in_tag))
+        cls._xml_table[in_tag] = handler
+        return handler
+
+    def _count(self, in_child):
+        ElementDispatch.counters.update([(self.__class__.__name__,
+                                          Namespaces.ns_strip(in_child.tag))])
+
+    @classmethod
+    def enable_counters(cls):
+        '''
+        Start counting handled elements, by class and tag name.
+        '''
+        ElementDispatch.counters = Counter()
+
+    @classmethod
+    def disable_counters(cls):
+        '''
+        Stop counting, and return the counts collected so far.
+        '''
+        out = ElementDispatch.counters
+        ElementDispatch.counters = None
+        return out
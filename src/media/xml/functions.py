@@ -24,6 +24,10 @@
 
 '''XML Namespace Constants'''
 
+import re
+from datetime import timedelta
+from functools import lru_cache
+
 #
 # This should actually check for a value error
 #
@@ -42,3 +46,59 @@ def xs_text_strip(in_string):
     if chunk:
         return chunk
     return None
+
+
+_NUM = r"\d+(?:[.,]\d+)?"
+DURATION_RE = re.compile(
+        r"(?P<sign>-)?P(?=\d|T\d)" +
+        rf"(?:(?P<years>{_NUM})Y)?(?:(?P<months>{_NUM})M)?" +
+        rf"(?:(?P<weeks>{_NUM})W)?(?:(?P<days>{_NUM})D)?" +
+        rf"(?:T(?=\d)(?:(?P<hours>{_NUM})H)?(?:(?P<minutes>{_NUM})M)?" +
+        rf"(?:(?P<seconds>{_NUM})S)?)?")
+
+
+def xs_duration(in_string):
+    '''
+    Convert an ISO 8601 duration, like PT1H20M37.5S, to a
+    timedelta.  Weeks, days and fractions of any component
+    are allowed, with either a period or comma.
+
+    Years and months have no fixed length, so a duration
+    that uses them returns None, as does one too large for
+    a timedelta, or anything that isn't a duration.
+    '''
+    if in_string is None:
+        return None
+    return _parse_duration(in_string.strip())
+
+
+@lru_cache(maxsize=1024)
+def _parse_duration(in_string):
+    '''
+    Cached parser for xs_duration().  Runtimes repeat a lot
+    across a library, and timedelta objects are immutable,
+    so the same object can be handed back every time.
+    '''
+    dur_match = DURATION_RE.fullmatch(in_string)
+    if dur_match is None:
+        return None
+    fields = {}
+    for (name, value) in dur_match.groupdict().items():
+        if value is not None and name != 'sign':
+            fields[name] = float(value.replace(',', '.'))
+    if fields.pop('years', 0) or fields.pop('months', 0):
+        return None
+    try:
+        out = timedelta(**fields)
+    except OverflowError:
+        return None
+    if dur_match.group('sign'):
+        return -out
+    return out
+
+
+def duration_cache_info():
+    '''
+    Return the hit and miss counts of the duration cache.
+    '''
+    return _parse_duration.cache_info()
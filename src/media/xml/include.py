@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''XInclude processing for media files'''
+
+# pylint: disable=too-few-public-methods
+
+import copy
+import os
+import os.path
+import xml.etree.ElementInclude as EI
+from media.fileops.scanner import signature_or_none
+
+
+class IncludeLoader():
+    '''
+    Loader for ElementInclude that resolves href values
+    relative to the directory of the including file,
+    instead of the current working directory.
+
+    Nothing about the process state gets changed, so
+    multiple threads can process includes at the same time.
+
+    Every file that gets loaded is recorded, so callers can
+    track the dependencies of the source file.  A list can be
+    passed in to receive the filenames.  The signature of each
+    file is taken before it is read, and kept in a dictionary
+    which can also be passed in.
+    '''
+    def __init__(self, in_filename, in_files=None, in_cache=None,
+                 in_signatures=None):
+        self.base_dir = os.path.dirname(os.path.realpath(in_filename))
+        self.files = in_files if in_files is not None else []
+        self.signatures = in_signatures if in_signatures is not None else {}
+        self.cache = in_cache
+
+    def resolve(self, in_href):
+        '''
+        Return the full path of an included file.
+        '''
+        if os.path.isabs(in_href):
+            return in_href
+        return os.path.normpath(os.path.join(self.base_dir, in_href))
+
+    def __call__(self, href, parse, encoding=None):
+        full_path = self.resolve(href)
+        if full_path not in self.files:
+            self.files.append(full_path)
+            self.signatures[full_path] = signature_or_none(full_path)
+        if self.cache is not None:
+            return self.cache.load(full_path, parse, encoding)
+        return EI.default_loader(full_path, parse, encoding)
+
+
+class IncludeCache():
+    '''
+    Parsed include files, keyed by path, so a fragment shared
+    by many media files is only read and parsed once.  Only
+    the latest version of each file is kept, and it is parsed
+    again when its modification time or size changes.
+
+    Every caller gets a deep copy of the cached element, since
+    the include process inserts it into the including tree.
+
+    The raw contents of a file can be cached too, for parsers
+    like libxml2 that process the includes themselves.
+    '''
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, in_path, in_parse, in_encoding=None):
+        '''
+        Return the contents of an include file, from the
+        cache if the file hasn't changed.
+        '''
+        data = self._fetch(in_path, in_parse,
+                           lambda: EI.default_loader(in_path, in_parse,
+                                                     in_encoding))
+        if in_parse == 'xml':
+            return copy.deepcopy(data)
+        return data
+
+    def read(self, in_path):
+        '''
+        Return the raw bytes of an include file, from the
+        cache if the file hasn't changed.
+        '''
+        return self._fetch(in_path, 'raw', lambda: _read_bytes(in_path))
+
+    def _fetch(self, in_path, in_kind, in_reader):
+        f_stat = os.stat(in_path)
+        key = (in_path, in_kind)
+        version = (f_stat.st_mtime_ns, f_stat.st_size)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        data = in_reader()
+        self.entries[key] = (version, data)
+        return data
+
+    def clear(self):
+        '''
+        Drop all cached files.
+        '''
+        self.entries = {}
+
+
+def _read_bytes(in_path):
+    with open(in_path, 'rb') as f_in:
+        return f_in.read()
+
+
+def include(in_root, in_filename, in_cache=None):
+    '''
+    Process every XInclude reference under the root element,
+    resolving hrefs against the location of the source file.
+
+    Returns the list of files that were included.
+    '''
+    loader = IncludeLoader(in_filename, in_cache=in_cache)
+    EI.include(in_root, loader=loader)
+    return loader.files
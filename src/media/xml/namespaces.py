@@ -24,6 +24,11 @@
 
 '''XML Namespace Constants'''
 
+# pylint: disable=too-few-public-methods
+
+import keyword
+import sys
+
 
 class Namespaces():
     '''Static data on XML Namespaces'''
@@ -44,5 +49,72 @@ class Namespaces():
     @classmethod
     def ns_strip(cls, in_tag):
         '''Strip the namespace from an element'''
-        out = in_tag.split("}", 1)
-        return out[1]
+        try:
+            return LOCAL_NAMES[in_tag]
+        except KeyError:
+            out = sys.intern(in_tag.split("}", 1)[1])
+            LOCAL_NAMES[in_tag] = out
+            return out
+
+
+# Map of fully qualified tag names to local names,
+# filled in by the tag tables, and by ns_strip()
+
+LOCAL_NAMES = {}
+
+
+class TagTable():
+    '''
+    Fully qualified tag names for a single namespace,
+    available as attributes, so element tags can be
+    compared without building strings.
+
+    Tag names that are Python keywords get a trailing
+    underscore (from becomes from_).  Tags that are not
+    in the initial list have to be added with add(), so a
+    misspelled name raises AttributeError.
+    '''
+    def __init__(self, in_prefix, in_names):
+        self.prefix = in_prefix
+        self.namespace = Namespaces.nsf(in_prefix)
+        for name in in_names:
+            self.add(name)
+
+    def add(self, in_name):
+        '''
+        Add a local tag name, and return the qualified name.
+        '''
+        qualified = sys.intern(self.namespace + in_name)
+        attr = in_name.replace('-', '_')
+        if keyword.iskeyword(attr):
+            attr += '_'
+        setattr(self, attr, qualified)
+        LOCAL_NAMES[qualified] = sys.intern(in_name)
+        return qualified
+
+    def __getattr__(self, in_attr):
+        '''
+        Only called for names that haven't been added.
+        '''
+        raise AttributeError(f"No {self.prefix} tag named {in_attr}")
+
+
+class Tags():
+    '''
+    Tag tables for every media namespace.
+    '''
+    media = TagTable('media', [
+            'acquisition', 'barcode', 'condition', 'contents', 'date',
+            'dimensions', 'edition', 'exact', 'filing', 'from', 'gift',
+            'instance', 'instances', 'inventory', 'library', 'localId',
+            'location', 'main', 'media', 'mediaList', 'medium', 'name',
+            'notes', 'other', 'price', 'publisher', 'purchase', 'quality',
+            'release', 'retailer', 'size', 'sku', 'status', 'title',
+            'type', 'value', 'weight'])
+    movie = TagTable('movie', [
+            'cast', 'catalog', 'classification', 'crew', 'description',
+            'directors', 'movie', 'story', 'technical', 'title',
+            'variants'])
+    audio = TagTable('audio', [
+            'album', 'catalog', 'elements', 'song', 'technical', 'title'])
+    authorship = TagTable('authorship', ['authorshipRecord'])
@@ -24,43 +24,154 @@
 
 '''Main parser class for XML files'''
 
+# pylint: disable=too-many-instance-attributes
+
 import xml.etree.ElementTree as ET
 import xml.etree.ElementInclude as EI
 import os.path
-from os import chdir
 import media.data.media
-from media.xml.namespaces import Namespaces
+from media.general.stringpool import StringPool
+from media.general.stringtools import cache_report
+from media.xml.backend import get_backend
+from media.fileops.scanner import signature_or_none
+from media.xml.include import IncludeCache, IncludeLoader
+from media.xml.namespaces import Namespaces, Tags
 
 
 class Parser():
     '''
     Main wrapper functions for all XML functionality against
     a given file.
+
+    The backend object does the actual parsing, which is
+    lxml if it is installed, or ElementTree if it isn't.
+
+    Included files are parsed once and then copied from the
+    include cache.  A cache object can be passed in to share
+    it between parser objects.
+
+    The parse profile is passed on to every media object,
+    to pick which subtrees are built during the load.
+
+    Media objects are built with the parser's string pool
+    active, so repeated values share one string object.
     '''
-    def __init__(self):
+    def __init__(self, backend=None, include_cache=None, profile=None):
+        self.backend = backend or get_backend()
+        self.include_cache = include_cache or IncludeCache()
+        self.profile = profile
+        self.strings = StringPool()
         self.medialist = []
         self.file_count = 0
         self.object_count = 0
+        self.last_includes = []
+        self.last_signatures = {}
 
     def load_file(self, in_filename):
-        '''Load an XML file into the parser'''
+        '''
+        Load an XML file into the parser.
+
+        The files pulled in through XInclude are kept in
+        last_includes until the next file is loaded, even if
+        the load fails.  The signatures of the file and its
+        includes, taken before each one was read, are kept in
+        last_signatures.
+
+        Media elements pulled in by an XInclude directly under
+        the root element are loaded as well, as in iter_file().
+        '''
         real_path = os.path.realpath(in_filename)
-        dir_name = os.path.dirname(real_path)
-        base_name = os.path.basename(real_path)
-        chdir(dir_name)
         self.file_count += 1
-        tree = ET.parse(base_name)
-        root = tree.getroot()
-        EI.include(root)
+        self.last_includes = []
+        self.last_signatures = {real_path: signature_or_none(real_path)}
+        root = self.backend.parse(real_path, self.last_includes,
+                                  self.include_cache, self.last_signatures)
         xml_chunk = []
-        for elem in root.findall('./media:media', Namespaces.ns):
-            xml_chunk.append(media.data.media.Media(elem))
-            self.object_count += 1
+        with self.strings:
+            for child in root:
+                for elem in Parser._media_elements(child):
+                    xml_chunk.append(media.data.media.Media(elem,
+                                                            self.profile))
+                    self.object_count += 1
         return xml_chunk
 
+    def iter_file(self, in_filename):
+        '''
+        Streaming version of load_file(), built on the
+        ElementTree iterparse regardless of the backend.
+
+        Every media object is created as soon as the end tag
+        of its element is reached, and the element is removed
+        from the tree afterwards, so only one media element is
+        in memory at a time.  XIncludes directly under the root
+        element are expanded in place, and the media elements
+        they pull in are returned the same as load_file() does.
+        '''
+        real_path = os.path.realpath(in_filename)
+        self.file_count += 1
+        self.last_signatures = {real_path: signature_or_none(real_path)}
+        loader = IncludeLoader(real_path, in_cache=self.include_cache,
+                               in_signatures=self.last_signatures)
+        self.last_includes = loader.files
+        root = None
+        depth = 0
+        for (event, elem) in ET.iterparse(real_path, ('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            if elem.tag == EI.XINCLUDE_INCLUDE:
+                m_elems = Parser._expand_include(elem, loader)
+            else:
+                EI.include(elem, loader=loader)
+                m_elems = Parser._media_elements(elem)
+            for m_elem in m_elems:
+                yield self._build_media(m_elem)
+            root.remove(elem)
+
+    def _build_media(self, in_element):
+        self.object_count += 1
+        with self.strings:
+            return media.data.media.Media(in_element, self.profile)
+
+    @classmethod
+    def _expand_include(cls, in_element, in_loader):
+        '''
+        Put an include element under a temporary parent so it
+        can be replaced, and return the media elements it
+        pulled in, either directly or through a media list.
+        '''
+        wrapper = ET.Element('wrapper')
+        wrapper.append(in_element)
+        EI.include(wrapper, loader=in_loader)
+        out = []
+        for child in wrapper:
+            out.extend(Parser._media_elements(child))
+        return out
+
+    @classmethod
+    def _media_elements(cls, in_element):
+        '''
+        Return the media elements for a child of the root
+        element, which is either a media element, or a media
+        list pulled in by an XInclude.
+        '''
+        if in_element.tag == Tags.media.media:
+            return [in_element]
+        return in_element.findall('./media:media', Namespaces.ns)
+
     def stats(self):
         '''
-        Report stats on how many files were read, and how many
-        successful XML objects were created.
+        Report stats on how many files were read, how many
+        successful XML objects were created, how often
+        include files came from the cache, and how well the
+        string pool and sort key caches are doing.
         '''
-        return f"Files: {self.file_count} -- Objects {self.object_count}"
+        return f"Files: {self.file_count} -- Objects {self.object_count}" + \
+               f" -- Include hits: {self.include_cache.hits}" + \
+               f" misses: {self.include_cache.misses}" + \
+               f" -- {self.strings.stats()} -- {cache_report()}"
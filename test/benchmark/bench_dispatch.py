@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Benchmark of element dispatch against an if/elif chain.
+
+Builds the same personal name fields both ways, for a large
+number of cast member elements.
+
+Run with:  PYTHONPATH=src python -m test.benchmark.bench_dispatch
+'''
+
+import timeit
+import xml.etree.ElementTree as ET
+from media.data.nouns import PersonalName
+from media.xml.namespaces import Namespaces
+
+ACTOR = '''<actor xmlns='http://vectortron.com/xml/media/movie'>
+<gn>Josh</gn><mn>Allen</mn><fn>Gallant</fn><suffix>Jr.</suffix></actor>'''
+
+
+def chain(in_elements):
+    '''
+    Walk the children with an if/elif chain on local names.
+    '''
+    out = []
+    for element in in_elements:
+        name = PersonalName(None)
+        for child in element:
+            tagname = Namespaces.ns_strip(child.tag)
+            if tagname == 'gn':
+                name.given = child.text
+            elif tagname == 'fn':
+                name.family = child.text
+            elif tagname == 'mn':
+                name.middle = child.text
+            elif tagname == 'mi':
+                name.mid_initial = child.text
+            elif tagname == 'suffix':
+                name.suffix = child.text
+            elif tagname == 'prefix':
+                name.prefix = child.text
+            elif tagname == 'pgn':
+                name.pref_given = child.text
+            elif tagname == 'pcn':
+                name.pref_complete = child.text
+        out.append(name)
+    return out
+
+
+def dispatch(in_elements):
+    '''
+    Walk the children through the dispatch table.
+    '''
+    out = []
+    for element in in_elements:
+        name = PersonalName(None)
+        name._dispatch(element)  # pylint: disable=protected-access
+        out.append(name)
+    return out
+
+
+def main():
+    '''
+    Run the benchmarks and print the results.
+    '''
+    elements = [ET.fromstring(ACTOR) for _ in range(20000)]
+    for func in [chain, dispatch]:
+        elapsed = timeit.timeit(lambda f=func: f(elements), number=10)
+        print(f"{func.__name__:20s} {elapsed:8.4f}s")
+
+
+if __name__ == '__main__':
+    main()
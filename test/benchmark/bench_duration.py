@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Benchmark of ISO 8601 duration parsing.
+
+Compares the old regex, which was rebuilt and matched for
+every call, against xs_duration() with and without its
+cache, over a list of runtimes that repeat the way song
+and movie runtimes do in a library.
+
+Run with:  PYTHONPATH=src python -m test.benchmark.bench_duration
+'''
+
+import random
+import re
+import timeit
+from datetime import timedelta
+from media.xml.functions import xs_duration, _parse_duration
+
+
+def old_duration(in_string):
+    '''
+    The original process_iso_duration() code.
+    '''
+    duration_regex = r"PT(?P<hours>\d{1,2}H)?(?P<minutes>\d{1,2}M)?" +\
+                     r"(?P<seconds>\d{1,2}(\.\d+)?S)?"
+    dur_match = re.match(duration_regex, in_string)
+    if dur_match is not None:
+        in_hours = 0
+        in_minutes = 0
+        in_seconds = 0
+        if dur_match.group('hours') is not None:
+            in_hours = int(dur_match.group('hours').rstrip('H'))
+        if dur_match.group('minutes') is not None:
+            in_minutes = int(dur_match.group('minutes').rstrip('M'))
+        if dur_match.group('seconds') is not None:
+            in_seconds = float(dur_match.group('seconds').rstrip('S'))
+        return timedelta(hours=in_hours, minutes=in_minutes,
+                         seconds=in_seconds)
+    return None
+
+
+def uncached_duration(in_string):
+    '''
+    xs_duration() without the cache.
+    '''
+    return _parse_duration.__wrapped__(in_string.strip())
+
+
+def main():
+    '''
+    Run the benchmarks and print the results.
+    '''
+    rand = random.Random(1)
+    runtimes = [f"PT{rand.randint(1, 9)}M{rand.randint(0, 59):02d}S"
+                for _ in range(50000)]
+    runtimes += [f"PT1H{rand.randint(0, 59):02d}M" for _ in range(5000)]
+    print(f"{len(set(runtimes))} unique of {len(runtimes)} values")
+    for func in [old_duration, uncached_duration, xs_duration]:
+        elapsed = timeit.timeit(
+                lambda f=func: [f(val) for val in runtimes], number=5)
+        print(f"{func.__name__:20s} {elapsed:8.4f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Benchmark of the memory used by a large library.
+
+Builds a synthetic library of movies in memory, each with a
+cast, keywords and a barcode, and reports the bytes used per
+movie once every object has been built.
+
+Run with:  PYTHONPATH=src python -m test.benchmark.bench_memory [count]
+'''
+
+import gc
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from media.data.media import Media
+from media.data.media.profile import ParseProfile
+from media.general.stringpool import StringPool
+
+MOVIE = '''<media xmlns='http://vectortron.com/xml/media/media'>
+ <title><main>Sample Movie {index}</main></title>
+ <medium>
+  <release><type><dvd/></type></release>
+  <productId><barcode type='upc'>{barcode:012d}</barcode></productId>
+ </medium>
+ <contents>
+  <movie xmlns='http://vectortron.com/xml/media/movie'>
+   <title>Sample Movie {index}</title>
+   <catalog><copyright><year>{year}</year></copyright></catalog>
+   <classification><genres><primary>{genre}</primary></genres></classification>
+   <technical><runtime><overall>PT1H{minutes:02d}M</overall></runtime></technical>
+   <story>
+    <plot>Something happens in movie {index}.</plot>
+    <keywords>
+     <generic>hotel</generic>
+     <generic>bank robbery</generic>
+     <properNoun><place><ci>Miami</ci><st>Florida</st></place></properNoun>
+     <properNoun><person><gn>Josh</gn><fn>Gallant</fn></person></properNoun>
+    </keywords>
+   </story>
+   <crew>
+    <directors><director><gn>Marty</gn><fn>Goofus{director}</fn></director>
+    </directors>
+    <cast>{cast}</cast>
+   </crew>
+  </movie>
+ </contents>
+</media>
+'''
+
+ROLE = '''
+     <role><actor><gn>Actor</gn><fn>Number{actor}</fn></actor>
+      <character><name><gn>Part</gn><fn>{part}</fn></name></character>
+     </role>
+     <role><actor><gn>Extra</gn><fn>Number{actor}</fn></actor>
+      <character><unnamed>Cop {part}</unnamed></character><self/>
+     </role>'''
+
+GENRES = ['Drama', 'Comedy', 'Horror', 'Western']
+
+
+def movie_xml(in_index):
+    '''
+    Build the XML for one media object with a movie.
+    '''
+    cast = ''.join(ROLE.format(actor=(in_index * 7 + idx) % 5000,
+                               part=idx) for idx in range(5))
+    return MOVIE.format(index=in_index, barcode=in_index,
+                        year=1930 + in_index % 90,
+                        genre=GENRES[in_index % 4],
+                        minutes=in_index % 60,
+                        director=in_index % 500, cast=cast)
+
+
+def build_library(in_count):
+    '''
+    Build the media objects, with every subtree built.
+    '''
+    out = []
+    with StringPool():
+        for idx in range(in_count):
+            out.append(Media(ET.fromstring(movie_xml(idx)),
+                             ParseProfile.FULL))
+    return out
+
+
+def main():
+    '''
+    Build the library and print the memory used.
+    '''
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    library = build_library(count)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{'movies':20s} {len(library):10d}")
+    print(f"{'build time':20s} {elapsed:10.2f}s")
+    print(f"{'total bytes':20s} {used:10d}")
+    print(f"{'bytes per movie':20s} {used // count:10d}")
+
+
+if __name__ == '__main__':
+    main()
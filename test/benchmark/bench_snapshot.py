@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Benchmark of tool startup from a snapshot file.
+
+Builds a sample library on disk, then compares a cold scan
+and XML load of the repo against opening a snapshot of it,
+both for a report that only needs the MovieTable and for one
+that reads every movie.
+
+Run with:  PYTHONPATH=src python -m test.benchmark.bench_snapshot [count]
+'''
+
+# pylint: disable=wrong-import-order
+
+import os
+import sys
+import tempfile
+import timeit
+from media.data.media.profile import ParseProfile
+from media.fileops.repo import Repo
+from media.fileops.snapshot import Snapshot, SnapshotRepo
+from media.general.sorting.table import MovieTable
+from test.media.fileops.samples import build_library
+
+
+def xml_load(in_root):
+    '''
+    Scan and load the repo, then read every movie.
+    '''
+    repo = Repo(in_root)
+    repo.scan()
+    repo.load()
+    return MovieTable(repo.get_movies())
+
+
+def snapshot_table(in_path):
+    '''
+    Open the snapshot and use the saved table.
+    '''
+    return SnapshotRepo.open(in_path).movie_table()
+
+
+def snapshot_all(in_path):
+    '''
+    Open the snapshot and read every movie.
+    '''
+    return MovieTable(SnapshotRepo.open(in_path).get_movies())
+
+
+def main():
+    '''
+    Run the benchmarks and print the results.
+    '''
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = os.path.join(tmpdir, 'library')
+        path = os.path.join(tmpdir, 'library.snap')
+        build_library(root, movies=count, albums=count // 10)
+        repo = Repo(root)
+        repo.scan()
+        repo.load(profile=ParseProfile.FULL)
+        Snapshot.write(repo, path)
+        print(f"{'snapshot size':20s} {os.path.getsize(path):10d} bytes")
+        for (name, func, arg) in [('xml load', xml_load, root),
+                                  ('snapshot table', snapshot_table, path),
+                                  ('snapshot all', snapshot_all, path)]:
+            elapsed = min(timeit.repeat(lambda f=func, a=arg: f(a),
+                                        number=1, repeat=3))
+            print(f"{name:20s} {elapsed:10.4f}s")
+
+
+if __name__ == '__main__':
+    main()
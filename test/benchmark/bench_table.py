@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Benchmark of the MovieTable column operations.
+
+Builds synthetic movie index entries, then compares genre
+counts, decade grouping, runtime sorting and runtime buckets
+done over the entry objects against the same reports done
+over the columns of a MovieTable.
+
+Run with:  PYTHONPATH=src python -m test.benchmark.bench_table [count]
+'''
+
+import random
+import sys
+import timeit
+from datetime import timedelta
+from types import SimpleNamespace
+from media.general.sorting.groups import GroupDecade
+from media.general.sorting.table import MovieTable, numpy
+
+GENRES = ['Drama', 'Comedy', 'Horror', 'Western', 'Musical', 'Crime']
+BUCKETS = 10
+
+
+def build_entries(in_count):
+    '''
+    Build index entries with the fields the table reads.
+    '''
+    rand = random.Random(1)
+    out = []
+    for _ in range(in_count):
+        year = rand.randint(1920, 2025)
+        out.append(SimpleNamespace(
+            movie=None, year=year, decade=year // 10,
+            primary_g=rand.choice(GENRES),
+            first_letter=rand.choice('abcdefghijklmnopqrstuvwxyz'),
+            runtime=timedelta(seconds=rand.randint(3600, 10800))))
+    return out
+
+
+def object_reports(in_entries):
+    '''
+    The reports done by walking the entry objects.
+    '''
+    genres = {}
+    for entry in in_entries:
+        genres[entry.primary_g] = genres.get(entry.primary_g, 0) + 1
+    GroupDecade.group(in_entries)
+    ordered = sorted(in_entries, key=lambda x: x.runtime)
+    shortest = ordered[0].runtime
+    width = timedelta(seconds=int((ordered[-1].runtime -
+                                   shortest).total_seconds() / BUCKETS) + 1)
+    buckets = [[] for _ in range(BUCKETS)]
+    for entry in ordered:
+        for slot in range(BUCKETS):
+            if entry.runtime < shortest + width * (slot + 1):
+                buckets[slot].append(entry)
+                break
+    return sum(entry.runtime.total_seconds() for entry in ordered)
+
+
+def table_reports(in_table):
+    '''
+    The same reports done over the table columns.
+    '''
+    in_table.counts(MovieTable.C_GENRE)
+    in_table.group(MovieTable.C_DECADE)
+    in_table.order(MovieTable.C_RUNTIME)
+    in_table.bucket(MovieTable.C_RUNTIME, BUCKETS)
+    return in_table.total(MovieTable.C_RUNTIME)
+
+
+def main():
+    '''
+    Run the benchmarks and print the results.
+    '''
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    entries = build_entries(count)
+    build = timeit.timeit(lambda: MovieTable.from_index(entries), number=1)
+    table = MovieTable.from_index(entries)
+    print(f"{'numpy':20s} {'yes' if numpy else 'no':>8s}")
+    print(f"{'table build':20s} {build:8.4f}s")
+    for name, func, arg in [('objects', object_reports, entries),
+                            ('table', table_reports, table)]:
+        elapsed = timeit.timeit(lambda f=func, a=arg: f(a), number=3)
+        print(f"{name:20s} {elapsed:8.4f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Benchmark of tag comparisons during a parse.
+
+Compares building the qualified tag for every comparison
+(the old Namespaces.nsf() approach) against the precomputed
+tag tables, then times a full parse of a generated library.
+
+Run with:  PYTHONPATH=src python -m test.benchmark.bench_tags
+'''
+
+# pylint: disable=wrong-import-order
+
+import tempfile
+import timeit
+import xml.etree.ElementTree as ET
+from media.fileops.repo import Repo
+from media.xml.namespaces import Namespaces, Tags
+from test.media.fileops.samples import build_library
+
+NAMES = ['title', 'library', 'medium', 'contents']
+
+
+def compare_built(in_children):
+    '''
+    Compare tags by building every qualified name.
+    '''
+    hits = 0
+    for child in in_children:
+        for name in NAMES:
+            if child.tag == Namespaces.nsf('media') + name:
+                hits += 1
+                break
+    return hits
+
+
+def compare_table(in_children):
+    '''
+    Compare tags against the precomputed constants.
+    '''
+    hits = 0
+    table = [getattr(Tags.media, name) for name in NAMES]
+    for child in in_children:
+        for tag in table:
+            if child.tag == tag:
+                hits += 1
+                break
+    return hits
+
+
+def strip_split(in_children):
+    '''
+    Strip namespaces by splitting every tag.
+    '''
+    return [child.tag.split('}', 1)[1] for child in in_children]
+
+
+def strip_cached(in_children):
+    '''
+    Strip namespaces through the cached map.
+    '''
+    return [Namespaces.ns_strip(child.tag) for child in in_children]
+
+
+def main():
+    '''
+    Run the benchmarks and print the results.
+    '''
+    children = [ET.Element(Namespaces.nsf('media') + NAMES[idx % 4])
+                for idx in range(10000)]
+    for func in [compare_built, compare_table, strip_split, strip_cached]:
+        elapsed = timeit.timeit(lambda f=func: f(children), number=50)
+        print(f"{func.__name__:20s} {elapsed:8.4f}s")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        build_library(tmpdir, movies=2000, albums=200)
+        repo = Repo(tmpdir)
+        repo.scan()
+        elapsed = timeit.timeit(repo.load, number=3) / 3
+        print(f"{'library load':20s} {elapsed:8.4f}s " +
+              f"({len(repo.media)} media objects)")
+
+
+if __name__ == '__main__':
+    main()
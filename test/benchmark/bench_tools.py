@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Benchmark of the tools that merge objects in dictionaries.
+
+Builds the synthetic movie library from bench_memory, then
+times the cast, crew name and keyword lists and the movie
+comparator, which key their dictionaries on names, keywords
+and movies.
+
+Run with:  PYTHONPATH=src python -m test.benchmark.bench_tools [count]
+'''
+
+# pylint: disable=wrong-import-order
+
+import sys
+import timeit
+from media.general.compare.movie import MovieComparator
+from media.tools.movies.castlist import grab_cast_names
+from media.tools.movies.namelist import grab_crew_names
+from media.tools.movies.keywordlist import grab_keywords
+from test.benchmark.bench_memory import build_library
+
+COMPARE_LIMIT = 300
+
+
+def compare(in_movies):
+    '''
+    Run the comparator over the movies.
+    '''
+    comparator = MovieComparator()
+    comparator.load_data(in_movies[:COMPARE_LIMIT])
+    comparator.compare()
+    return comparator.results
+
+
+def main():
+    '''
+    Run the benchmarks and print the results.
+    '''
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    movies = [content for item in build_library(count)
+              for content in item.contents]
+    for func in [grab_cast_names, grab_crew_names, grab_keywords]:
+        entries = len(func(movies))
+        elapsed = timeit.timeit(lambda f=func: f(movies), number=5)
+        print(f"{func.__name__:20s} {elapsed:8.4f}s {entries:8d} entries")
+    elapsed = timeit.timeit(lambda: compare(movies), number=1)
+    print(f"{'compare':20s} {elapsed:8.4f}s "
+          f"{min(count, COMPARE_LIMIT):8d} movies")
+
+
+if __name__ == '__main__':
+    main()
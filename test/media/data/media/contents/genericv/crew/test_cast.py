@@ -26,9 +26,13 @@
 
 # pylint: disable=R0801
 
+import copy
+import pickle
 import unittest
 import xml.etree.ElementTree as ET
 from media.data.media.contents.movie import Movie
+from media.data.nouns import PersonalName
+from media.general.stringpool import StringPool
 from media.data.media.contents.genericv.crew.cast import (
         Cast, Role, Actor, PortraysNamedCharacter, PortraysBackground,
         PortraysAdditionalVoices, PortraysNarrator, PortraysSelf,
@@ -292,5 +296,86 @@ class TestPortraysNamedCharacter(unittest.TestCase):
         self.assertEqual(self.cast[1].portrays[0].variant, 'old')
 
 
+class TestCastSlots(unittest.TestCase):
+    '''
+    Cast objects use slots in place of instance dictionaries.
+    '''
+    def setUp(self):
+        xmlroot = ET.fromstring(CASE1)
+        self.cast = Movie(xmlroot).crew.cast.cast
+
+    def test_no_dict(self):
+        '''
+        Roles, actors and portrayals should not have a __dict__.
+        '''
+        for role in self.cast:
+            self.assertFalse(hasattr(role, '__dict__'))
+            self.assertFalse(hasattr(role.actor, '__dict__'))
+            for portrays in role.portrays:
+                self.assertFalse(hasattr(portrays, '__dict__'))
+
+    def test_pickle(self):
+        '''
+        Slotted objects should survive pickling and copying.
+        '''
+        for clone in [pickle.loads(pickle.dumps(self.cast)),
+                      copy.deepcopy(self.cast)]:
+            self.assertEqual([str(role.actor) for role in clone],
+                             [str(role.actor) for role in self.cast])
+            self.assertEqual(clone[1].portrays[0].variant, 'old')
+            self.assertEqual(clone[0].actor.archival_footage,
+                             self.cast[0].actor.archival_footage)
+
+
+SHARED = '''<?xml version='1.0'?>
+<cast xmlns='http://vectortron.com/xml/media/movie'>
+ <role><actor><gn>Marty</gn><fn>Goofus</fn></actor><narrator/></role>
+ <role><actor archivalFootage='true'><gn>Marty</gn><fn>Goofus</fn></actor>
+  <self/></role>
+ <role><actor><gn>Josh</gn><fn>Gallant</fn></actor><narrator/></role>
+</cast>
+'''
+
+
+class TestSharedActors(unittest.TestCase):
+    '''
+    Actors share one name object per person during a load.
+    '''
+    def test_shared_person(self):
+        '''
+        The same name should be one object, with the credit
+        data kept apart.
+        '''
+        with StringPool():
+            cast = Cast(ET.fromstring(SHARED)).cast
+        self.assertIs(cast[0].actor.person, cast[1].actor.person)
+        self.assertIsNot(cast[0].actor.person, cast[2].actor.person)
+        self.assertFalse(cast[0].actor.archival_footage)
+        self.assertTrue(cast[1].actor.archival_footage)
+        self.assertIsInstance(cast[0].actor.person, PersonalName)
+
+    def test_no_pool(self):
+        '''
+        Without an active pool every credit gets its own name.
+        '''
+        cast = Cast(ET.fromstring(SHARED)).cast
+        self.assertIsNot(cast[0].actor.person, cast[1].actor.person)
+        self.assertEqual(cast[0].actor, cast[1].actor)
+
+    def test_name_attributes(self):
+        '''
+        Name attributes and comparisons go through to the person.
+        '''
+        cast = Cast(ET.fromstring(SHARED)).cast
+        actor = cast[0].actor
+        self.assertEqual(actor.family, 'Goofus')
+        self.assertEqual(actor.sort_value, 'goofus_marty')
+        self.assertEqual(str(actor), 'Marty Goofus')
+        self.assertEqual(actor, actor.person)
+        self.assertEqual(hash(actor), hash(actor.person))
+        self.assertLess(cast[2].actor, actor)
+        self.assertGreater(actor, cast[2].actor)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for parse profiles.'''
+
+# pylint: disable=R0801
+# pylint: disable=wrong-import-order
+# pylint: disable=consider-using-with
+
+import pickle
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from datetime import timedelta
+from media.data.media import Media
+from media.data.media.contents.movie import Movie
+from media.data.media.contents.genericv.crew import Crew
+from media.data.media.profile import ParseProfile, Deferred
+from media.fileops.loader import Loader
+from media.fileops.repo import Repo
+from test.media.fileops.samples import build_library, write_movie
+
+CASE1 = '''<?xml version='1.0'?>
+<movie xmlns='http://vectortron.com/xml/media/movie'>
+ <title>Superfast Supercars</title>
+ <catalog><copyright><year>1994</year></copyright></catalog>
+ <story><plot>Cars go fast.</plot></story>
+ <variants>
+  <original id='orig'/>
+  <variant id='unrated'>
+   <name>Unrated Edition</name>
+   <technical><runtime><overall>PT2H12M05S</overall></runtime></technical>
+  </variant>
+ </variants>
+ <crew>
+  <directors>
+   <director><gn>Marty</gn><fn>Goofus</fn></director>
+   <director><gn>Josh</gn><fn>Gallant</fn></director>
+  </directors>
+  <cast>
+   <role><actor><gn>Josh</gn><fn>Gallant</fn></actor><narrator/></role>
+  </cast>
+ </crew>
+</movie>
+'''
+
+CASE2 = '''<?xml version='1.0'?>
+<media xmlns='http://vectortron.com/xml/media/media'>
+ <title><main>Superfast Supercars</main></title>
+ <medium><release><type><dvd/></type></release></medium>
+ <library>
+  <instances><instance><localId>7</localId></instance></instances>
+ </library>
+ <contents>
+''' + CASE1.split('\n', 1)[1] + '''
+ </contents>
+</media>
+'''
+
+
+class TestParseProfile(unittest.TestCase):
+    '''
+    Parse profile objects.
+    '''
+    def test_presets(self):
+        '''
+        The preset profiles should want the expected fields.
+        '''
+        self.assertTrue(ParseProfile.FULL.wants(ParseProfile.CREW))
+        self.assertFalse(ParseProfile.INDEX.wants(ParseProfile.CREW))
+        self.assertTrue(ParseProfile.MEDIA_LIST.wants(ParseProfile.MEDIUM))
+        self.assertFalse(ParseProfile.MEDIA_LIST.wants(ParseProfile.STORY))
+
+    def test_equality(self):
+        '''
+        Profiles with the same fields should be equal.
+        '''
+        self.assertEqual(ParseProfile(), ParseProfile.FULL)
+        self.assertEqual(ParseProfile([]), ParseProfile.INDEX)
+        self.assertNotEqual(ParseProfile.INDEX, ParseProfile.MEDIA_LIST)
+
+
+class TestDeferredMovie(unittest.TestCase):
+    '''
+    Movies loaded with only part of their subtrees built.
+    '''
+    def setUp(self):
+        self.full = Movie(ET.fromstring(CASE1), ParseProfile.FULL)
+        self.index = Movie(ET.fromstring(CASE1), ParseProfile.INDEX)
+
+    def test_fields_deferred(self):
+        '''
+        The skipped fields should not be built during the load.
+        '''
+        for field in ['crew', 'story', 'variants']:
+            self.assertIsInstance(self.index.__dict__[field], Deferred)
+            self.assertNotIsInstance(self.full.__dict__[field], Deferred)
+
+    def test_default_profile(self):
+        '''
+        Without a profile, everything is built during the load.
+        '''
+        movie = Movie(ET.fromstring(CASE1))
+        for field in ['crew', 'story', 'variants']:
+            self.assertNotIsInstance(movie.__dict__[field], Deferred)
+        self.assertEqual(len(movie.crew.cast.cast), 1)
+
+    def test_serialized(self):
+        '''
+        Deferred fields are kept and pickled as bytes.
+        '''
+        self.assertIsInstance(self.index.__dict__['crew'].data, bytes)
+        self.assertFalse(hasattr(self.index.__dict__['crew'], 'element'))
+        copy = pickle.loads(pickle.dumps(self.index))
+        self.assertIsInstance(copy.__dict__['crew'].data, bytes)
+        self.assertEqual(len(copy.crew.directors), 2)
+        self.assertEqual(copy.unique_key.value, self.index.unique_key.value)
+
+    def test_unique_key(self):
+        '''
+        The unique key should not depend on the profile.
+        '''
+        self.assertEqual(self.full.unique_key.value,
+                         self.index.unique_key.value)
+        self.assertEqual(self.full.unique_key.extra,
+                         self.index.unique_key.extra)
+        self.assertIsInstance(self.index.__dict__['crew'], Deferred)
+
+    def test_repeated_directors(self):
+        '''
+        With more than one directors element, the unique key
+        should use the same one as the full crew.
+        '''
+        case = CASE1.replace(
+            ' </crew>',
+            '  <directors><director><gn>Ann</gn><fn>Other</fn></director>'
+            '</directors>\n </crew>')
+        full = Movie(ET.fromstring(case), ParseProfile.FULL)
+        index = Movie(ET.fromstring(case), ParseProfile.INDEX)
+        self.assertEqual(len(full.crew.directors), 1)
+        self.assertEqual(full.unique_key.value, index.unique_key.value)
+        self.assertEqual(full.unique_key.extra, index.unique_key.extra)
+
+    def test_runtime(self):
+        '''
+        The variant runtime should be found without keeping
+        the variants.
+        '''
+        self.assertEqual(self.index.default_runtime,
+                         timedelta(hours=2, minutes=12, seconds=5))
+        self.assertIsInstance(self.index.__dict__['variants'], Deferred)
+
+    def test_build_on_access(self):
+        '''
+        Deferred fields should be built the first time they are used.
+        '''
+        crew = self.index.crew
+        self.assertIsInstance(crew, Crew)
+        self.assertIs(self.index.crew, crew)
+        self.assertEqual(len(crew.directors), 2)
+        self.assertEqual(len(crew.cast.cast), 1)
+        self.assertEqual(str(self.index.story.plot), 'Cars go fast.')
+        self.assertEqual(len(self.index.variants), 2)
+
+    def test_missing_story(self):
+        '''
+        A movie without a story should have a None story.
+        '''
+        movie = Movie(ET.fromstring(
+            "<movie xmlns='http://vectortron.com/xml/media/movie'>"
+            "<title>Nothing</title></movie>"), ParseProfile.INDEX)
+        self.assertIsNone(movie.story)
+        self.assertIsNone(movie.crew)
+        self.assertEqual(movie.variants, [])
+
+
+class TestDeferredMedia(unittest.TestCase):
+    '''
+    Media objects pass their profile on to the contents.
+    '''
+    def test_media_list(self):
+        '''
+        The media list profile builds the medium and library only.
+        '''
+        m_dev = Media(ET.fromstring(CASE2), ParseProfile.MEDIA_LIST)
+        self.assertNotIsInstance(m_dev.__dict__['medium'], Deferred)
+        self.assertNotIsInstance(m_dev.__dict__['library'], Deferred)
+        movie = m_dev.contents[0]
+        self.assertIsInstance(movie.__dict__['crew'], Deferred)
+
+    def test_index(self):
+        '''
+        The index profile defers the medium and library as well.
+        '''
+        m_dev = Media(ET.fromstring(CASE2), ParseProfile.INDEX)
+        self.assertIsInstance(m_dev.__dict__['medium'], Deferred)
+        self.assertIsInstance(m_dev.__dict__['library'], Deferred)
+        self.assertIsNotNone(m_dev.medium.release)
+        self.assertEqual(m_dev.library.instances[0].local_id, '7')
+
+
+class TestRepoProfile(unittest.TestCase):
+    '''
+    Loading a repo with a parse profile.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        build_library(self.tmpdir.name, movies=6, albums=2)
+        self.repo = Repo(self.tmpdir.name)
+        self.repo.scan()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def check_profile(self, in_workers, in_mode):
+        '''
+        Compare a full load against an index load.
+        '''
+        self.repo.load()
+        full = [(str(con.title), con.unique_key.value,
+                 len(con.crew.directors))
+                for con in self.repo.get_movies()]
+        self.repo.load(workers=in_workers, mode=in_mode,
+                       profile=ParseProfile.INDEX)
+        index = [(str(con.title), con.unique_key.value,
+                  len(con.crew.directors))
+                 for con in self.repo.get_movies()]
+        self.assertEqual(full, index)
+
+    def test_default_reports_errors(self):
+        '''
+        A broken subtree fails the load of its file by default,
+        so it gets reported as a LoadError.
+        '''
+        broken = write_movie(self.tmpdir.name, 9)
+        with open(broken, 'r', encoding='utf-8') as m_in:
+            data = m_in.read()
+        data = data.replace('<catalog>', '<story><keywords><properNoun/>' +
+                            '</keywords></story><catalog>', 1)
+        with open(broken, 'w', encoding='utf-8') as m_out:
+            m_out.write(data)
+        self.repo.scan()
+        self.repo.load(strict=False)
+        self.assertEqual([err.filename for err in self.repo.errors],
+                         [broken])
+
+    def test_serial(self):
+        '''
+        Serial loads should give the same content.
+        '''
+        self.check_profile(None, Loader.PROCESS)
+
+    def test_processes(self):
+        '''
+        Deferred fields should survive a worker process.
+        '''
+        self.check_profile(2, Loader.PROCESS)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Property tests for the hash and equality contracts of the
+objects used as dictionary keys by the tools.
+
+The inputs are drawn from a seeded generator, so every run
+checks the same cases.
+'''
+
+# pylint: disable=R0801
+
+import random
+import unittest
+import xml.etree.ElementTree as ET
+from media.data.nouns import PersonalName
+from media.data.media.contents.generic.keywords import Keywords
+from media.data.media.contents.genericv.crew.cast import (
+        PortraysNamedCharacter, PortraysUnnamedCharacter
+        )
+from media.data.media.contents.movie import Movie
+from media.data.media.contents.movie.unique import MovieUniqueKey
+
+SEED = 1023
+ROUNDS = 200
+GIVEN = ['Josh', 'Marty', 'Bettle', 'Ann', 'Zoe']
+FAMILY = ['Gallant', 'Goofus', 'Swayze', 'Stanwick']
+WORDS = ['hotel', 'bank robbery', 'Hotel', 'baseball', 'train']
+NS = 'http://vectortron.com/xml/media/movie'
+
+
+def name_xml(in_rand):
+    '''
+    Build a random name, which may only have a given name.
+    '''
+    out = f"<gn>{in_rand.choice(GIVEN)}</gn>"
+    if in_rand.random() < 0.8:
+        out += f"<fn>{in_rand.choice(FAMILY)}</fn>"
+    return out
+
+
+class ContractMixin():
+    '''
+    Shared checks for the hash and equality contracts.
+    '''
+    def assert_contract(self, in_objects):
+        '''
+        Assert equal objects hash the same, and that equality
+        is reflexive and symmetric.
+        '''
+        for obj_a in in_objects:
+            self.assertEqual(obj_a, obj_a)
+            for obj_b in in_objects:
+                self.assertEqual(obj_a == obj_b, obj_b == obj_a)
+                if obj_a == obj_b:
+                    self.assertEqual(hash(obj_a), hash(obj_b))
+
+    def assert_merge(self, in_objects, in_key):
+        '''
+        Assert a dictionary merges the objects into one entry
+        per distinct key value.
+        '''
+        merged = {}
+        for obj in in_objects:
+            merged[obj] = merged.get(obj, 0) + 1
+        self.assertEqual(len(merged), len({in_key(o) for o in in_objects}))
+        self.assertEqual(sum(merged.values()), len(in_objects))
+
+
+class TestNameContract(unittest.TestCase, ContractMixin):
+    '''
+    Hash and equality of personal names.
+    '''
+    def setUp(self):
+        rand = random.Random(SEED)
+        self.names = [PersonalName(ET.fromstring(
+                      f"<name xmlns='{NS}'>{name_xml(rand)}</name>"))
+                      for _ in range(ROUNDS)]
+
+    def test_contract(self):
+        '''
+        Assert equal names have equal hashes.
+        '''
+        self.assert_contract(self.names)
+
+    def test_merge(self):
+        '''
+        Assert names merge on the sort value.
+        '''
+        self.assert_merge(self.names, lambda n: n.sort_value)
+
+    def test_foreign_compare(self):
+        '''
+        Assert a name is not equal to an unrelated object.
+        '''
+        self.assertNotEqual(self.names[0], 'josh')
+
+
+class TestKeywordContract(unittest.TestCase, ContractMixin):
+    '''
+    Hash and equality of generic and proper noun keywords.
+    '''
+    def setUp(self):
+        rand = random.Random(SEED)
+        body = ''
+        for _ in range(ROUNDS):
+            rel = rand.choice(['', " relevance='1'", " relevance='5'"])
+            if rand.random() < 0.5:
+                body += f"<generic{rel}>{rand.choice(WORDS)}</generic>"
+            else:
+                body += f"<properNoun{rel}><person>{name_xml(rand)}" + \
+                        "</person></properNoun>"
+        self.keywords = Keywords(ET.fromstring(
+                        f"<keywords xmlns='{NS}'>{body}</keywords>")).all()
+
+    def test_contract(self):
+        '''
+        Assert equal keywords have equal hashes.
+        '''
+        self.assert_contract(self.keywords)
+
+    def test_merge(self):
+        '''
+        Assert keywords merge on the relevance and sort value.
+        '''
+        self.assert_merge(self.keywords,
+                          lambda k: (k.relevance, k.sort_value))
+
+    def test_hash_is_cached(self):
+        '''
+        Assert the hash is only worked out once.
+        '''
+        keyword = self.keywords[0]
+        self.assertEqual(hash(keyword), keyword._hash)  # pylint: disable=W0212
+
+
+class TestPortraysContract(unittest.TestCase, ContractMixin):
+    '''
+    Hash and equality of character portrayals.
+    '''
+    def setUp(self):
+        rand = random.Random(SEED)
+        self.portrays = []
+        for _ in range(ROUNDS):
+            if rand.random() < 0.7:
+                self.portrays.append(PortraysNamedCharacter(ET.fromstring(
+                    f"<character xmlns='{NS}'><name>{name_xml(rand)}" +
+                    "</name></character>")))
+            else:
+                self.portrays.append(PortraysUnnamedCharacter(ET.fromstring(
+                    f"<character xmlns='{NS}'><unnamed>" +
+                    f"{rand.choice(WORDS)}</unnamed></character>")))
+
+    def test_contract(self):
+        '''
+        Assert equal portrayals have equal hashes.
+        '''
+        self.assert_contract(self.portrays)
+
+    def test_merge(self):
+        '''
+        Assert portrayals merge on the sort value.
+        '''
+        self.assert_merge(self.portrays, lambda p: p.sort_value)
+
+
+class TestUniqueKeyContract(unittest.TestCase, ContractMixin):
+    '''
+    Hash and equality of movie unique keys.
+    '''
+    def setUp(self):
+        rand = random.Random(SEED)
+        self.keys = []
+        for _ in range(ROUNDS // 4):
+            xml = f"<movie xmlns='{NS}'><title>{rand.choice(WORDS)}" + \
+                  "</title><catalog><copyright><year>" + \
+                  f"{rand.choice([1980, 1981])}</year></copyright>" + \
+                  "</catalog><crew><directors><director>" + \
+                  f"{name_xml(rand)}</director></directors></crew></movie>"
+            self.keys.append(MovieUniqueKey(Movie(ET.fromstring(xml))))
+
+    def test_contract(self):
+        '''
+        Assert equal keys have equal hashes.
+        '''
+        self.assert_contract(self.keys)
+
+    def test_merge(self):
+        '''
+        Assert keys merge on the full string.
+        '''
+        self.assert_merge(self.keys, lambda k: k.full())
+
+    def test_value_reset(self):
+        '''
+        Assert setting the value drops the cached identity.
+        '''
+        key = self.keys[0]
+        before = hash(key)
+        key.value = key.value + '-x'
+        self.assertTrue(key.full().endswith('-x'))
+        self.assertNotEqual(hash(key), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
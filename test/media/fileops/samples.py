@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''
+Sample media library used by the file operation tests.
+'''
+
+import os
+
+MOVIE_TEMPLATE = '''<?xml version='1.0'?>
+<mediaList xmlns='http://vectortron.com/xml/media/media'
+ xmlns:xi='http://www.w3.org/2001/XInclude'>
+ <media>
+  <title><main>{title}</main></title>
+  <medium><release><type><dvd/></type></release></medium>
+  <library>
+   <instances><instance><localId>{index}</localId></instance></instances>
+  </library>
+  <contents>
+   <movie xmlns='http://vectortron.com/xml/media/movie'>
+    <title>{title}</title>
+    <catalog><copyright><year>{year}</year></copyright></catalog>
+    <classification>
+     <genres><primary>{genre}</primary></genres>
+    </classification>
+    <technical><runtime><overall>PT1H{minutes:02d}M</overall></runtime>
+    </technical>
+    <xi:include href='crew.xml'/>
+   </movie>
+  </contents>
+ </media>
+</mediaList>
+'''
+
+CREW_TEMPLATE = '''<?xml version='1.0'?>
+<crew xmlns='http://vectortron.com/xml/media/movie'>
+ <directors><director><gn>Marty</gn><fn>Goofus{index}</fn></director>
+ </directors>
+ <cast>
+  <role><actor><gn>Josh</gn><fn>Gallant</fn></actor><narrator/></role>
+ </cast>
+</crew>
+'''
+
+ALBUM_TEMPLATE = '''<?xml version='1.0'?>
+<mediaList xmlns='http://vectortron.com/xml/media/media'>
+ <media>
+  <title><main>{title}</main></title>
+  <medium><release><type><audiocd/></type></release></medium>
+  <contents>
+   <album xmlns='http://vectortron.com/xml/media/audio'>
+    <title>{title}</title>
+    <catalog>
+     <artists><artist><grp>The Examples</grp></artist></artists>
+     <copyright><year>{year}</year></copyright>
+    </catalog>
+    <elements>
+     <song>
+      <title><main>Track One</main></title>
+      <technical><runtime><overall>PT3M{index:02d}S</overall></runtime>
+      </technical>
+     </song>
+    </elements>
+   </album>
+  </contents>
+ </media>
+</mediaList>
+'''
+
+GENRES = ['Drama', 'Comedy', 'Horror', 'Western']
+
+
+def movie_title(index):
+    '''
+    Title of a sample movie.
+    '''
+    return f"Sample Movie {index:03d}"
+
+
+def write_movie(in_root, index, title=None):
+    '''
+    Write out a single movie media file, with a crew
+    file in the same directory that gets included.
+    Returns the path of the media file.
+    '''
+    if title is None:
+        title = movie_title(index)
+    m_dir = os.path.join(in_root, 'movies', f"m{index:03d}")
+    os.makedirs(m_dir, exist_ok=True)
+    m_file = os.path.join(m_dir, f"movie{index:03d}-dvd.xml")
+    with open(m_file, 'w', encoding='utf-8') as m_out:
+        m_out.write(MOVIE_TEMPLATE.format(title=title, index=index,
+                                          year=1950 + index % 70,
+                                          genre=GENRES[index % 4],
+                                          minutes=index % 60))
+    with open(os.path.join(m_dir, 'crew.xml'), 'w',
+              encoding='utf-8') as c_out:
+        c_out.write(CREW_TEMPLATE.format(index=index))
+    return m_file
+
+
+def write_album(in_root, index):
+    '''
+    Write out a single album media file.
+    '''
+    a_dir = os.path.join(in_root, 'albums', f"a{index:03d}")
+    os.makedirs(a_dir, exist_ok=True)
+    a_file = os.path.join(a_dir, f"album{index:03d}-audiocd.xml")
+    with open(a_file, 'w', encoding='utf-8') as a_out:
+        a_out.write(ALBUM_TEMPLATE.format(title=f"Sample Album {index:03d}",
+                                          year=1960 + index % 60,
+                                          index=index % 60))
+    return a_file
+
+
+def build_library(in_root, movies=20, albums=4):
+    '''
+    Build a complete sample library under the root directory.
+    '''
+    for idx in range(movies):
+        write_movie(in_root, idx)
+    for idx in range(albums):
+        write_album(in_root, idx)
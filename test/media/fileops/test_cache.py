@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the on-disk parse cache.'''
+
+# pylint: disable=R0801
+# pylint: disable=wrong-import-order
+# pylint: disable=consider-using-with
+
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+from media.data.media.contents.movie import Movie
+from media.data.media.profile import ParseProfile, Deferred
+from media.fileops.cache import ParseCache
+from media.fileops.filenames import FilenameMatches
+from media.fileops.loader import Loader
+from media.fileops.repo import Repo
+from test.media.fileops.samples import build_library, write_movie
+
+
+class TestParseCache(unittest.TestCase):
+    '''
+    Cache hits and misses for a sample library.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmpdir.name, 'library')
+        build_library(self.root)
+        self.cache = ParseCache(os.path.join(self.tmpdir.name, 'cache'))
+        self.repo = Repo(self.root)
+        self.repo.scan()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_cold_load_writes(self):
+        '''
+        The first load should miss and write every file.
+        '''
+        self.repo.load(cache=self.cache)
+        self.assertEqual(self.cache.misses, 24)
+        self.assertEqual(self.cache.writes, 24)
+
+    def test_warm_load(self):
+        '''
+        The second load should be served from the cache.
+        '''
+        Loader(cache=self.cache).load_media(self.repo)
+        loader = Loader(cache=ParseCache(self.cache.path))
+        m_obj = loader.load_media(self.repo)
+        self.assertEqual(loader.cache.hits, 24)
+        self.assertEqual(loader.parser.file_count, 0)
+        self.assertEqual(sorted(str(med) for med in m_obj),
+                         sorted(str(med) for med in
+                                Loader().load_media(self.repo)))
+
+    def test_warm_signatures(self):
+        '''
+        Files served from the cache keep the signatures taken
+        when they were parsed.
+        '''
+        files = self.repo.file_match(FilenameMatches.Movie_Media)
+        parsed = Loader(cache=self.cache).load_files(files)
+        cached = Loader(cache=ParseCache(self.cache.path)).load_files(files)
+        self.assertEqual([entry[3] for entry in cached],
+                         [entry[3] for entry in parsed])
+        self.assertIn(os.path.realpath(files[0]), cached[0][3])
+
+    def test_modified_file(self):
+        '''
+        A changed source file should be parsed again.
+        '''
+        Loader(cache=self.cache).load_media(self.repo)
+        m_file = write_movie(self.root, 3, 'Replacement Title')
+        os.utime(m_file, ns=(1, 1))
+        cache = ParseCache(self.cache.path)
+        self.repo.load(cache=cache)
+        self.assertEqual(cache.misses, 1)
+        self.assertIn('Replacement Title',
+                      [str(med) for med in self.repo.media])
+
+    def test_modified_include(self):
+        '''
+        A changed include file invalidates the including file.
+        '''
+        Loader(cache=self.cache).load_media(self.repo)
+        m_file = self.repo.file_match(FilenameMatches.Movie_Media)[0]
+        crew_file = os.path.join(os.path.dirname(m_file), 'crew.xml')
+        os.utime(crew_file, ns=(1, 1))
+        self.assertIsNone(ParseCache(self.cache.path).get(m_file))
+
+    def test_profile_entries(self):
+        '''
+        Objects cached with a smaller profile should not be
+        returned to a load that builds everything.
+        '''
+        Loader(cache=self.cache,
+               profile=ParseProfile.INDEX).load_media(self.repo)
+        loader = Loader(cache=ParseCache(self.cache.path))
+        m_obj = loader.load_media(self.repo)
+        self.assertEqual(loader.cache.hits, 0)
+        movies = [con for med in m_obj for con in med.contents
+                  if isinstance(con, Movie)]
+        self.assertTrue(movies)
+        for movie in movies:
+            self.assertNotIsInstance(movie.__dict__['crew'], Deferred)
+        loader = Loader(cache=ParseCache(self.cache.path),
+                        profile=ParseProfile.INDEX)
+        loader.load_media(self.repo)
+        self.assertEqual(loader.cache.hits, 24)
+
+    def _edit_during_parse(self, in_file, in_edited):
+        '''
+        Load a file, appending to another file once the parse
+        is done, and return the cache entry for the first one.
+        '''
+        loader = Loader(cache=self.cache)
+        backend = loader.parser.backend
+        parse = backend.parse
+
+        def parse_and_edit(*args):
+            root = parse(*args)
+            with open(in_edited, 'a', encoding='utf-8') as e_out:
+                e_out.write('\n')
+            return root
+
+        with mock.patch.object(backend, 'parse', parse_and_edit):
+            loader.load_files([in_file])
+        self.assertEqual(self.cache.writes, 1)
+        return ParseCache(self.cache.path).get(in_file)
+
+    def test_changed_during_parse(self):
+        '''
+        A file that changes while it is being parsed should be
+        parsed again on the next load.
+        '''
+        m_file = self.repo.file_match(FilenameMatches.Movie_Media)[0]
+        self.assertIsNone(self._edit_during_parse(m_file, m_file))
+
+    def test_include_changed_during_parse(self):
+        '''
+        An include file that changes after it was read should
+        invalidate the including file.
+        '''
+        m_file = self.repo.file_match(FilenameMatches.Movie_Media)[0]
+        crew_file = os.path.join(os.path.dirname(m_file), 'crew.xml')
+        self.assertIsNone(self._edit_during_parse(m_file, crew_file))
+
+    def test_corrupt_entry(self):
+        '''
+        An unreadable cache entry counts as a miss.
+        '''
+        m_file = self.repo.file_match(FilenameMatches.Movie_Media)[0]
+        self.cache.put(m_file, [])
+        with open(self.cache.entry_path(m_file), 'wb') as c_out:
+            c_out.write(b'garbage')
+        self.assertIsNone(self.cache.get(m_file))
+
+    def test_put_failure(self):
+        '''
+        An entry that can't be written leaves no files behind.
+        '''
+        m_file = self.repo.file_match(FilenameMatches.Movie_Media)[0]
+        e_path = self.cache.entry_path(m_file)
+        with self.assertRaises((pickle.PicklingError, AttributeError,
+                                TypeError)):
+            self.cache.put(m_file, [lambda: None])
+        self.assertEqual(os.listdir(os.path.dirname(e_path)), [])
+        self.assertEqual(self.cache.writes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the media file loader.'''
+
+# pylint: disable=R0801
+# pylint: disable=wrong-import-order
+# pylint: disable=consider-using-with
+
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from media.fileops.cache import ParseCache
+from media.fileops.loader import Loader
+from media.fileops.repo import Repo
+from media.xml.backend import lxml_etree
+from test.media.fileops.samples import build_library, write_movie
+
+# What a broken XML file raises, with either backend
+PARSE_ERRORS = (ET.ParseError,) if lxml_etree is None else \
+    (ET.ParseError, lxml_etree.XMLSyntaxError)
+
+
+class TestLoaderChunks(unittest.TestCase):
+    '''
+    Splitting file lists into chunks.
+    '''
+    def test_chunks_keep_order(self):
+        '''
+        Chunks put back together should match the original list.
+        '''
+        files = [f"file{idx}" for idx in range(23)]
+        chunks = Loader.split_chunks(files, 2)
+        self.assertEqual(sum(chunks, []), files)
+
+    def test_chunk_size(self):
+        '''
+        An explicit chunk size should be honored.
+        '''
+        files = [f"file{idx}" for idx in range(10)]
+        chunks = Loader.split_chunks(files, 2, 3)
+        self.assertEqual([len(chk) for chk in chunks], [3, 3, 3, 1])
+
+
+class TestLoaderParallel(unittest.TestCase):
+    '''
+    Compare a serial load against a parallel load.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        build_library(self.tmpdir.name)
+        self.repo = Repo(self.tmpdir.name)
+        self.repo.scan()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_parallel_matches_serial(self):
+        '''
+        Media objects should come back in the same order.
+        '''
+        serial = Loader().load_media(self.repo)
+        parallel = Loader(workers=2).load_media(self.repo)
+        self.assertEqual([str(med) for med in serial],
+                         [str(med) for med in parallel])
+
+    def test_threaded_matches_serial(self):
+        '''
+        Thread pool loading should give the same results.
+        '''
+        serial = Loader().load_media(self.repo)
+        threaded = Loader(workers=4, mode=Loader.THREAD).load_media(self.repo)
+        self.assertEqual([str(med) for med in serial],
+                         [str(med) for med in threaded])
+
+    def test_working_directory(self):
+        '''
+        Loading files should not change the working directory.
+        '''
+        cwd = os.getcwd()
+        Loader().load_media(self.repo)
+        self.assertEqual(os.getcwd(), cwd)
+
+    def test_parallel_counts(self):
+        '''
+        File and object counts should reflect the whole load.
+        '''
+        loader = Loader(workers=2)
+        m_obj = loader.load_media(self.repo)
+        self.assertEqual(loader.file_count, 24)
+        self.assertEqual(loader.object_count, len(m_obj))
+
+    def test_repo_workers(self):
+        '''
+        The worker count should pass through the repo object.
+        '''
+        self.repo.load(workers=2)
+        self.assertEqual(len(self.repo.get_movies()), 20)
+        self.assertEqual(len(self.repo.get_albums()), 4)
+
+
+class TestLoaderErrors(unittest.TestCase):
+    '''
+    Loading a library with broken files in it.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmpdir.name, 'library')
+        build_library(self.root)
+        self.bad_xml = os.path.join(self.root, 'broken-dvd.xml')
+        with open(self.bad_xml, 'w', encoding='utf-8') as b_out:
+            b_out.write("<?xml version='1.0'?>\n<mediaList>\n<media>\n")
+        self.bad_title = write_movie(self.root, 30, ' ')
+        self.repo = Repo(self.root)
+        self.repo.scan()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_strict(self):
+        '''
+        By default the first broken file stops the load, with
+        the exception it raised.
+        '''
+        with self.assertRaises(PARSE_ERRORS):
+            Loader().load_files([self.bad_xml])
+        with self.assertRaises(IndexError):
+            Loader().load_files([self.bad_title])
+
+    def test_keep_going(self):
+        '''
+        Broken files are reported, and everything else is loaded.
+        '''
+        loader = Loader(strict=False)
+        m_obj = loader.load_media(self.repo)
+        self.assertEqual(len(m_obj), 24)
+        errors = {err.filename: err for err in loader.errors}
+        self.assertEqual(sorted(errors), sorted([self.bad_xml,
+                                                 self.bad_title]))
+        self.assertIn(errors[self.bad_xml].exc_class,
+                      [ET.ParseError.__name__, 'XMLSyntaxError'])
+        self.assertIsNotNone(errors[self.bad_xml].line)
+        self.assertIsNone(errors[self.bad_title].line)
+
+    def test_keep_going_parallel(self):
+        '''
+        Worker processes report the same errors.
+        '''
+        loader = Loader(workers=2, strict=False)
+        m_obj = loader.load_media(self.repo)
+        self.assertEqual(len(m_obj), 24)
+        serial = Loader(strict=False)
+        serial.load_media(self.repo)
+        self.assertEqual([str(err) for err in loader.errors],
+                         [str(err) for err in serial.errors])
+
+    def test_cached_errors(self):
+        '''
+        Known bad files are not parsed again.
+        '''
+        cache = ParseCache(os.path.join(self.tmpdir.name, 'cache'))
+        Loader(cache=cache, strict=False).load_media(self.repo)
+        loader = Loader(cache=ParseCache(cache.path), strict=False)
+        loader.load_media(self.repo)
+        self.assertEqual(loader.parser.file_count, 0)
+        self.assertEqual(len(loader.errors), 2)
+        with self.assertRaises(PARSE_ERRORS):
+            Loader(cache=ParseCache(cache.path)).load_files([self.bad_xml])
+
+    def test_repo_errors(self):
+        '''
+        The repo reports errors until the file is fixed.
+        '''
+        self.repo.load(strict=False)
+        self.assertEqual(len(self.repo.errors), 2)
+        self.assertEqual(len(self.repo.media), 24)
+        os.remove(self.bad_xml)
+        write_movie(self.root, 30)
+        os.utime(self.root, ns=(1, 1))
+        os.utime(self.bad_title, ns=(1, 1))
+        self.repo.rescan()
+        self.assertEqual(self.repo.errors, [])
+        self.assertEqual(len(self.repo.media), 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
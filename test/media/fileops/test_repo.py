@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for incremental repo rescans.'''
+
+# pylint: disable=R0801
+# pylint: disable=wrong-import-order
+# pylint: disable=consider-using-with
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from media.data.media.contents.audio.album import Album
+from media.data.media.contents.movie import Movie
+from media.fileops.filenames import FilenameMatches
+from media.fileops.loader import Loader
+from media.fileops.repo import Repo
+from media.general.inspector import Inspector
+from media.xml.parser import Parser
+from test.media.fileops.samples import build_library, write_movie
+from test.media.fileops.test_loader import PARSE_ERRORS
+
+
+def bump_mtime(in_path):
+    '''
+    Move the modification time forward, in case the change
+    happened within the timestamp resolution of the filesystem.
+    '''
+    f_stat = os.stat(in_path)
+    os.utime(in_path, ns=(f_stat.st_atime_ns, f_stat.st_mtime_ns + 10**9))
+
+
+class TestRepoRescan(unittest.TestCase):
+    '''
+    Rescan a sample library after making changes to it.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        build_library(self.root)
+        self.repo = Repo(self.root)
+        self.repo.scan()
+        self.repo.load()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def fresh_repo(self):
+        '''
+        Load a new repo object from scratch.
+        '''
+        repo = Repo(self.root)
+        repo.scan()
+        repo.load()
+        return repo
+
+    def assert_matches_fresh(self):
+        '''
+        The rescanned repo should match a full load.
+        '''
+        repo = self.fresh_repo()
+        self.assertEqual(sorted(str(med) for med in self.repo.media),
+                         sorted(str(med) for med in repo.media))
+        self.assertEqual(sorted(str(con.title) for con in self.repo.content),
+                         sorted(str(con.title) for con in repo.content))
+
+    def test_no_changes(self):
+        '''
+        Nothing should be parsed if nothing changed.
+        '''
+        parsed = self.repo.loader.parser.file_count
+        changes = self.repo.rescan()
+        self.assertFalse(changes)
+        self.assertEqual(self.repo.loader.parser.file_count, parsed)
+        self.assertEqual(len(self.repo.media), 24)
+
+    def test_added_file(self):
+        '''
+        A new file is picked up, and only that file is parsed.
+        '''
+        parsed = self.repo.loader.parser.file_count
+        m_file = write_movie(self.root, 50)
+        bump_mtime(os.path.join(self.root, 'movies'))
+        changes = self.repo.rescan()
+        self.assertEqual(changes.added, [m_file])
+        self.assertEqual(self.repo.loader.parser.file_count, parsed + 1)
+        self.assertEqual(len(self.repo.media), 25)
+        self.assertEqual(len(self.repo.get_movies()), 21)
+        self.assert_matches_fresh()
+
+    def test_removed_file(self):
+        '''
+        Media from a deleted file should be dropped.
+        '''
+        m_dir = os.path.join(self.root, 'movies', 'm004')
+        shutil.rmtree(m_dir)
+        bump_mtime(os.path.join(self.root, 'movies'))
+        changes = self.repo.rescan()
+        self.assertEqual(len(changes.removed), 1)
+        self.assertEqual(len(changes.media_removed), 1)
+        self.assertEqual(len(self.repo.media), 23)
+        self.assertEqual(len(self.repo.get_movies()), 19)
+        self.assert_matches_fresh()
+
+    def test_modified_file(self):
+        '''
+        A changed file is reloaded in place.
+        '''
+        media_list = self.repo.media
+        m_file = write_movie(self.root, 7, 'Replacement Title')
+        bump_mtime(m_file)
+        changes = self.repo.rescan()
+        self.assertEqual(changes.modified, [m_file])
+        self.assertIs(self.repo.media, media_list)
+        self.assertIn('Replacement Title',
+                      [str(med) for med in self.repo.media])
+        self.assert_matches_fresh()
+
+    def test_failed_rescan(self):
+        '''
+        A changed file that no longer loads leaves the repo as
+        it was, and is still seen as modified on the next rescan.
+        '''
+        m_file = write_movie(self.root, 1, 'Renamed')
+        with open(m_file, 'a', encoding='utf-8') as m_out:
+            m_out.write('<broken>')
+        bump_mtime(m_file)
+        titles = sorted(str(con.title) for con in self.repo.content)
+        with self.assertRaises(PARSE_ERRORS):
+            self.repo.rescan()
+        self.assertEqual(len(self.repo.media), 24)
+        self.assertEqual(sorted(str(con.title) for con in self.repo.content),
+                         titles)
+        write_movie(self.root, 1, 'Renamed')
+        bump_mtime(m_file)
+        changes = self.repo.rescan()
+        self.assertEqual(changes.modified, [m_file])
+        self.assertEqual(changes.added, [])
+        self.assertEqual(len(self.repo.content), 24)
+        self.assert_matches_fresh()
+
+    def test_modified_include(self):
+        '''
+        A changed include reloads the file that included it.
+        '''
+        m_file = write_movie(self.root, 2)
+        bump_mtime(os.path.join(os.path.dirname(m_file), 'crew.xml'))
+        changes = self.repo.rescan()
+        self.assertEqual(changes.modified, [m_file])
+        self.assert_matches_fresh()
+
+    def test_changed_during_load(self):
+        '''
+        An include that changes after the parser read it is
+        picked up by the next rescan.
+        '''
+        m_file = write_movie(self.root, 3)
+        crew = os.path.join(os.path.dirname(m_file), 'crew.xml')
+        load_file = Parser.load_file
+
+        def changing_load(parser, in_filename):
+            out = load_file(parser, in_filename)
+            if in_filename == m_file:
+                bump_mtime(crew)
+            return out
+
+        with mock.patch.object(Parser, 'load_file', changing_load):
+            repo = self.fresh_repo()
+        changes = repo.rescan()
+        self.assertEqual(changes.modified, [m_file])
+
+
+class TestRepoSharedContent(unittest.TestCase):
+    '''
+    The same movie owned on more than one media device.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        build_library(self.root)
+        self.copy = write_movie(os.path.join(self.root, 'copy'), 3)
+        self.repo = Repo(self.root)
+        self.repo.scan()
+        self.repo.load()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def shared_movie(self):
+        '''
+        Return the content object shared by two media devices.
+        '''
+        for con_obj in self.repo.content:
+            if len(self.repo.media_for_content(con_obj)) > 1:
+                return con_obj
+        return None
+
+    def test_dedupe(self):
+        '''
+        Shared content is only listed once, in first seen order.
+        '''
+        self.assertEqual(len(self.repo.media), 25)
+        self.assertEqual(len(self.repo.content), 24)
+        first = [con_obj for m_dev in self.repo.media
+                 for con_obj in m_dev.contents]
+        self.assertIs(self.repo.content[0], first[0])
+
+    def test_reverse_index(self):
+        '''
+        Both media devices are found for the shared movie.
+        '''
+        movie = self.shared_movie()
+        self.assertIsNotNone(movie)
+        m_devs = self.repo.media_for_content(movie)
+        self.assertEqual(len(m_devs), 2)
+        self.assertTrue(all(movie in m_dev.contents for m_dev in m_devs))
+
+    def test_remove_one_copy(self):
+        '''
+        Removing one copy keeps the content from the other.
+        '''
+        shutil.rmtree(os.path.join(self.root, 'copy'))
+        bump_mtime(self.root)
+        self.repo.rescan()
+        self.assertEqual(len(self.repo.content), 24)
+        self.assertIsNone(self.shared_movie())
+        for con_obj in self.repo.content:
+            m_devs = self.repo.media_for_content(con_obj)
+            self.assertEqual(len(m_devs), 1)
+            self.assertIn(m_devs[0], self.repo.media)
+            self.assertTrue(any(con_obj is other
+                                for other in m_devs[0].contents))
+
+
+class TestRepoTypes(unittest.TestCase):
+    '''
+    Content and media grouped by content class.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        build_library(self.root)
+        write_movie(os.path.join(self.root, 'copy'), 3)
+        self.repo = Repo(self.root)
+        self.repo.scan()
+        self.repo.load()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_count_by_type(self):
+        '''
+        Content and media counts for each class.
+        '''
+        self.assertEqual(self.repo.count_by_type(),
+                         {'Movie': (20, 21), 'Album': (4, 4)})
+
+    def test_get_media(self):
+        '''
+        Media objects are found through the content class.
+        '''
+        self.assertEqual(len(self.repo.get_media(Movie)), 21)
+        self.assertEqual(len(self.repo.get_media(Album)), 4)
+        m_dev = Inspector().find_random_album(self.repo)
+        self.assertIsInstance(m_dev.contents[0], Album)
+
+    def test_rescan_buckets(self):
+        '''
+        Buckets are updated when files go away.
+        '''
+        shutil.rmtree(os.path.join(self.root, 'albums'))
+        bump_mtime(self.root)
+        self.repo.rescan()
+        self.assertEqual(self.repo.count_by_type(), {'Movie': (20, 21)})
+        self.assertEqual(self.repo.get_albums(), [])
+
+
+class TestRepoIterators(unittest.TestCase):
+    '''
+    Streaming media and content out of a repo.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        build_library(self.root)
+        write_movie(os.path.join(self.root, 'bluray'), 3)
+        self.repo = Repo(self.root)
+        self.repo.scan()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_iter_media(self):
+        '''
+        The generator should match a full load.
+        '''
+        m_iter = self.repo.iter_media()
+        self.assertEqual(len(self.repo.media), 0)
+        streamed = [str(med) for med in m_iter]
+        self.repo.load()
+        self.assertEqual(streamed, [str(med) for med in self.repo.media])
+
+    def test_iter_media_streaming(self):
+        '''
+        A serial load without a cache streams every file.
+        '''
+        files = self.repo.file_match(FilenameMatches.All_Media)
+        with mock.patch.object(Parser, 'iter_file', autospec=True,
+                               side_effect=Parser.iter_file) as iter_file:
+            streamed = list(self.repo.iter_media())
+            self.assertEqual(iter_file.call_count, len(files))
+            list(self.repo.iter_media(workers=2, mode=Loader.THREAD))
+            self.assertEqual(iter_file.call_count, len(files))
+        self.repo.load()
+        self.assertEqual(len(streamed), len(self.repo.media))
+
+    def test_iter_media_parallel(self):
+        '''
+        Worker threads return the same media in the same order.
+        '''
+        serial = [str(med) for med in self.repo.iter_media()]
+        threaded = [str(med) for med in
+                    self.repo.iter_media(workers=2, mode=Loader.THREAD)]
+        self.assertEqual(serial, threaded)
+
+    def test_iter_content(self):
+        '''
+        Content shared by two media objects is only returned once.
+        '''
+        content = list(self.repo.iter_content())
+        self.assertEqual(len(content), 24)
+        self.repo.load()
+        self.assertEqual(content, self.repo.content)
+
+    def test_iter_content_class(self):
+        '''
+        Content can be limited to a single class.
+        '''
+        self.assertEqual(len(list(self.repo.iter_content(Movie))), 20)
+        self.assertEqual(len(list(self.repo.iter_content(Album))), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
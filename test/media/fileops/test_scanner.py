@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the directory walkers.'''
+
+# pylint: disable=R0801
+# pylint: disable=wrong-import-order
+# pylint: disable=consider-using-with
+
+import os
+import tempfile
+import unittest
+from media.fileops.filenames import FilenameMatches
+from media.fileops.repo import Repo
+from media.fileops.scanner import (Walker, ScanDirWalker, ParallelWalker,
+                                   file_signature, signature_or_none)
+from test.media.fileops.samples import build_library
+
+
+class TestScanDirWalker(unittest.TestCase):
+    '''
+    Compare the scandir walker against the default walker.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        build_library(self.root, movies=5, albums=2)
+        os.makedirs(os.path.join(self.root, '.git'))
+        with open(os.path.join(self.root, '.git', 'x-dvd.xml'), 'w',
+                  encoding='utf-8'):
+            pass
+        ignored = os.path.join(self.root, 'ignored')
+        os.makedirs(ignored)
+        for fname in [Walker.IGNORE, 'y-dvd.xml']:
+            with open(os.path.join(ignored, fname), 'w', encoding='utf-8'):
+                pass
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_same_files(self):
+        '''
+        Without a pattern, both walkers find the same files.
+        '''
+        walker = Walker([self.root])
+        walker.scan()
+        sd_walker = ScanDirWalker([self.root])
+        sd_walker.scan()
+        self.assertEqual(sorted(walker.dirs), sorted(sd_walker.dirs))
+        self.assertEqual(sorted(walker.files), sorted(sd_walker.files))
+        self.assertEqual(len(sd_walker.files), 12)
+
+    def test_pattern(self):
+        '''
+        Non-matching files should be skipped.
+        '''
+        sd_walker = ScanDirWalker([self.root], FilenameMatches.Movie_Media)
+        sd_walker.scan()
+        self.assertEqual(len(sd_walker.files), 5)
+        self.assertEqual(len(sd_walker.skipped), 7)
+        self.assertTrue(all(fname.endswith('crew.xml') or
+                            fname.endswith('audiocd.xml')
+                            for fname in sd_walker.skipped))
+
+    def test_repo_walker(self):
+        '''
+        The walker can be swapped into a repo object.
+        '''
+        repo = Repo(self.root)
+        repo.set_walker(ScanDirWalker([self.root], FilenameMatches.All_Media))
+        repo.scan()
+        repo.load()
+        self.assertEqual(len(repo.get_movies()), 5)
+        self.assertEqual(len(repo.get_albums()), 2)
+
+
+class TestParallelWalker(unittest.TestCase):
+    '''
+    Walking directories in a thread pool.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        build_library(self.root, movies=30, albums=5)
+        os.makedirs(os.path.join(self.root, '.hidden'))
+        ignored = os.path.join(self.root, 'movies', 'm010')
+        with open(os.path.join(ignored, Walker.IGNORE), 'w',
+                  encoding='utf-8'):
+            pass
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_same_files(self):
+        '''
+        The parallel walker finds the same files.
+        '''
+        walker = Walker([self.root])
+        walker.scan()
+        p_walker = ParallelWalker([self.root], workers=4)
+        p_walker.scan()
+        self.assertEqual(sorted(walker.dirs), sorted(p_walker.dirs))
+        self.assertEqual(sorted(walker.files), sorted(p_walker.files))
+        self.assertEqual(len(p_walker.files), 63)
+
+    def test_deterministic(self):
+        '''
+        The output order should not change between runs.
+        '''
+        first = ParallelWalker([self.root], workers=4)
+        first.scan()
+        second = ParallelWalker([self.root], workers=3)
+        second.scan()
+        self.assertEqual(first.dirs, second.dirs)
+        self.assertEqual(first.files, second.files)
+        self.assertEqual(first.files, sorted(first.files))
+
+    def test_pattern(self):
+        '''
+        Non-matching files are skipped, like ScanDirWalker.
+        '''
+        p_walker = ParallelWalker([self.root], FilenameMatches.All_Media)
+        p_walker.scan()
+        self.assertEqual(len(p_walker.files), 34)
+        self.assertEqual(len(p_walker.skipped), 29)
+
+
+class TestSignature(unittest.TestCase):
+    '''
+    File signatures.
+    '''
+    def test_missing(self):
+        '''
+        A missing file has no signature, instead of an error.
+        '''
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'file.xml')
+            self.assertIsNone(signature_or_none(filename))
+            with open(filename, 'w', encoding='utf-8') as f_out:
+                f_out.write('<a/>')
+            self.assertEqual(signature_or_none(filename),
+                             file_signature(filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
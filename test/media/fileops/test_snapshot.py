@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for repo snapshot files.'''
+
+# pylint: disable=R0801
+# pylint: disable=wrong-import-order
+# pylint: disable=consider-using-with
+
+import os
+import pickle
+import tempfile
+import unittest
+import media
+from media.data.media.contents.audio.album import Album
+from media.data.media.profile import ParseProfile, Deferred
+from media.fileops.repo import Repo
+from media.fileops.snapshot import (
+        Snapshot, SnapshotRepo, SnapshotException
+        )
+from media.general.sorting.table import MovieTable
+from test.media.fileops.samples import build_library, write_movie
+
+
+class TestSnapshot(unittest.TestCase):
+    '''
+    Write a snapshot of a sample library and read it back.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmpdir.name, 'library')
+        build_library(self.root)
+        write_movie(os.path.join(self.root, 'copy'), 3)
+        self.repo = Repo(self.root)
+        self.repo.scan()
+        self.repo.load(profile=ParseProfile.FULL)
+        self.path = os.path.join(self.tmpdir.name, 'library.snap')
+        Snapshot.write(self.repo, self.path)
+        self.snap = SnapshotRepo.open(self.path)
+
+    def tearDown(self):
+        self.snap.snapshot.close()
+        self.tmpdir.cleanup()
+
+    def test_lazy_open(self):
+        '''
+        Opening a snapshot doesn't unpickle any media objects.
+        '''
+        self.assertEqual(len(self.snap.media), 25)
+        self.assertEqual(len(self.snap.get_movies()), 20)
+        self.assertEqual(len(self.snap.snapshot.records), 0)
+
+    def test_media_once(self):
+        '''
+        A media object is only unpickled once.
+        '''
+        self.assertIs(self.snap.media[2], self.snap.media[2])
+        self.assertEqual(len(self.snap.snapshot.records), 1)
+
+    def test_content(self):
+        '''
+        The content list matches the repo, in the same order.
+        '''
+        self.assertEqual([str(c.title) for c in self.snap.content],
+                         [str(c.title) for c in self.repo.content])
+        self.assertEqual(self.snap.count_by_type(),
+                         self.repo.count_by_type())
+
+    def test_shared_content(self):
+        '''
+        The dedup index keeps every owner of shared content.
+        '''
+        owners = [len(self.snap.media_for_content(c))
+                  for c in self.snap.content]
+        self.assertEqual(owners.count(2), 1)
+
+    def test_get_media(self):
+        '''
+        Media objects can be looked up by content class.
+        '''
+        albums = self.snap.get_media(Album)
+        self.assertEqual(len(albums), 4)
+        self.assertIsInstance(albums[0].contents[0], Album)
+
+    def test_full_objects(self):
+        '''
+        Movies come back with every subtree built.
+        '''
+        movie = self.snap.get_movies()[0]
+        self.assertNotIsInstance(movie.__dict__['crew'], Deferred)
+        self.assertEqual(str(movie.crew.directors[0]),
+                         str(self.repo.get_movies()[0].crew.directors[0]))
+
+    def test_movie_table(self):
+        '''
+        The saved MovieTable answers without unpickling movies.
+        '''
+        table = self.snap.movie_table()
+        self.assertEqual(len(table), 20)
+        self.assertEqual(table.counts(MovieTable.C_GENRE),
+                         MovieTable(self.repo.get_movies()).counts(
+                             MovieTable.C_GENRE))
+        self.assertEqual(len(self.snap.snapshot.records), 0)
+        self.assertEqual(table.movies[0].title,
+                         self.repo.get_movies()[0].title)
+
+    def test_write_failure(self):
+        '''
+        A snapshot that can't be written leaves no files behind.
+        '''
+        path = os.path.join(self.tmpdir.name, 'broken.snap')
+        self.repo.media[0].broken = lambda: None
+        with self.assertRaises((pickle.PicklingError, AttributeError,
+                                TypeError)):
+            Snapshot.write(self.repo, path)
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)),
+                         ['library', 'library.snap'])
+
+    def test_read_only(self):
+        '''
+        A snapshot repo can't be loaded or rescanned.
+        '''
+        with self.assertRaises(SnapshotException):
+            self.snap.load()
+        with self.assertRaises(SnapshotException):
+            self.snap.load(workers=2, profile=ParseProfile.FULL)
+        with self.assertRaises(SnapshotException):
+            self.snap.rescan()
+
+
+class TestSnapshotErrors(unittest.TestCase):
+    '''
+    Files that can't be used as snapshots.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'bad.snap')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, in_data):
+        '''
+        Write raw bytes to the snapshot path.
+        '''
+        with open(self.path, 'wb') as s_out:
+            s_out.write(in_data)
+
+    def test_empty(self):
+        '''
+        An empty file is rejected.
+        '''
+        self.write(b'')
+        with self.assertRaises(SnapshotException):
+            Snapshot(self.path)
+
+    def test_magic(self):
+        '''
+        A file without the snapshot header is rejected.
+        '''
+        self.write(b'<media/>' * 10)
+        with self.assertRaises(SnapshotException):
+            Snapshot(self.path)
+
+    def test_format(self):
+        '''
+        A snapshot in another format is rejected.
+        '''
+        self.write(Snapshot.HEADER.pack(Snapshot.MAGIC, 99, 0, 0, 0))
+        with self.assertRaises(SnapshotException):
+            Snapshot(self.path)
+
+    def test_version(self):
+        '''
+        A snapshot from another release is rejected.
+        '''
+        repo = Repo(self.tmpdir.name)
+        repo.scan()
+        repo.load()
+        saved = media.__version__
+        media.__version__ = '0.0.0'
+        try:
+            Snapshot.write(repo, self.path)
+        finally:
+            media.__version__ = saved
+        with self.assertRaises(SnapshotException):
+            Snapshot(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
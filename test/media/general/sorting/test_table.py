@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the MovieTable class.'''
+
+# pylint: disable=R0801
+
+import unittest
+from unittest import mock
+import xml.etree.ElementTree as ET
+from media.data.media.contents.movie import Movie
+from media.general.sorting.table import MovieTable, CodeBook, TableException
+
+MOVIE = '''<?xml version='1.0'?>
+<movie xmlns='http://vectortron.com/xml/media/movie'>
+ <title>{title}</title>
+ <catalog><copyright><year>{year}</year></copyright></catalog>
+ <classification><genres><primary>{genre}</primary></genres></classification>
+ <technical><runtime><overall>PT{minutes}M</overall></runtime></technical>
+</movie>
+'''
+
+MOVIES = [
+    ('Alpha', 1984, 'Drama', 100),
+    ('Bravo', 1991, 'Comedy', 90),
+    ('Charlie', 1987, 'Drama', 120),
+    ('Delta', 1999, 'Horror', 85),
+    ('Apple', 1980, 'Comedy', 95),
+]
+
+
+class TestMovieTable(unittest.TestCase):
+    '''
+    Tests against the MovieTable class.
+    '''
+    def setUp(self):
+        '''
+        Build a table from a few movies.
+        '''
+        self.movies = [Movie(ET.fromstring(
+                       MOVIE.format(title=title, year=year, genre=genre,
+                                    minutes=minutes)))
+                       for title, year, genre, minutes in MOVIES]
+        self.table = MovieTable(self.movies)
+
+    def test_columns(self):
+        '''
+        Assert the scalar columns hold the movie values.
+        '''
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(list(self.table.column(MovieTable.C_YEAR)),
+                         [1984, 1991, 1987, 1999, 1980])
+        self.assertEqual(list(self.table.column(MovieTable.C_DECADE)),
+                         [198, 199, 198, 199, 198])
+        self.assertEqual(self.table.column(MovieTable.C_RUNTIME)[0], 6000)
+
+    def test_genre_encoding(self):
+        '''
+        Assert genres are stored as codes.
+        '''
+        self.assertEqual(list(self.table.column(MovieTable.C_GENRE)),
+                         [0, 1, 0, 2, 1])
+        self.assertEqual(len(self.table.books[MovieTable.C_GENRE]), 3)
+
+    def test_counts(self):
+        '''
+        Assert counts decode the genre and letter codes.
+        '''
+        self.assertEqual(self.table.counts(MovieTable.C_GENRE),
+                         {'Drama': 2, 'Comedy': 2, 'Horror': 1})
+        self.assertEqual(self.table.counts(MovieTable.C_LETTER),
+                         {'a': 2, 'b': 1, 'c': 1, 'd': 1})
+        self.assertEqual(self.table.counts(MovieTable.C_DECADE),
+                         {198: 3, 199: 2})
+
+    def test_group(self):
+        '''
+        Assert grouping returns the rows for every value.
+        '''
+        groups = self.table.group(MovieTable.C_GENRE)
+        self.assertEqual(list(groups['Drama']), [0, 2])
+        self.assertEqual(list(groups['Horror']), [3])
+
+    def test_order(self):
+        '''
+        Assert rows are sorted on a column.
+        '''
+        self.assertEqual(list(self.table.order(MovieTable.C_RUNTIME)),
+                         [3, 1, 4, 0, 2])
+        self.assertEqual(list(self.table.order(MovieTable.C_YEAR,
+                                               reverse=True)),
+                         [3, 1, 2, 0, 4])
+
+    def test_order_stable(self):
+        '''
+        Assert rows with the same value keep their order.
+        '''
+        self.assertEqual(list(self.table.order(MovieTable.C_DECADE)),
+                         [0, 2, 4, 1, 3])
+
+    def test_aggregates(self):
+        '''
+        Assert the total, mean and span of a column.
+        '''
+        self.assertEqual(self.table.total(MovieTable.C_RUNTIME), 29400)
+        self.assertEqual(self.table.mean(MovieTable.C_RUNTIME), 5880)
+        self.assertEqual(self.table.span(MovieTable.C_YEAR), (1980, 1999))
+
+    def test_bucket(self):
+        '''
+        Assert rows are split into buckets of equal width.
+        '''
+        low, width, rows = self.table.bucket(MovieTable.C_RUNTIME, 3)
+        self.assertEqual(low, 5100)
+        self.assertEqual(width, 701)
+        self.assertEqual([list(r) for r in rows], [[1, 3, 4], [0], [2]])
+
+    def test_numpy_fallback(self):
+        '''
+        Assert the pure Python column operations give the same
+        results as the NumPy ones.
+        '''
+        def results():
+            return [
+                self.table.counts(MovieTable.C_GENRE),
+                {key: list(rows) for (key, rows) in
+                 self.table.group(MovieTable.C_GENRE).items()},
+                list(self.table.order(MovieTable.C_RUNTIME)),
+                list(self.table.order(MovieTable.C_DECADE, reverse=True)),
+                self.table.total(MovieTable.C_RUNTIME),
+                self.table.mean(MovieTable.C_RUNTIME),
+                self.table.span(MovieTable.C_YEAR),
+                [(low, width, [list(r) for r in rows])
+                 for (low, width, rows) in
+                 [self.table.bucket(MovieTable.C_RUNTIME, 3),
+                  self.table.bucket(MovieTable.C_YEAR, 4)]],
+            ]
+        expected = results()
+        with mock.patch('media.general.sorting.table.numpy', None):
+            self.assertEqual(results(), expected)
+
+    def test_from_index(self):
+        '''
+        Assert a table can be built from index entries.
+        '''
+        table = MovieTable.from_index([m.s_index for m in self.movies[:2]])
+        self.assertEqual(len(table), 2)
+        self.assertIs(table.movies[1], self.movies[1])
+
+    def test_unknown_column(self):
+        '''
+        Assert an unknown column raises an exception.
+        '''
+        with self.assertRaises(TableException):
+            self.table.column('rating')
+
+
+class TestWithoutNumpy(TestMovieTable):
+    '''
+    The same tests, run with the pure Python column operations.
+    '''
+    def setUp(self):
+        patcher = mock.patch('media.general.sorting.table.numpy', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+class TestEmptyMovieTable(unittest.TestCase):
+    '''
+    Tests against a MovieTable with no movies.
+    '''
+    def test_empty(self):
+        '''
+        Assert aggregates over an empty table are safe.
+        '''
+        table = MovieTable()
+        self.assertEqual(table.mean(MovieTable.C_RUNTIME), 0)
+        self.assertIsNone(table.span(MovieTable.C_YEAR))
+        self.assertEqual(table.counts(MovieTable.C_GENRE), {})
+        _, _, rows = table.bucket(MovieTable.C_RUNTIME, 2)
+        self.assertEqual([len(r) for r in rows], [0, 0])
+
+
+class TestCodeBook(unittest.TestCase):
+    '''
+    Tests against the CodeBook class.
+    '''
+    def test_encode(self):
+        '''
+        Assert repeated values share a code.
+        '''
+        book = CodeBook()
+        self.assertEqual(book.encode('Drama'), 0)
+        self.assertEqual(book.encode('Comedy'), 1)
+        self.assertEqual(book.encode('Drama'), 0)
+        self.assertEqual(book.decode(1), 'Comedy')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the string pool.'''
+
+# pylint: disable=R0801
+
+import unittest
+import xml.etree.ElementTree as ET
+from media.data.nouns import PersonalName
+from media.data.media.contents.movie import Movie
+from media.general.stringpool import StringPool, active_pool, pooled
+from media.xml.dispatch import ElementDispatch
+from media.xml.parser import Parser
+
+NAME = '''<?xml version='1.0'?>
+<director xmlns='http://vectortron.com/xml/media/movie'>
+ <gn>Marty</gn><fn>Goofus</fn>
+</director>
+'''
+
+MOVIE = '''<?xml version='1.0'?>
+<movie xmlns='http://vectortron.com/xml/media/movie'>
+ <title>{title}</title>
+ <classification><genres><primary>Drama</primary></genres></classification>
+ <crew>
+  <directors><director><gn>Marty</gn><fn>Goofus</fn></director></directors>
+ </crew>
+</movie>
+'''
+
+
+def fresh(in_string):
+    '''
+    Return an equal string that isn't the same object.
+    '''
+    return ''.join(list(in_string))
+
+
+class TestStringPool(unittest.TestCase):
+    '''
+    Pooling of repeated strings.
+    '''
+    def test_intern(self):
+        '''
+        Equal strings should come back as the first copy.
+        '''
+        pool = StringPool()
+        first = fresh('Drama')
+        second = fresh('Drama')
+        self.assertIsNot(first, second)
+        self.assertIs(pool.intern(first), first)
+        self.assertIs(pool.intern(second), first)
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(pool.hits, 1)
+        self.assertEqual(pool.misses, 1)
+        self.assertEqual(pool.hit_ratio(), 0.5)
+
+    def test_inactive(self):
+        '''
+        Without an active pool, strings are returned as is.
+        '''
+        value = fresh('Drama')
+        self.assertIsNone(active_pool())
+        self.assertIs(pooled(value), value)
+        self.assertIsNone(pooled(None))
+
+    def test_nesting(self):
+        '''
+        The previous pool should be restored after a with block.
+        '''
+        outer = StringPool()
+        inner = StringPool()
+        with outer:
+            with inner:
+                self.assertIs(active_pool(), inner)
+            self.assertIs(active_pool(), outer)
+        self.assertIsNone(active_pool())
+
+    def test_share(self):
+        '''
+        Objects should be shared by key.
+        '''
+        pool = StringPool()
+        first = object()
+        self.assertIs(pool.share('key', first), first)
+        self.assertIs(pool.share('key', object()), first)
+        self.assertEqual(pool.shared_hits, 1)
+        self.assertIn('Shared objects: 1', pool.stats())
+
+    def test_names(self):
+        '''
+        Name parts should be shared between objects.
+        '''
+        with StringPool() as pool:
+            one = PersonalName(ET.fromstring(NAME))
+            two = PersonalName(ET.fromstring(NAME))
+        self.assertIs(one.given, two.given)
+        self.assertIs(one.sort_value, two.sort_value)
+        self.assertGreater(pool.hits, 0)
+
+    def test_names_counted(self):
+        '''
+        Name parts are still shared while dispatch is counted.
+        '''
+        ElementDispatch.enable_counters()
+        try:
+            with StringPool():
+                one = PersonalName(ET.fromstring(NAME))
+                two = PersonalName(ET.fromstring(NAME))
+        finally:
+            ElementDispatch.disable_counters()
+        self.assertIs(one.given, two.given)
+
+    def test_deferred(self):
+        '''
+        Deferred subtrees should use the pool from the load.
+        '''
+        with StringPool():
+            one = Movie(ET.fromstring(MOVIE.format(title='One')))
+            two = Movie(ET.fromstring(MOVIE.format(title='Two')))
+        self.assertIs(one.classification.genres.primary,
+                      two.classification.genres.primary)
+        self.assertIs(one.crew.directors[0], two.crew.directors[0])
+
+    def test_parser_stats(self):
+        '''
+        The parser should report on its pool.
+        '''
+        parser = Parser()
+        self.assertIn('Strings: 0', parser.stats())
@@ -28,7 +28,8 @@
 
 import unittest
 from media.general.stringtools import (
-        transform_string, trans_str_ws)
+        transform_string, trans_str_ws, build_sort_string, sort_strings,
+        cache_stats, cache_report, clear_caches)
 
 
 class TestStringToolsCase(unittest.TestCase):
@@ -53,5 +54,44 @@ class TestStringToolsCase(unittest.TestCase):
         self.assertEqual(trans_str_ws(str_in), str_out)
 
 
+class TestStringToolsCache(unittest.TestCase):
+    '''
+    Caching of sort strings.
+    '''
+    def setUp(self):
+        clear_caches()
+
+    def test_cache_hits(self):
+        '''
+        Repeated values should come from the cache.
+        '''
+        first = build_sort_string("The Gallant Goofus")
+        second = build_sort_string("The Gallant Goofus")
+        self.assertEqual(first, "gallant_goofus_+the")
+        self.assertIs(first, second)
+        (hits, misses) = cache_stats()
+        self.assertGreater(hits, 0)
+        self.assertGreater(misses, 0)
+        self.assertIn('hit ratio', cache_report())
+
+    def test_clear(self):
+        '''
+        Clearing the caches should reset the counts.
+        '''
+        build_sort_string("A Movie")
+        clear_caches()
+        self.assertEqual(cache_stats(), (0, 0))
+
+    def test_batch(self):
+        '''
+        Batches should match single calls, in order.
+        '''
+        values = ["The Goofus", "Gallant", "The Goofus", "An Ending"]
+        self.assertEqual(sort_strings(values),
+                         [build_sort_string(val) for val in values])
+        self.assertEqual(sort_strings(values, trans_str_ws),
+                         [trans_str_ws(val) for val in values])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the XML parsing backends.'''
+
+# pylint: disable=R0801
+# pylint: disable=wrong-import-order
+# pylint: disable=consider-using-with
+
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from media.fileops.filenames import FilenameMatches
+from media.fileops.repo import Repo
+from media.xml.backend import (
+        BackendException, available_backends, get_backend, lxml_etree,
+        serialize
+        )
+from media.xml.parser import Parser
+from test.media.fileops.samples import build_library
+
+NOISY = '''<?xml version='1.0'?>
+<!-- exported catalogue -->
+<mediaList xmlns='http://vectortron.com/xml/media/media'
+ xmlns:xi='http://www.w3.org/2001/XInclude'>
+ <?exporter version="1"?>
+ <media>
+  <!-- record one -->
+  <title><main>Noisy Record</main></title>
+  <medium><release><type><dvd/></type></release></medium>
+  <contents>
+   <movie xmlns='http://vectortron.com/xml/media/movie'>
+    <title>Noisy Record</title>
+    <catalog><copyright><year>1990</year></copyright></catalog>
+    <xi:include href='crew.xml'/>
+   </movie>
+  </contents>
+ </media>
+</mediaList>
+'''
+
+CREW = '''<?xml version='1.0'?>
+<crew xmlns='http://vectortron.com/xml/media/movie'>
+ <!-- crew comment -->
+ <directors><director><gn>Marty</gn><fn>Goofus</fn></director></directors>
+</crew>
+'''
+
+
+def object_graph(in_obj, in_seen=None):
+    '''
+    Reduce an object graph to nested builtin values, so
+    two graphs can be compared.  Attributes are read with
+    getattr(), so deferred fields get built, and slots are
+    included.
+    '''
+    seen = in_seen if in_seen is not None else set()
+    if isinstance(in_obj, (str, int, float, bool, type(None))):
+        return in_obj
+    if isinstance(in_obj, (list, tuple)):
+        return [object_graph(val, seen) for val in in_obj]
+    if isinstance(in_obj, dict):
+        return {key: object_graph(val, seen) for (key, val)
+                in sorted(in_obj.items(), key=lambda x: str(x[0]))}
+    if id(in_obj) in seen:
+        return ('seen', in_obj.__class__.__name__)
+    seen.add(id(in_obj))
+    names = list(getattr(in_obj, '__dict__', {}))
+    for cls in in_obj.__class__.__mro__:
+        names.extend(name for name in cls.__dict__.get('__slots__', ())
+                     if hasattr(in_obj, name))
+    if names:
+        return (in_obj.__class__.__name__,
+                object_graph({key: getattr(in_obj, key)
+                              for key in names}, seen))
+    return repr(in_obj)
+
+
+class TestBackendSelection(unittest.TestCase):
+    '''
+    Choosing a backend.
+    '''
+    def test_stdlib(self):
+        '''
+        The stdlib backend is always available.
+        '''
+        self.assertIn('stdlib', available_backends())
+        self.assertEqual(get_backend('stdlib').name, 'stdlib')
+
+    def test_unknown(self):
+        '''
+        An unknown backend name raises an exception.
+        '''
+        with self.assertRaises(BackendException):
+            get_backend('nothing')
+
+    def test_default(self):
+        '''
+        lxml is preferred when it is installed.
+        '''
+        self.assertEqual(Parser().backend.name, available_backends()[-1])
+
+
+class TestSerialize(unittest.TestCase):
+    '''
+    Serializing elements for deferred fields.
+    '''
+    def test_round_trip(self):
+        '''
+        The tail should be dropped, and the tags kept.
+        '''
+        root = ET.fromstring("<a xmlns='urn:x'><b>one</b> tail </a>")
+        data = serialize(root[0])
+        self.assertIsInstance(data, bytes)
+        elem = ET.fromstring(data)
+        self.assertEqual(elem.tag, '{urn:x}b')
+        self.assertEqual(elem.text, 'one')
+        self.assertEqual(root[0].tail, ' tail ')
+
+
+class TestBackendEquivalence(unittest.TestCase):
+    '''
+    Every backend should produce the same media objects.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        build_library(self.root, movies=10, albums=3)
+        self.noisy = os.path.join(self.root, 'noisy', 'noisy-dvd.xml')
+        os.makedirs(os.path.dirname(self.noisy))
+        for (f_name, f_data) in [(self.noisy, NOISY),
+                                 (os.path.join(self.root, 'noisy',
+                                               'crew.xml'), CREW)]:
+            with open(f_name, 'w', encoding='utf-8') as f_out:
+                f_out.write(f_data)
+        repo = Repo(self.root)
+        repo.scan()
+        self.files = sorted(repo.file_match(FilenameMatches.All_Media))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def load(self, in_backend):
+        '''
+        Load every file with a backend, returning the object
+        graphs and the included files.
+        '''
+        parser = Parser(get_backend(in_backend))
+        out = []
+        for fname in self.files:
+            m_list = parser.load_file(fname)
+            out.append((object_graph(m_list), list(parser.last_includes)))
+        return out
+
+    def test_stdlib_includes(self):
+        '''
+        Included files are recorded by the stdlib backend.
+        '''
+        parser = Parser(get_backend('stdlib'))
+        m_list = parser.load_file(self.noisy)
+        self.assertEqual(str(m_list[0].contents[0].crew.directors[0]),
+                         'Marty Goofus')
+        self.assertEqual(parser.last_includes,
+                         [os.path.join(os.path.dirname(
+                             os.path.realpath(self.noisy)), 'crew.xml')])
+
+    @unittest.skipUnless(lxml_etree, 'lxml is not installed')
+    def test_lxml_includes(self):
+        '''
+        The lxml backend records the included files, but not
+        the source file itself.
+        '''
+        parser = Parser(get_backend('lxml'))
+        parser.load_file(self.noisy)
+        self.assertEqual(parser.last_includes,
+                         [os.path.join(os.path.dirname(
+                             os.path.realpath(self.noisy)), 'crew.xml')])
+
+    @unittest.skipUnless(lxml_etree, 'lxml is not installed')
+    def test_lxml_matches_stdlib(self):
+        '''
+        The lxml backend produces the same object graph.
+        '''
+        self.assertEqual(self.load('lxml'), self.load('stdlib'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for table driven element dispatch.'''
+
+# pylint: disable=R0801
+# pylint: disable=too-few-public-methods
+
+import unittest
+import xml.etree.ElementTree as ET
+from media.xml.dispatch import ElementDispatch
+
+CASE1 = '''<?xml version='1.0'?>
+<sample xmlns='http://vectortron.com/xml/media/movie'>
+ <name>First</name>
+ <item>one</item>
+ <item>two</item>
+ <ignored>three</ignored>
+</sample>
+'''
+
+CASE2 = '''<?xml version='1.0'?>
+<sample xmlns='http://example.com/other'>
+ <name>Second</name>
+ <item>four</item>
+</sample>
+'''
+
+
+class Sample(ElementDispatch):
+    '''
+    Simple dispatch class.
+    '''
+    xml_handlers = {'item': '_load_item'}
+    xml_text = {'name': 'name'}
+
+    def __init__(self, in_element):
+        self.name = ''
+        self.items = []
+        self._dispatch(in_element)
+
+    def _load_item(self, in_element):
+        self.items.append(in_element.text)
+
+
+class UpperSample(Sample):
+    '''
+    Subclass that overrides one handler.
+    '''
+    def _load_item(self, in_element):
+        self.items.append(in_element.text.upper())
+
+
+class TestElementDispatch(unittest.TestCase):
+    '''
+    Handlers selected by tag name.
+    '''
+    def test_handlers(self):
+        '''
+        Handlers and text attributes are both applied.
+        '''
+        sample = Sample(ET.fromstring(CASE1))
+        self.assertEqual(sample.name, 'First')
+        self.assertEqual(sample.items, ['one', 'two'])
+
+    def test_subclass(self):
+        '''
+        Subclasses inherit the table, and can override handlers.
+        '''
+        sample = UpperSample(ET.fromstring(CASE1))
+        self.assertEqual(sample.name, 'First')
+        self.assertEqual(sample.items, ['ONE', 'TWO'])
+
+    def test_other_namespace(self):
+        '''
+        Unknown namespaces fall back to the local name.
+        '''
+        sample = Sample(ET.fromstring(CASE2))
+        self.assertEqual(sample.name, 'Second')
+        self.assertEqual(sample.items, ['four'])
+
+    def test_counters(self):
+        '''
+        Handled elements are counted when profiling.
+        '''
+        ElementDispatch.enable_counters()
+        try:
+            Sample(ET.fromstring(CASE1))
+        finally:
+            counts = dict(ElementDispatch.disable_counters())
+        self.assertEqual(counts[('Sample', 'item')], 2)
+        self.assertEqual(counts[('Sample', 'name')], 1)
+        self.assertNotIn(('Sample', 'ignored'), counts)
+        self.assertIsNone(ElementDispatch.counters)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the XML value conversion functions.'''
+
+import unittest
+from datetime import timedelta
+from media.xml.functions import xs_duration
+from media.data.media.contents.genericv.technical import process_iso_duration
+
+
+class TestDuration(unittest.TestCase):
+    '''
+    ISO 8601 duration values.
+    '''
+    def test_time(self):
+        '''
+        Hours, minutes and seconds.
+        '''
+        self.assertEqual(xs_duration('PT1H20M37S'),
+                         timedelta(hours=1, minutes=20, seconds=37))
+        self.assertEqual(xs_duration('PT3M'), timedelta(minutes=3))
+        self.assertEqual(xs_duration('PT100H'), timedelta(hours=100))
+
+    def test_fractions(self):
+        '''
+        Fractions with a period or a comma.
+        '''
+        self.assertEqual(xs_duration('PT2M05.5S'),
+                         timedelta(minutes=2, seconds=5.5))
+        self.assertEqual(xs_duration('PT1,5M'), timedelta(seconds=90))
+        self.assertEqual(xs_duration('PT1.25H'), timedelta(minutes=75))
+
+    def test_days(self):
+        '''
+        Days and weeks.
+        '''
+        self.assertEqual(xs_duration('P1DT2H'), timedelta(days=1, hours=2))
+        self.assertEqual(xs_duration('P2W'), timedelta(days=14))
+        self.assertEqual(xs_duration('P0Y0M3D'), timedelta(days=3))
+
+    def test_sign(self):
+        '''
+        Negative durations.
+        '''
+        self.assertEqual(xs_duration('-PT3M'), -timedelta(minutes=3))
+
+    def test_invalid(self):
+        '''
+        Years, months and junk can't be converted.
+        '''
+        for value in ['P1Y', 'P2M', 'PT3M junk', '3M', '', None]:
+            self.assertIsNone(xs_duration(value), value)
+
+    def test_empty(self):
+        '''
+        At least one component is needed, and at least one
+        time component after the T.
+        '''
+        for value in ['P', 'PT', 'P1DT', '-P', 'P1D T2H']:
+            self.assertIsNone(xs_duration(value), value)
+
+    def test_overflow(self):
+        '''
+        Durations too large for a timedelta can't be converted.
+        '''
+        for value in ['P99999999999D', 'PT' + '9' * 400 + 'H']:
+            self.assertIsNone(xs_duration(value), value)
+
+    def test_whitespace(self):
+        '''
+        Surrounding whitespace is ignored.
+        '''
+        self.assertEqual(xs_duration(' PT3M\n'), timedelta(minutes=3))
+
+    def test_process_iso_duration(self):
+        '''
+        The old technical function gives the same results.
+        '''
+        self.assertEqual(process_iso_duration('PT1H20M37S'),
+                         xs_duration('PT1H20M37S'))
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2026 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for XInclude processing.'''
+
+# pylint: disable=R0801
+# pylint: disable=consider-using-with
+
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from media.xml.backend import available_backends, get_backend
+from media.xml.include import IncludeCache, IncludeLoader, include
+from media.xml.parser import Parser
+
+MAIN = '''<?xml version='1.0'?>
+<outer xmlns:xi='http://www.w3.org/2001/XInclude'>
+ <xi:include href='parts/first.xml'/>
+</outer>
+'''
+
+FIRST = '''<?xml version='1.0'?>
+<first xmlns:xi='http://www.w3.org/2001/XInclude'>
+ <xi:include href='second.xml'/>
+</first>
+'''
+
+SECOND = '''<?xml version='1.0'?>
+<second>nested</second>
+'''
+
+
+class TestIncludeLoader(unittest.TestCase):
+    '''
+    Include resolution relative to the source file.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = self.tmpdir.name
+        os.makedirs(os.path.join(root, 'parts'))
+        self.main = os.path.join(root, 'main.xml')
+        for (f_name, f_data) in [('main.xml', MAIN),
+                                 ('parts/first.xml', FIRST),
+                                 ('parts/second.xml', SECOND)]:
+            with open(os.path.join(root, f_name), 'w',
+                      encoding='utf-8') as f_out:
+                f_out.write(f_data)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_resolve_relative(self):
+        '''
+        Relative hrefs resolve against the directory of the file.
+        '''
+        loader = IncludeLoader(self.main)
+        self.assertEqual(loader.resolve('parts/first.xml'),
+                         os.path.join(os.path.realpath(self.tmpdir.name),
+                                      'parts', 'first.xml'))
+
+    def test_nested_include(self):
+        '''
+        Nested includes are resolved relative to the included file.
+        '''
+        cwd = os.getcwd()
+        root = ET.parse(self.main).getroot()
+        include(root, self.main)
+        self.assertEqual(root[0].tag, 'first')
+        self.assertEqual(root[0][0].text, 'nested')
+        self.assertEqual(os.getcwd(), cwd)
+
+
+class TestIncludeCache(unittest.TestCase):
+    '''
+    Shared include files are only parsed once.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = self.tmpdir.name
+        os.makedirs(os.path.join(root, 'parts'))
+        self.main = os.path.join(root, 'main.xml')
+        self.second = os.path.join(root, 'parts', 'second.xml')
+        for (f_name, f_data) in [('main.xml', MAIN),
+                                 ('parts/first.xml', FIRST),
+                                 ('parts/second.xml', SECOND)]:
+            with open(os.path.join(root, f_name), 'w',
+                      encoding='utf-8') as f_out:
+                f_out.write(f_data)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_hits(self):
+        '''
+        The second include of the same files comes from the cache.
+        '''
+        cache = IncludeCache()
+        first = ET.parse(self.main).getroot()
+        include(first, self.main, cache)
+        second = ET.parse(self.main).getroot()
+        include(second, self.main, cache)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(second[0][0].text, 'nested')
+
+    def test_copies(self):
+        '''
+        Every includer gets its own copy of the elements.
+        '''
+        cache = IncludeCache()
+        first = ET.parse(self.main).getroot()
+        include(first, self.main, cache)
+        first[0][0].text = 'changed'
+        second = ET.parse(self.main).getroot()
+        include(second, self.main, cache)
+        self.assertEqual(second[0][0].text, 'nested')
+        self.assertIsNot(first[0], second[0])
+
+    def test_modified(self):
+        '''
+        A modified include file is parsed again.
+        '''
+        cache = IncludeCache()
+        include(ET.parse(self.main).getroot(), self.main, cache)
+        with open(self.second, 'w', encoding='utf-8') as f_out:
+            f_out.write("<second>updated</second>")
+        f_stat = os.stat(self.second)
+        os.utime(self.second, ns=(f_stat.st_atime_ns,
+                                  f_stat.st_mtime_ns + 10**9))
+        root = ET.parse(self.main).getroot()
+        include(root, self.main, cache)
+        self.assertEqual(root[0][0].text, 'updated')
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(len(cache.entries), 2)
+
+    def test_parser_stats(self):
+        '''
+        The parser reports cache usage, with every backend.
+        '''
+        for name in available_backends():
+            with self.subTest(backend=name):
+                parser = Parser(get_backend(name))
+                parser.load_file(self.main)
+                parser.load_file(self.main)
+                self.assertEqual(parser.include_cache.hits, 2)
+                self.assertIn('Include hits: 2 misses: 2', parser.stats())
+
+    def test_nested_cached(self):
+        '''
+        Cached files still resolve their own includes relative
+        to their location, with every backend.
+        '''
+        for name in available_backends():
+            with self.subTest(backend=name):
+                cache = IncludeCache()
+                backend = get_backend(name)
+                backend.parse(self.main, [], cache)
+                root = backend.parse(self.main, [], cache)
+                self.assertEqual(root[0][0].text, 'nested')
+
+
+if __name__ == '__main__':
+    unittest.main()
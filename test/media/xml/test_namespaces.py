@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the qualified tag tables.'''
+
+# pylint: disable=R0801
+
+import unittest
+from media.xml.namespaces import Namespaces, Tags
+
+
+class TestTagTable(unittest.TestCase):
+    '''
+    Qualified tag constants.
+    '''
+    def test_qualified(self):
+        '''
+        Constants match the namespace prefix format.
+        '''
+        self.assertEqual(Tags.media.title, Namespaces.nsf('media') + 'title')
+        self.assertEqual(Tags.movie.crew, Namespaces.nsf('movie') + 'crew')
+
+    def test_keyword(self):
+        '''
+        Keyword tag names get a trailing underscore.
+        '''
+        self.assertEqual(Tags.media.from_, Namespaces.nsf('media') + 'from')
+
+    def test_unlisted(self):
+        '''
+        Tags not in the initial list raise AttributeError
+        until they are added.
+        '''
+        with self.assertRaises(AttributeError):
+            _ = Tags.audio.songwriter
+        self.assertEqual(Tags.audio.add('songwriter'),
+                         Namespaces.nsf('audio') + 'songwriter')
+        self.assertEqual(Tags.audio.songwriter,
+                         Namespaces.nsf('audio') + 'songwriter')
+
+    def test_ns_strip(self):
+        '''
+        Local names come back the same, cached or not.
+        '''
+        self.assertEqual(Namespaces.ns_strip(Tags.media.localId), 'localId')
+        tag = Namespaces.nsf('movie') + 'unlistedTag'
+        self.assertEqual(Namespaces.ns_strip(tag), 'unlistedTag')
+        self.assertEqual(Namespaces.ns_strip(tag), 'unlistedTag')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+#
+# Copyright 2024 Chris Josephes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+'''Unit tests for the streaming parser.'''
+
+# pylint: disable=R0801
+# pylint: disable=consider-using-with
+
+import os
+import tempfile
+import unittest
+from media.xml.backend import available_backends, get_backend
+from media.xml.parser import Parser
+
+HEADER = '''<?xml version='1.0'?>
+<mediaList xmlns='http://vectortron.com/xml/media/media'
+ xmlns:xi='http://www.w3.org/2001/XInclude'>
+'''
+
+FOOTER = '''</mediaList>
+'''
+
+RECORD = ''' <media>
+  <title><main>Record {index}</main></title>
+  <medium><release><type><dvd/></type></release></medium>
+  <contents>
+   <movie xmlns='http://vectortron.com/xml/media/movie'>
+    <title>Record {index}</title>
+    <catalog><copyright><year>1980</year></copyright></catalog>
+    <xi:include href='crew.xml'/>
+   </movie>
+  </contents>
+ </media>
+'''
+
+CREW = '''<?xml version='1.0'?>
+<crew xmlns='http://vectortron.com/xml/media/movie'>
+ <directors><director><gn>Marty</gn><fn>Goofus</fn></director></directors>
+</crew>
+'''
+
+
+class TestParserIterFile(unittest.TestCase):
+    '''
+    Compare the streaming parser against the full parser.
+    '''
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = self.tmpdir.name
+        self.export = os.path.join(root, 'export-dvd.xml')
+        records = [RECORD.format(index=idx) for idx in range(50)]
+        extra = [RECORD.format(index=idx) for idx in range(50, 52)]
+        for (f_name, f_data) in [
+                ('export-dvd.xml', HEADER + ''.join(records) +
+                 " <xi:include href='extra.xml'/>\n" + FOOTER),
+                ('extra.xml', HEADER + ''.join(extra) + FOOTER),
+                ('crew.xml', CREW)]:
+            with open(os.path.join(root, f_name), 'w',
+                      encoding='utf-8') as f_out:
+                f_out.write(f_data)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_same_media(self):
+        '''
+        Every record should be found, in document order.
+        '''
+        parser = Parser()
+        streamed = list(parser.iter_file(self.export))
+        self.assertEqual([str(med.title) for med in streamed],
+                         [f"Record {idx}" for idx in range(52)])
+        self.assertEqual(parser.object_count, 52)
+        full = Parser().load_file(self.export)
+        self.assertEqual([str(med) for med in streamed],
+                         [str(med) for med in full])
+
+    def test_backends_agree(self):
+        '''
+        Every backend's full load should find the records from
+        the root level include.
+        '''
+        streamed = [str(med) for med in Parser().iter_file(self.export)]
+        for name in available_backends():
+            full = Parser(get_backend(name)).load_file(self.export)
+            self.assertEqual([str(med) for med in full], streamed)
+
+    def test_includes(self):
+        '''
+        Includes inside and between records are expanded.
+        '''
+        parser = Parser()
+        m_obj = next(parser.iter_file(self.export))
+        directors = m_obj.contents[0].crew.directors
+        self.assertEqual(str(directors[0]), 'Marty Goofus')
+        list(parser.iter_file(self.export))
+        self.assertEqual(sorted(os.path.basename(inc)
+                                for inc in parser.last_includes),
+                         ['crew.xml', 'extra.xml'])
+
+
+if __name__ == '__main__':
+    unittest.main()